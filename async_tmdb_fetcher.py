@@ -0,0 +1,280 @@
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Dict, Iterable, Tuple
+
+from config import TMDB_BASE_URL, MAX_RETRIES, REQUEST_TIMEOUT, TMDB_CACHE_NEGATIVE_TTL, TMDB_COMPRESSION
+from config import ASYNC_MAX_IN_FLIGHT, TMDB_RETRY_BACKOFF
+from tmdb_fetcher import TMDbFetcher
+from utils.http_session import RequestMetrics
+from utils.logger import log_error, log_info
+from utils.rate_limiter import tmdb_rate_limiter
+from utils.response_cache import ResponseCache
+
+
+def _load_aiohttp():
+    """Import aiohttp on first use; it is only needed for the asyncio client."""
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("The async TMDB client needs aiohttp: pip install aiohttp") from e
+    return aiohttp
+
+
+class AsyncTMDbFetcher:
+    """
+    asyncio TMDb client: many requests in flight from one thread over one aiohttp session.
+
+    Responses are cleaned exactly as TMDbFetcher cleans them, and the rate limiter and
+    response cache are shared with the threaded client when passed in. Use as an async
+    context manager:
+
+        async with AsyncTMDbFetcher() as fetcher:
+            async for movie_id, data in fetcher.fetch_many(ids):
+                ...
+    """
+
+    ENRICHMENT_PROFILES = TMDbFetcher.ENRICHMENT_PROFILES
+
+    def __init__(self, base_url=None, rate_limiter=None, cache=None, max_in_flight=None, compression=None):
+        """
+        Args:
+            base_url: TMDb API root (defaults to TMDB_BASE_URL)
+            rate_limiter: Token bucket to draw from (defaults to the shared adaptive TMDB limiter)
+            cache: ResponseCache to use, or None/False for no caching
+            max_in_flight: Requests (and connections) open at once (defaults to ASYNC_MAX_IN_FLIGHT)
+            compression: Ask for compressed responses (defaults to TMDB_COMPRESSION)
+        """
+        self.base_url = base_url or TMDB_BASE_URL
+        self.rate_limiter = rate_limiter or tmdb_rate_limiter
+        self.cache = cache or None
+        self.max_in_flight = max_in_flight or ASYNC_MAX_IN_FLIGHT
+        self.compression = TMDB_COMPRESSION if compression is None else compression
+        self.metrics = RequestMetrics()
+        self.session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the aiohttp session; the connector caps open connections at max_in_flight."""
+        aiohttp = _load_aiohttp()
+
+        headers = {
+            'User-Agent': 'Movie-Analytics-DataCleaner/1.0',
+            'Accept': 'application/json',
+            'Content-Type': 'application/json;charset=utf-8',
+        }
+        # aiohttp advertises (and decodes) the encodings it supports unless told otherwise
+        if not self.compression:
+            headers['Accept-Encoding'] = 'identity'
+        headers.update(TMDbFetcher._get_auth_headers())
+
+        # Time new connections so latency_stats() splits connect time from the wait for headers
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_start.append(self._on_connection_create_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+
+        self.session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=self.max_in_flight, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            trace_configs=[trace],
+        )
+
+    async def close(self):
+        """Close the session and its connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @staticmethod
+    async def _on_connection_create_start(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx['connect_started'] = time.perf_counter()
+
+    @staticmethod
+    async def _on_connection_create_end(session, context, params):
+        timing = context.trace_request_ctx
+        if timing is not None and 'connect_started' in timing:
+            timing['connect'] = timing.get('connect', 0.0) + time.perf_counter() - timing.pop('connect_started')
+
+    def _cache_get(self, key):
+        """Look up a cached response. Returns None on a miss or when caching is disabled."""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            log_error(f"Cache lookup failed for {key}: {e}")
+            return None
+
+    def _cache_set(self, key, value, ttl=None):
+        """Store a response in the cache, if caching is enabled."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value, ttl=ttl)
+        except Exception as e:
+            log_error(f"Cache write failed for {key}: {e}")
+
+    def cache_stats(self):
+        """Return cache hit/miss counters, or an empty dict when caching is disabled."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def latency_stats(self):
+        """Return request counts, connection reuse and connect/TTFB/body latencies (see RequestMetrics)."""
+        return self.metrics.summary()
+
+    def latency_histogram(self):
+        """Return request counts per total-latency bucket (see RequestMetrics.histogram)."""
+        return self.metrics.histogram()
+
+    def rate_limit_stats(self):
+        """Return the rate limiter's current rate, throttled time and dropped request counts."""
+        return self.rate_limiter.metrics()
+
+    async def _get(self, url, params) -> Tuple[int, bytes]:
+        """
+        GET url through the shared rate limiter; returns the status and body.
+
+        aiohttp has no transport retries, so this is the only retry loop: MAX_RETRIES attempts
+        in all, shared by 429s (which pause the limiter until their Retry-After), 5xx,
+        timeouts and connection errors (which back off TMDB_RETRY_BACKOFF * 2**attempt).
+        The last attempt's status is returned, or its exception raised.
+        """
+        aiohttp = _load_aiohttp()
+
+        for attempt in range(MAX_RETRIES):
+            last_attempt = attempt == MAX_RETRIES - 1
+            await self.rate_limiter.acquire_async()
+
+            timing = {}
+            start = time.perf_counter()
+            try:
+                async with self.session.get(url, params=params, trace_request_ctx=timing) as response:
+                    headers_received = time.perf_counter()
+                    body = await response.read()
+                    status = response.status
+                    self.rate_limiter.record_response(status, response.headers)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                if last_attempt:
+                    raise
+                log_error(f"Request to {url} failed (attempt {attempt + 1}): {e!r} - retrying")
+                await asyncio.sleep(TMDB_RETRY_BACKOFF * 2 ** attempt)
+                continue
+
+            connect = timing.get('connect', 0.0)
+            self.metrics.record(connect, headers_received - start - connect, time.perf_counter() - headers_received)
+
+            if status == 429:
+                log_error(f"TMDb API rate limit exceeded for {url} - waiting before retry (attempt {attempt + 1})")
+            elif status >= 500 and not last_attempt:
+                log_error(f"Request to {url} failed (attempt {attempt + 1}): HTTP {status} - retrying")
+                await asyncio.sleep(TMDB_RETRY_BACKOFF * 2 ** attempt)
+            else:
+                return status, body
+
+        if status == 429:
+            self.rate_limiter.record_drop()
+        return status, body
+
+    async def fetch_movie_details(self, movie_id, append_to_response=None) -> Dict:
+        """
+        Fetch and clean one movie's details, like TMDbFetcher.fetch_movie_details.
+
+        Returns {} for unknown ids (cached as misses), authentication failures and
+        requests that still fail after _get's MAX_RETRIES attempts (the most a movie
+        can cost, whatever the mix of failures).
+        """
+        aiohttp = _load_aiohttp()
+
+        cache_key = ResponseCache.make_key(f"movie/{movie_id}", language='en-US',
+                                           append_to_response=append_to_response)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return TMDbFetcher._clean_movie_data(cached)
+
+        url = f"{self.base_url}/movie/{movie_id}"
+        params = TMDbFetcher._get_auth_params()
+        if append_to_response:
+            params['append_to_response'] = append_to_response
+        params['language'] = 'en-US'
+
+        try:
+            status, body = await self._get(url, params)
+
+            if status == 401:
+                log_error("TMDb API authentication failed - check your API key or access token")
+                return {}
+            elif status == 404:
+                log_error(f"Movie ID {movie_id} not found in TMDb")
+                self._cache_set(cache_key, {}, ttl=TMDB_CACHE_NEGATIVE_TTL)
+                return {}
+            elif status == 429:
+                log_error(f"TMDb API rate limit still exceeded for movie ID {movie_id} - dropping it")
+                return {}
+            elif status >= 400:
+                log_error(f"Request failed for movie ID {movie_id} after {MAX_RETRIES} attempts: HTTP {status}")
+                return {}
+
+            data = json.loads(body)
+            self._cache_set(cache_key, data)
+            log_info(f"Successfully fetched data for movie ID: {movie_id}")
+            return TMDbFetcher._clean_movie_data(data)
+
+        except asyncio.TimeoutError:
+            log_error(f"Timeout occurred for movie ID {movie_id} after {MAX_RETRIES} attempts")
+
+        except aiohttp.ClientError as e:
+            log_error(f"Request failed for movie ID {movie_id} after {MAX_RETRIES} attempts: {e}")
+
+        except Exception as e:
+            log_error(f"Unexpected error for movie ID {movie_id}: {e}")
+
+        return {}
+
+    async def fetch_movie_profile(self, movie_id, profile='analytics') -> Dict:
+        """Fetch details plus the profile's extra sections in a single request (see TMDbFetcher)."""
+        if profile not in self.ENRICHMENT_PROFILES:
+            raise ValueError(f"Unknown enrichment profile '{profile}'. Expected one of {tuple(self.ENRICHMENT_PROFILES)}")
+        sections = self.ENRICHMENT_PROFILES[profile]
+        return await self.fetch_movie_details(movie_id, append_to_response=','.join(sections) or None)
+
+    async def fetch_many(self, movie_ids: Iterable[int], profile: str = 'basic') -> AsyncIterator[Tuple[int, Dict]]:
+        """
+        Fetch many movies, yielding (movie_id, cleaned data) as each one completes.
+
+        At most max_in_flight requests run at once and only that many tasks exist at a
+        time, so memory stays flat however many ids are passed.
+        """
+        if self.session is None:
+            raise RuntimeError("AsyncTMDbFetcher is not open; use 'async with AsyncTMDbFetcher() as fetcher'")
+
+        async def fetch(movie_id):
+            if profile != 'basic':
+                return movie_id, await self.fetch_movie_profile(movie_id, profile)
+            return movie_id, await self.fetch_movie_details(movie_id)
+
+        ids = iter(movie_ids)
+        pending = set()
+        try:
+            while True:
+                # Top the window up, then hand back whatever finished first
+                for movie_id in ids:
+                    pending.add(asyncio.ensure_future(fetch(movie_id)))
+                    if len(pending) >= self.max_in_flight:
+                        break
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+
+from benchmarks.stub_tmdb_server import build_stub_movie, build_stub_section
+
+
+class AsyncStubTMDbServer:
+    """
+    aiohttp version of StubTMDbServer: latency is an asyncio sleep, so thousands of requests
+    can wait at once. Runs its own event loop in a background thread, so both the threaded
+    and the asyncio clients can be pointed at it.
+    """
+
+    def __init__(self, latency: float = 0.05, host: str = '127.0.0.1', port: int = 0, rate_limit: int = 0):
+        """rate_limit: requests per second served before answering 429 with Retry-After (0 = unlimited)."""
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.rate_limit = rate_limit
+        self.request_count = 0
+        self.throttled_count = 0
+        self.max_concurrent = 0
+        self._concurrent = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._loop = None
+        self._runner = None
+        self._thread = None
+        self._started = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    async def _movie(self, request):
+        self.request_count += 1
+        self._concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self._concurrent)
+        try:
+            await asyncio.sleep(self.latency)
+
+            if self.rate_limit:
+                now = time.monotonic()
+                if now - self._window_start >= 1:
+                    self._window_start, self._window_count = now, 0
+                self._window_count += 1
+                if self._window_count > self.rate_limit:
+                    self.throttled_count += 1
+                    return web.json_response({'status_code': 25, 'status_message': 'Request count over the limit'},
+                                             status=429, headers={'Retry-After': '1'})
+
+            movie_id = int(request.match_info['movie_id'])
+            payload = build_stub_movie(movie_id)
+            for section in filter(None, request.query.get('append_to_response', '').split(',')):
+                payload[section] = build_stub_section(movie_id, section)
+            return web.json_response(payload)
+        finally:
+            self._concurrent -= 1
+
+    async def _credits(self, request):
+        self.request_count += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response(build_stub_section(int(request.match_info['movie_id']), 'credits'))
+
+    async def _serve(self):
+        app = web.Application()
+        app.router.add_get(r'/movie/{movie_id:\d+}', self._movie)
+        app.router.add_get(r'/movie/{movie_id:\d+}/credits', self._credits)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, backlog=4096)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._serve())
+        self._started.set()
+        self._loop.run_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
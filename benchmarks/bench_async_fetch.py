@@ -0,0 +1,71 @@
+"""
+Compare the threaded and asyncio TMDB fills against a local aiohttp stub server.
+
+Usage (from the repository root; needs aiohttp):
+    python -m benchmarks.bench_async_fetch --rows 5000 --latency 0.1 --threads 8 32 --in-flight 64 512
+"""
+import argparse
+import asyncio
+import time
+
+import pandas as pd
+
+from async_tmdb_fetcher import AsyncTMDbFetcher
+from benchmarks.aiohttp_stub_server import AsyncStubTMDbServer
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from tmdb_fetcher import TMDbFetcher
+from utils.rate_limiter import TokenBucket
+
+
+def make_processor(base_url: str, rows: int, rate: float, pool_maxsize: int) -> EnhancedMovieDataProcessor:
+    """A processor whose merged_df has rows movies that all need TMDB data."""
+    processor = EnhancedMovieDataProcessor()
+    processor.tmdb_fetcher = TMDbFetcher(base_url=base_url, rate_limiter=TokenBucket(rate), cache=False,
+                                         pool_maxsize=pool_maxsize)
+    processor.merged_df = pd.DataFrame({
+        'id': range(1, rows + 1),
+        'title': [None] * rows,
+        'genres': [None] * rows,
+        'spoken_languages': [None] * rows,
+    })
+    return processor
+
+
+def run_threaded(base_url: str, rows: int, rate: float, threads: int):
+    processor = make_processor(base_url, rows, rate, threads)
+    start = time.perf_counter()
+    processor.fill_missing_with_tmdb(batch_size=max(50, threads * 4), concurrent=True, max_in_flight=threads,
+                                     checkpoint=False)
+    return time.perf_counter() - start
+
+
+def run_async(base_url: str, rows: int, rate: float, in_flight: int):
+    processor = make_processor(base_url, rows, rate, 1)
+    fetcher = AsyncTMDbFetcher(base_url=base_url, rate_limiter=processor.tmdb_fetcher.rate_limiter,
+                               max_in_flight=in_flight)
+    start = time.perf_counter()
+    asyncio.run(processor.fill_missing_with_tmdb_async(batch_size=500, checkpoint=False, fetcher=fetcher))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.1, help='Stub server latency per request (seconds)')
+    parser.add_argument('--threads', type=int, nargs='+', default=[8, 32])
+    parser.add_argument('--in-flight', type=int, nargs='+', default=[64, 512])
+    parser.add_argument('--rate', type=float, default=100000, help='Token bucket rate (requests/second)')
+    args = parser.parse_args()
+
+    with AsyncStubTMDbServer(latency=args.latency) as server:
+        runs = [(f"threads x{n}", run_threaded, n) for n in args.threads]
+        runs += [(f"async x{n}", run_async, n) for n in args.in_flight]
+        for label, run, width in runs:
+            server.max_concurrent = 0
+            elapsed = run(server.base_url, args.rows, args.rate, width)
+            print(f"{label:>14}: {args.rows} rows in {elapsed:.2f}s ({args.rows / elapsed:.0f} movies/s), "
+                  f"{server.max_concurrent} concurrent at the server")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare the vectorized and parallel cleaning engines against the per-row Movie/Rating reference.
+
+Loads and merges the input files, cleans the merged data in every mode, reports the
+time each took and lists any rows where the outputs differ from the reference; the run
+exits nonzero when any engine's output differs. tests/test_cleaning_parity.py checks the
+same parity on small frames of edge cases.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_cleaning --main dataset/movies_main_enriched.csv \\
+        --extended dataset/movie_extended_enriched.csv --ratings dataset/ratings.json
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+
+
+def compare_cleaned(reference: pd.DataFrame, candidate: pd.DataFrame, max_examples: int = 5) -> int:
+    """Print per-column differences between two cleaned frames and return the number of differing cells."""
+    if list(reference.columns) != list(candidate.columns):
+        print(f"Column mismatch: {list(reference.columns)} vs {list(candidate.columns)}")
+        return -1
+    if len(reference) != len(candidate):
+        print(f"Row count mismatch: {len(reference)} vs {len(candidate)}")
+        return -1
+
+    total = 0
+    for col in reference.columns:
+        left = reference[col].reset_index(drop=True)
+        right = candidate[col].reset_index(drop=True)
+
+        if pd.api.types.is_float_dtype(left) and pd.api.types.is_float_dtype(right):
+            differs = ~np.isclose(left.to_numpy(), right.to_numpy(), equal_nan=True)
+        else:
+            differs = np.array([
+                not (a == b or (a is None and b is None) or (pd.api.types.is_scalar(a) and pd.api.types.is_scalar(b)
+                                                             and pd.isna(a) and pd.isna(b)))
+                for a, b in zip(left, right)
+            ], dtype=bool)
+
+        count = int(differs.sum())
+        total += count
+        if count:
+            print(f"  {col}: {count} differing rows")
+            for i in np.flatnonzero(differs)[:max_examples]:
+                print(f"    row {i}: reference={left[i]!r} vectorized={right[i]!r}")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--main', default='dataset/movies_main_enriched.csv')
+    parser.add_argument('--extended', default='dataset/movie_extended_enriched.csv')
+    parser.add_argument('--ratings', default='dataset/ratings.json')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for the parallel runs')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='Rows per chunk for the parallel runs')
+    args = parser.parse_args()
+
+    processor = EnhancedMovieDataProcessor()
+    processor.load_and_merge_data(args.main, args.extended, args.ratings)
+    print(f"Merged rows: {len(processor.merged_df)}")
+
+    results = {}
+    for mode, parallel in (('object', False), ('vectorized', False), ('object', True), ('vectorized', True)):
+        label = f"parallel {mode}" if parallel else mode
+        start = time.perf_counter()
+        processor.clean_data_with_proper_methods(mode=mode, parallel=parallel, workers=args.workers,
+                                                 chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        results[label] = processor.cleaned_df
+        print(f"{label:>19}: {len(processor.cleaned_df)} rows in {elapsed:.2f}s")
+
+    mismatched = []
+    for label in ('vectorized', 'parallel object', 'parallel vectorized'):
+        differences = compare_cleaned(results['object'], results[label])
+        print(f"{label}: " + ("outputs match" if differences == 0 else f"outputs differ ({differences} cells)"))
+        if differences != 0:
+            mismatched.append(label)
+
+    # A parity regression fails the run, so scripts and CI can gate on it
+    if mismatched:
+        sys.exit(f"Outputs differ from the object reference: {', '.join(mismatched)}")
+
+
+if __name__ == '__main__':
+    main()
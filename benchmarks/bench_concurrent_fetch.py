@@ -0,0 +1,70 @@
+"""
+Measure TMDB enrichment throughput against a local stub server.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_concurrent_fetch --rows 400 --latency 0.05 --max-in-flight 8
+
+With --server-limit the stub answers 429 beyond that many requests per second, and
+--adaptive swaps the fixed token bucket for the AIMD limiter that backs off on them.
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.stub_tmdb_server import StubTMDbServer
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from tmdb_fetcher import TMDbFetcher
+from utils.rate_limiter import AdaptiveRateLimiter, TokenBucket
+
+
+def run_fill(base_url: str, rows: int, concurrent: bool, max_in_flight: int, rate: float, adaptive: bool):
+    """Run fill_missing_with_tmdb over a synthetic frame; return the elapsed seconds and the fetcher."""
+    processor = EnhancedMovieDataProcessor()
+    limiter = AdaptiveRateLimiter(rate, max_rate=rate) if adaptive else TokenBucket(rate)
+    processor.tmdb_fetcher = TMDbFetcher(base_url=base_url, rate_limiter=limiter, cache=False,
+                                         pool_maxsize=max_in_flight)
+    processor.merged_df = pd.DataFrame({
+        'id': range(1, rows + 1),
+        'title': [None] * rows,
+        'release_date': [None] * rows,
+        'genres': [None] * rows,
+        'production_companies': [None] * rows,
+        'production_countries': [None] * rows,
+        'spoken_languages': [None] * rows,
+        'budget': [0] * rows,
+        'revenue': [0] * rows,
+    })
+
+    start = time.perf_counter()
+    processor.fill_missing_with_tmdb(batch_size=50, concurrent=concurrent, max_in_flight=max_in_flight,
+                                     checkpoint=False)
+    return time.perf_counter() - start, processor.tmdb_fetcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=400)
+    parser.add_argument('--latency', type=float, default=0.05, help='Stub server latency per request (seconds)')
+    parser.add_argument('--max-in-flight', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=1000, help='Token bucket rate (requests/second)')
+    parser.add_argument('--server-limit', type=int, default=0, help='Stub server quota (requests/second, 0 = none)')
+    parser.add_argument('--adaptive', action='store_true', help='Use the AIMD rate limiter')
+    args = parser.parse_args()
+
+    with StubTMDbServer(latency=args.latency, rate_limit=args.server_limit) as server:
+        for concurrent in (False, True):
+            elapsed, fetcher = run_fill(server.base_url, args.rows, concurrent, args.max_in_flight, args.rate,
+                                        args.adaptive)
+            latency, limits = fetcher.latency_stats(), fetcher.rate_limit_stats()
+            mode = f"concurrent x{args.max_in_flight}" if concurrent else "sequential"
+            print(f"{mode:>16}: {args.rows} rows in {elapsed:.2f}s ({args.rows / elapsed:.1f} movies/s)")
+            print(f"{'':>16}  {latency['new_connections']} connections opened for {latency['requests']} requests; "
+                  + ", ".join(f"{phase} {latency[phase]['mean_ms']:.1f} ms" for phase in ('connect', 'ttfb', 'body')))
+            print(f"{'':>16}  rate {limits['rate']:.1f}/s, {limits['throttle_events']} throttled responses, "
+                  f"{limits['throttled_time']:.2f}s waited, {limits['dropped']} dropped")
+        print(f"Stub server handled {server.request_count} requests ({server.throttled_count} throttled)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Measure how long the project's modules take to import, using python -X importtime.
+
+Each module is imported in a fresh interpreter (best of --repeat runs) and reported
+with its cumulative import time and its heaviest dependencies. The run also checks the
+import has no side effects: no log file created and no TMDB client built.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --modules models.movie tmdb_fetcher --top 10
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+DEFAULT_MODULES = ['models.movie', 'models.rating', 'utils.iso_mapper', 'processors.vectorized_cleaner',
+                   'processors.enhanced_data_processor', 'tmdb_fetcher', 'async_tmdb_fetcher']
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+# Run in the child after the import: report anything the import did beyond defining names
+SIDE_EFFECT_CHECK = (
+    "import json, os, sys, logging; "
+    "fetcher = sys.modules.get('tmdb_fetcher'); "
+    "print(json.dumps({'log_file': os.path.exists('cleaning.log'), "
+    "'root_handlers': len(logging.getLogger().handlers), "
+    "'tmdb_fetcher_built': bool(fetcher and (vars(fetcher).get('_shared_fetcher') "
+    "or vars(fetcher).get('tmdb_fetcher')))}))"
+)
+
+
+def import_once(module: str, repo_root: str) -> Dict:
+    """Import module in a fresh interpreter (in an empty directory); return its timings and side effects."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        code = f"import sys; sys.path.insert(0, {repo_root!r}); import {module}; {SIDE_EFFECT_CHECK}"
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=work_dir,
+                                capture_output=True, text=True, check=True)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            imports.append({'module': match.group(4), 'self_ms': int(match.group(1)) / 1000,
+                            'cumulative_ms': int(match.group(2)) / 1000, 'depth': len(match.group(3)) // 2})
+
+    # Keep the measured module's own subtree: the entries after the previous top-level import
+    end = max(i for i, entry in enumerate(imports) if entry['module'] == module)
+    start = max((i + 1 for i in range(end) if imports[i]['depth'] == 0), default=0)
+    imports = imports[start:end + 1]
+    return {'module': module, 'cumulative_ms': imports[-1]['cumulative_ms'], 'imports': imports,
+            'side_effects': json.loads(result.stdout.strip().splitlines()[-1])}
+
+
+def heaviest(imports: List[Dict], top: int) -> List[Dict]:
+    """The measured module's direct imports with the largest cumulative time."""
+    direct = [entry for entry in imports if entry['depth'] == 1]
+    return sorted(direct, key=lambda entry: entry['cumulative_ms'], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per module (best is reported)')
+    parser.add_argument('--top', type=int, default=5, help='Heaviest dependencies listed per module')
+    parser.add_argument('--output', help='Also write the results as JSON to this path')
+    args = parser.parse_args()
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for module in args.modules:
+        best = min((import_once(module, repo_root) for _ in range(args.repeat)), key=lambda run: run['cumulative_ms'])
+        results.append(best)
+
+        effects = best['side_effects']
+        flagged = [name for name in ('log_file', 'tmdb_fetcher_built') if effects[name]]
+        if effects['root_handlers']:
+            flagged.append(f"{effects['root_handlers']} root log handler(s)")
+        print(f"{module:>36}: {best['cumulative_ms']:8.1f} ms" +
+              (f"   side effects: {', '.join(flagged)}" if flagged else ''))
+        for entry in heaviest(best['imports'], args.top):
+            print(f"{'':>38}{entry['module']:<30} {entry['cumulative_ms']:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump([{key: run[key] for key in ('module', 'cumulative_ms', 'side_effects')} for run in results],
+                      file, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare the 'outer' and 'indexed' merge engines on synthetic catalogs of increasing size.
+
+Each size is read once (see benchmarks/synthetic_catalog.py, reused on later runs) and
+merged by both engines --repeat times; the best wall time and the tracemalloc peak of
+each engine are reported with the time and memory the indexed engine saves. Every run
+also checks the engines agree: same rows, columns, values and dtypes, and the same id
+rejection counts.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_merge --rows 10000 100000 1000000
+    python -m benchmarks.bench_merge --rows 100000 --typed-load --repeat 5
+"""
+import argparse
+import json
+import logging
+import os
+import time
+import tracemalloc
+from typing import Dict
+
+import pandas as pd
+
+from benchmarks.bench_pipeline import ensure_catalog, environment
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from processors.indexed_merge import MERGE_ENGINES
+
+
+def merge_once(processor: EnhancedMovieDataProcessor, sources, engine: str, trace: bool) -> Dict:
+    """Merge copies of the sources with one engine; return the result, wall time and (if traced) peak memory."""
+    main_df, extended_df, ratings_df = (df.copy() for df in sources)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    merged = processor._merge_sources(main_df, extended_df, ratings_df, engine=engine)
+    wall_s = time.perf_counter() - start
+    peak_mb = None
+    if trace:
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        tracemalloc.stop()
+    return {'merged': merged, 'wall_s': wall_s, 'peak_mb': peak_mb,
+            'id_rejections': json.loads(json.dumps(processor.id_rejections))}
+
+
+def run_size(paths: Dict[str, str], repeat: int, typed_load: bool) -> Dict:
+    """Time both engines over one catalog and check that their outputs match."""
+    processor = EnhancedMovieDataProcessor()
+    sources = processor._read_sources(paths['main'], paths['extended'], paths['ratings'], typed=typed_load)
+
+    engines = {}
+    for engine in MERGE_ENGINES:
+        # Timed runs without tracemalloc (it slows allocation-heavy code), then one traced run for the peak
+        runs = [merge_once(processor, sources, engine, trace=False) for _ in range(repeat)]
+        traced = merge_once(processor, sources, engine, trace=True)
+        engines[engine] = {'wall_s': min(run['wall_s'] for run in runs), 'peak_mb': traced['peak_mb'],
+                           'rows_out': len(traced['merged']), 'merged': traced['merged'],
+                           'id_rejections': traced['id_rejections']}
+
+    outer, indexed = engines['outer'], engines['indexed']
+    pd.testing.assert_frame_equal(outer['merged'].reset_index(drop=True), indexed['merged'])
+    if outer['id_rejections'] != indexed['id_rejections']:
+        raise AssertionError(f"id rejections differ: {outer['id_rejections']} vs {indexed['id_rejections']}")
+
+    return {
+        'rows_in': sum(len(df) for df in sources),
+        'rows_out': outer['rows_out'],
+        'engines': {engine: {key: stats[key] for key in ('wall_s', 'peak_mb')} for engine, stats in engines.items()},
+        'speedup': outer['wall_s'] / indexed['wall_s'] if indexed['wall_s'] else None,
+        'memory_saved_mb': outer['peak_mb'] - indexed['peak_mb'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Catalog sizes to run (distinct movies in the main file)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default='benchmarks/data', help='Where generated catalogs are kept')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed merges per engine (best is reported)')
+    parser.add_argument('--typed-load', action='store_true', help='Read the sources with the compact dtypes')
+    parser.add_argument('--output', help='Also write the results as JSON to this path')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = {'environment': environment(), 'typed_load': args.typed_load, 'runs': []}
+    for rows in args.rows:
+        paths = ensure_catalog(rows, args.data_dir, args.seed)
+        run = dict(run_size(paths, args.repeat, args.typed_load), rows=rows)
+        results['runs'].append(run)
+
+        print(f"\n{rows:,} movies ({run['rows_in']:,} input rows -> {run['rows_out']:,} merged), outputs match")
+        for engine, stats in run['engines'].items():
+            print(f"  {engine:>8}: {stats['wall_s']:8.3f}s   peak {stats['peak_mb']:8.1f} MB")
+        print(f"  {'saved':>8}: {run['speedup']:.2f}x faster, {run['memory_saved_mb']:.1f} MB less peak memory")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
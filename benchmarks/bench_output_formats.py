@@ -0,0 +1,67 @@
+"""
+Compare CSV, Parquet and Feather output of the final dataset.
+
+Runs the pipeline once (without TMDB), saves the cleaned data in every format and
+reports file size, write time and the time to load it back with read_final_dataset,
+checking that every format loads the same values.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_output_formats --extended dataset/movie_extended_enriched.csv
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from utils.columnar_output import read_final_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--main', default='dataset/movies_main_enriched.csv')
+    parser.add_argument('--extended', default='dataset/movie_extended_enriched.csv')
+    parser.add_argument('--ratings', default='dataset/ratings.json')
+    parser.add_argument('--compression', default='zstd', help='Codec for Parquet and Feather')
+    parser.add_argument('--loads', type=int, default=5, help='Timed loads per format (best is reported)')
+    args = parser.parse_args()
+
+    processor = EnhancedMovieDataProcessor()
+    processor.load_and_merge_data(args.main, args.extended, args.ratings)
+    processor.clean_data_with_proper_methods()
+
+    loaded = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for output_format in ('csv', 'parquet', 'feather'):
+            start = time.perf_counter()
+            path = processor.save_final_dataset(os.path.join(directory, 'final.csv'), output_format=output_format,
+                                                compression=args.compression)
+            write_seconds = time.perf_counter() - start
+
+            timings = []
+            for arrow_backed in ((False, True) if output_format != 'csv' else (False,)):
+                best = float('inf')
+                for _ in range(args.loads):
+                    start = time.perf_counter()
+                    frame = read_final_dataset(path, arrow_backed=arrow_backed)
+                    best = min(best, time.perf_counter() - start)
+                if not arrow_backed:
+                    loaded[output_format] = frame
+                timings.append(f"load {best:.3f}s" + (" (arrow-backed)" if arrow_backed else ""))
+
+            print(f"{output_format:>8}: {os.path.getsize(path) / 1e6:6.2f} MB, "
+                  f"write {write_seconds:.2f}s, " + ', '.join(timings))
+
+    reference = loaded['csv']
+    for output_format in ('parquet', 'feather'):
+        candidate = loaded[output_format]
+        same = all(
+            # CSV turns empty strings and None into NaN, so compare with missing values blanked
+            reference[col].fillna('').astype(str).equals(candidate[col].fillna('').astype(str))
+            for col in reference.columns
+        )
+        print(f"{output_format}: " + ("values match CSV" if same else "differs from CSV"))
+
+
+if __name__ == '__main__':
+    main()
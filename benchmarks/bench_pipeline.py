@@ -0,0 +1,225 @@
+"""
+Time every stage of the complete pipeline on synthetic catalogs of increasing size.
+
+Each size is generated once (see benchmarks/synthetic_catalog.py, reused on later runs)
+and run in a fresh process, so peak RSS is per size. TMDB is replaced by an in-process
+stub fetcher with an optional per-request latency, so runs are offline and repeatable.
+Stage timings, rows, RSS and the TMDB counters come from the pipeline's run report;
+the results of all sizes are saved as one JSON file, and --compare prints the
+per-stage change against an earlier results file.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pipeline --rows 10000 100000 1000000
+    python -m benchmarks.bench_pipeline --rows 100000 --compare benchmarks/results/<earlier>.json
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.stub_tmdb_server import build_stub_movie, build_stub_section
+from benchmarks.synthetic_catalog import generate_catalog
+from tmdb_fetcher import TMDbFetcher
+from utils.checkpoint_store import FetchCheckpoint
+from utils.rate_limiter import TokenBucket
+
+
+class StubTMDbFetcher(TMDbFetcher):
+    """TMDbFetcher answering from build_stub_movie in-process, after an optional fixed latency."""
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(base_url='http://tmdb.invalid', rate_limiter=TokenBucket(1e9), cache=False)
+        self.latency = latency
+
+    def fetch_movie_details(self, movie_id, append_to_response=None):
+        # Draw from the (unbounded) limiter like a real request, so the run report counts requests
+        self.rate_limiter.acquire()
+        if self.latency:
+            time.sleep(self.latency)
+        movie = build_stub_movie(int(movie_id))
+        for section in filter(None, (append_to_response or '').split(',')):
+            movie[section] = build_stub_section(int(movie_id), section)
+        return self._clean_movie_data(movie)
+
+
+def ensure_catalog(rows: int, data_dir: str, seed: int) -> Dict[str, str]:
+    """Paths of the catalog for this size and seed, generating it on first use."""
+    out_dir = os.path.join(data_dir, f"{rows}_{seed}")
+    paths = {
+        'main': os.path.join(out_dir, 'movies_main.csv'),
+        'extended': os.path.join(out_dir, 'movies_extended.csv'),
+        'ratings': os.path.join(out_dir, 'ratings.json'),
+    }
+    if all(os.path.exists(path) for path in paths.values()):
+        return paths
+
+    start = time.perf_counter()
+    paths = generate_catalog(rows, out_dir, seed=seed)
+    print(f"Generated {rows}-row catalog in {time.perf_counter() - start:.1f}s ({out_dir})")
+    return paths
+
+
+def run_size(paths: Dict[str, str], options: Dict) -> Dict:
+    """Run the pipeline once over a catalog (in a worker process) and return its run report."""
+    # Imported here so the worker's peak RSS starts from a fresh interpreter
+    from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+
+    logging.getLogger().setLevel(logging.WARNING)
+    work_dir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    report_path = os.path.join(work_dir, 'run_report.json')
+
+    processor = EnhancedMovieDataProcessor()
+    processor.tmdb_fetcher = StubTMDbFetcher(options['tmdb_latency'])
+    processor.tmdb_checkpoint = FetchCheckpoint(os.path.join(work_dir, 'checkpoint.sqlite'))
+    try:
+        processor.run_complete_pipeline(
+            paths['main'], paths['extended'], paths['ratings'],
+            output_path=os.path.join(work_dir, 'final_movies.csv'),
+            use_tmdb_api=options['tmdb'], concurrent_fetch=options['concurrent_fetch'],
+            language_policy=options['language_policy'], cleaning_mode=options['cleaning_mode'],
+            parallel_cleaning=options['parallel_cleaning'], typed_load=options['typed_load'],
+            output_format=options['output_format'], report_path=report_path,
+        )
+        with open(report_path, encoding='utf-8') as file:
+            report = json.load(file)
+        report['output_bytes'] = sum(os.path.getsize(os.path.join(work_dir, name)) for name in os.listdir(work_dir)
+                                     if name.startswith('final_movies'))
+        return report
+    finally:
+        processor.tmdb_checkpoint.close()
+        for name in os.listdir(work_dir):
+            os.remove(os.path.join(work_dir, name))
+        os.rmdir(work_dir)
+
+
+def summarize(rows: int, report: Dict) -> Dict:
+    """The per-size entry of the results file: totals plus wall time, rows and RSS per top-level stage."""
+    stages = {}
+    for record in report['stages']:
+        if record['depth'] != 0 and record['stage'] not in ('read_sources', 'merge'):
+            continue
+        entry = stages.setdefault(record['stage'], {'wall_s': 0.0, 'cpu_s': 0.0, 'rows_in': None,
+                                                    'rows_out': None, 'rss_delta_mb': 0.0})
+        entry['wall_s'] += record['wall_s']
+        entry['cpu_s'] += record['cpu_s']
+        entry['rows_in'] = record['rows_in'] if record['rows_in'] is not None else entry['rows_in']
+        entry['rows_out'] = record['rows_out'] if record['rows_out'] is not None else entry['rows_out']
+        if record['rss_start_mb'] is not None and record['rss_end_mb'] is not None:
+            entry['rss_delta_mb'] += record['rss_end_mb'] - record['rss_start_mb']
+
+    threaded = report.get('tmdb', {}).get('threaded', {})
+    return {
+        'rows': rows,
+        'wall_s': report['wall_s'],
+        'cpu_s': report['cpu_s'],
+        'rows_per_s': rows / report['wall_s'] if report['wall_s'] else None,
+        'peak_rss_mb': report['peak_rss_mb'],
+        'output_bytes': report['output_bytes'],
+        'tmdb_requests': threaded.get('rate_limit', {}).get('acquired', 0),
+        'stages': stages,
+    }
+
+
+def environment() -> Dict:
+    """Versions and machine details stored with the results, to tell comparable runs apart."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'commit': commit,
+    }
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    """Print stage timings per size, with the change against a baseline results file if given."""
+    baseline_runs = {run['rows']: run for run in (baseline or {}).get('runs', [])}
+    for run in results['runs']:
+        print(f"\n{run['rows']:,} rows: {run['wall_s']:.2f}s wall, {run['rows_per_s']:,.0f} rows/s, "
+              f"peak RSS {run['peak_rss_mb']:.0f} MB, {run['tmdb_requests']} TMDB requests")
+        previous = baseline_runs.get(run['rows'])
+        for name, stage in run['stages'].items():
+            line = (f"  {name:>15}: {stage['wall_s']:8.3f}s wall {stage['cpu_s']:8.3f}s CPU "
+                    f"{stage['rss_delta_mb']:+8.1f} MB RSS")
+            before = (previous or {}).get('stages', {}).get(name)
+            if before and before['wall_s']:
+                line += f"   {stage['wall_s'] / before['wall_s']:.2f}x vs baseline"
+            print(line)
+        if previous:
+            print(f"  {'total':>15}: {run['wall_s'] / previous['wall_s']:.2f}x vs baseline "
+                  f"(peak RSS {previous['peak_rss_mb']:.0f} -> {run['peak_rss_mb']:.0f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Catalog sizes to run (distinct movies in the main file)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', default='benchmarks/data', help='Where generated catalogs are kept')
+    parser.add_argument('--results-dir', default='benchmarks/results', help='Where results files are written')
+    parser.add_argument('--label', default='', help='Appended to the results file name')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--no-tmdb', action='store_true', help='Skip the (stubbed) TMDB fill')
+    parser.add_argument('--tmdb-latency', type=float, default=0.0, help='Seconds the stub fetcher waits per request')
+    parser.add_argument('--concurrent-fetch', action='store_true')
+    parser.add_argument('--language-policy', default='if_malformed')
+    parser.add_argument('--cleaning-mode', default='vectorized')
+    parser.add_argument('--parallel-cleaning', action='store_true')
+    parser.add_argument('--typed-load', action='store_true')
+    parser.add_argument('--output-format', default='csv')
+    args = parser.parse_args()
+
+    options = {
+        'tmdb': not args.no_tmdb,
+        'tmdb_latency': args.tmdb_latency,
+        'concurrent_fetch': args.concurrent_fetch,
+        'language_policy': args.language_policy,
+        'cleaning_mode': args.cleaning_mode,
+        'parallel_cleaning': args.parallel_cleaning,
+        'typed_load': args.typed_load,
+        'output_format': args.output_format,
+    }
+    results = {'created_at': datetime.now().isoformat(timespec='seconds'), 'label': args.label,
+               'environment': environment(), 'options': dict(options, seed=args.seed), 'runs': []}
+
+    for rows in args.rows:
+        paths = ensure_catalog(rows, args.data_dir, args.seed)
+        print(f"Running {rows:,} rows...")
+        # A fresh process per size keeps peak RSS and warm caches from leaking between sizes
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+            report = pool.submit(run_size, paths, options).result()
+        results['runs'].append(summarize(rows, report))
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    name = datetime.now().strftime('%Y%m%d_%H%M%S') + (f"_{args.label}" if args.label else '') + '.json'
+    results_path = os.path.join(args.results_dir, name)
+    with open(results_path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+    print(f"\nResults saved to {results_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Microbenchmark for the JSON-like list field tokenizer.
+
+Times the single-pass tokenize_json_field against the previous approach of one
+re.findall call per key, checks that both extract the same values, and reports
+throughput in fields per second and seconds per million fields.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_tokenizer --fields 200000
+"""
+import argparse
+import random
+import re
+import time
+
+from utils.json_tokenizer import TOKEN_KEYS, tokenize_json_field
+
+SAMPLE_COUNTRIES = [('US', 'United States of America'), ('GB', 'United Kingdom'), ('FR', 'France'),
+                    ('DE', 'Germany'), ('JP', 'Japan'), ('IN', 'India'), ('KR', 'South Korea')]
+SAMPLE_LANGUAGES = [('en', 'English', 'English'), ('fr', 'French', 'Français'), ('de', 'German', 'Deutsch'),
+                    ('ja', 'Japanese', '日本語'), ('es', 'Spanish', 'Español'), ('hi', 'Hindi', 'हिन्दी')]
+SAMPLE_GENRES = ['Action', 'Drama', 'Comedy', 'Thriller', 'Science Fiction', 'Animation', 'Horror']
+
+
+def build_fields(count: int, seed: int = 42) -> list:
+    """Build a mix of genre, country and language fields in the shapes found in the dataset."""
+    rng = random.Random(seed)
+    fields = []
+    for i in range(count):
+        kind = i % 3
+        size = rng.randint(1, 4)
+        if kind == 0:
+            items = [f"{{'id': {rng.randint(1, 99)}, 'name': '{name}'}}" for name in rng.sample(SAMPLE_GENRES, size)]
+        elif kind == 1:
+            items = [f"{{'iso_3166_1': '{code}', 'name': '{name}'}}"
+                     for code, name in rng.sample(SAMPLE_COUNTRIES, size)]
+        else:
+            items = [f'{{"english_name": "{english}", "iso_639_1": "{code}", "name": "{name}"}}'
+                     for code, english, name in rng.sample(SAMPLE_LANGUAGES, size)]
+        fields.append('[' + ', '.join(items) + ']')
+    return fields
+
+
+def legacy_tokenize(text: str) -> dict:
+    """The previous extraction: one re.findall per key with an uncompiled pattern."""
+    values = {}
+    for key in TOKEN_KEYS:
+        pattern = rf"'{key}':\s*'([^']+)'|\"{key}\":\s*\"([^\"]+)\""
+        values[key] = [match[0] if match[0] else match[1] for match in re.findall(pattern, text) if any(match)]
+    return values
+
+
+def time_run(func, fields: list, repeats: int) -> float:
+    """Best wall time over repeats for running func over every field."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for field in fields:
+            func(field)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fields', type=int, default=200000, help='Number of fields to tokenize')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per implementation (best is reported)')
+    args = parser.parse_args()
+
+    fields = build_fields(args.fields)
+
+    mismatches = 0
+    for field in fields:
+        tokens = tokenize_json_field(field)
+        if legacy_tokenize(field) != dict(zip(TOKEN_KEYS, tokens)):
+            mismatches += 1
+    print(f"Fields: {len(fields)}, mismatches between implementations: {mismatches}")
+
+    for label, func in (('per-key findall', legacy_tokenize), ('single-pass', tokenize_json_field)):
+        seconds = time_run(func, fields, args.repeats)
+        print(f"{label:>16}: {len(fields) / seconds:>10.0f} fields/s, "
+              f"{seconds * 1_000_000 / len(fields):.2f}s per million fields")
+
+
+if __name__ == '__main__':
+    main()
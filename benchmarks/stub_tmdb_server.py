@@ -0,0 +1,164 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def build_stub_movie(movie_id: int) -> dict:
+    """Build a deterministic TMDB-shaped movie payload for the given ID."""
+    return {
+        'id': movie_id,
+        'title': f'Stub Movie {movie_id}',
+        'original_title': f'Stub Movie {movie_id}',
+        'release_date': f'{1950 + movie_id % 70}-01-01',
+        'budget': movie_id * 1000,
+        'revenue': movie_id * 2500,
+        'runtime': 90 + movie_id % 60,
+        'vote_average': round((movie_id % 100) / 10, 1),
+        'vote_count': movie_id % 5000,
+        'popularity': movie_id % 1000 / 7,
+        'overview': 'A stubbed overview.',
+        'status': 'Released',
+        'adult': False,
+        'genres': [{'id': 18, 'name': 'Drama'}, {'id': 35, 'name': 'Comedy'}],
+        'production_companies': [{'id': 1, 'name': 'Stub Pictures', 'origin_country': 'US'}],
+        'production_countries': [{'iso_3166_1': 'US', 'name': 'United States of America'}],
+        'spoken_languages': [{'english_name': 'English', 'iso_639_1': 'en', 'name': 'English'}],
+    }
+
+
+def build_stub_section(movie_id: int, section: str) -> dict:
+    """Build a deterministic append_to_response section (credits, keywords, release_dates)."""
+    if section == 'credits':
+        return {
+            'cast': [{'name': f'Actor {movie_id}-{order}', 'order': order} for order in range(8)],
+            'crew': [{'name': f'Director {movie_id}', 'job': 'Director'},
+                     {'name': f'Writer {movie_id}', 'job': 'Screenplay'}],
+        }
+    if section == 'keywords':
+        return {'keywords': [{'id': 1, 'name': 'stub'}, {'id': 2, 'name': f'keyword {movie_id % 10}'}]}
+    if section == 'release_dates':
+        return {'results': [{'iso_3166_1': 'US', 'release_dates': [
+            {'certification': '', 'type': 1},
+            {'certification': ('G', 'PG', 'PG-13', 'R')[movie_id % 4], 'type': 3},
+        ]}]}
+    return {}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests, like the real API
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without this Nagle's algorithm delays the body
+    disable_nagle_algorithm = True
+    movie_pattern = re.compile(r'^/movie/(\d+)(/credits)?$')
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.latency)
+        with server.lock:
+            server.request_count += 1
+            throttled = False
+            if server.rate_limit:
+                # Fixed one-second windows, like a simple API gateway quota
+                now = time.monotonic()
+                if now - server.window_start >= 1:
+                    server.window_start, server.window_count = now, 0
+                server.window_count += 1
+                throttled = server.window_count > server.rate_limit
+                if throttled:
+                    server.throttled_count += 1
+
+        if throttled:
+            self._send_json(429, {'status_code': 25, 'status_message': 'Request count over the limit'},
+                            {'Retry-After': str(server.retry_after)})
+            return
+        if server.error_status:
+            self._send_json(server.error_status, {'status_code': 11, 'status_message': 'Internal error'})
+            return
+
+        path = urlparse(self.path).path
+        match = self.movie_pattern.match(path)
+        if match:
+            movie_id = int(match.group(1))
+            if match.group(2):
+                payload = {'id': movie_id, 'cast': [], 'crew': []}
+            else:
+                payload = build_stub_movie(movie_id)
+                appended = parse_qs(urlparse(self.path).query).get('append_to_response', [''])[0]
+                for section in filter(None, appended.split(',')):
+                    payload[section] = build_stub_section(movie_id, section)
+            self._send_json(200, payload)
+        elif path == '/search/movie':
+            self._send_json(200, {'page': 1, 'results': [], 'total_pages': 0, 'total_results': 0})
+        else:
+            self._send_json(404, {'status_code': 34, 'status_message': 'Not found'})
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output quiet
+        pass
+
+
+class StubTMDbServer:
+    """Local TMDB stand-in with a fixed per-request latency, for offline throughput runs."""
+
+    def __init__(self, latency: float = 0.05, host: str = '127.0.0.1', port: int = 0, rate_limit: int = 0,
+                 retry_after: int = 1, error_status: int = 0):
+        """
+        rate_limit: requests per second served before answering 429 with Retry-After (0 = unlimited)
+        retry_after: Retry-After seconds sent with each 429
+        error_status: answer every (unthrottled) request with this status instead, e.g. 503 (0 = off)
+        """
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.lock = threading.Lock()
+        self.httpd.request_count = 0
+        self.httpd.rate_limit = rate_limit
+        self.httpd.retry_after = retry_after
+        self.httpd.error_status = error_status
+        self.httpd.window_start = time.monotonic()
+        self.httpd.window_count = 0
+        self.httpd.throttled_count = 0
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def request_count(self) -> int:
+        return self.httpd.request_count
+
+    @property
+    def throttled_count(self) -> int:
+        return self.httpd.throttled_count
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
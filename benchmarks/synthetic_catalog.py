@@ -0,0 +1,231 @@
+"""
+Generate a synthetic movie catalog shaped like the dataset files, at any size.
+
+Writes a main CSV (id, title, release_date, budget, revenue), an extended CSV (genres,
+countries, languages, companies and a few overriding titles and budgets) and a ratings
+JSON, reproducing the messy shapes of the real inputs: date-like and duplicated ids,
+poster paths in the budget column, mixed date formats, Python-repr and JSON lists,
+comma-separated names, bare ISO country and language codes, and ids present in only
+some of the sources. Output is deterministic for a given size and seed.
+
+Usage (from the repository root):
+    python -m benchmarks.synthetic_catalog --rows 100000 --out benchmarks/data/100k
+"""
+import argparse
+import json
+import os
+import time
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+GENRES = ['Drama', 'Comedy', 'Thriller', 'Romance', 'Action', 'Horror', 'Crime', 'Documentary',
+          'Adventure', 'Science Fiction', 'Family', 'Mystery', 'Fantasy', 'Animation', 'Music']
+COUNTRIES = [('US', 'United States of America'), ('GB', 'United Kingdom'), ('FR', 'France'),
+             ('DE', 'Germany'), ('IT', 'Italy'), ('JP', 'Japan'), ('CA', 'Canada'), ('IN', 'India'),
+             ('ES', 'Spain'), ('KR', 'South Korea'), ('SE', 'Sweden'), ('BR', 'Brazil')]
+LANGUAGES = [('en', 'English', 'English'), ('fr', 'French', 'Français'), ('de', 'German', 'Deutsch'),
+             ('it', 'Italian', 'Italiano'), ('ja', 'Japanese', '日本語'), ('es', 'Spanish', 'Español'),
+             ('hi', 'Hindi', 'हिन्दी'), ('ko', 'Korean', '한국어/조선말'), ('sv', 'Swedish', 'svenska'),
+             ('xx', 'No Language', 'No Language')]
+COMPANIES = ['Paramount Pictures', 'Warner Bros.', 'Universal Pictures', 'Twentieth Century Fox Film Corporation',
+             'Columbia Pictures', 'Pixar Animation Studios', 'Canal+', 'Metro-Goldwyn-Mayer (MGM)',
+             'Studio Ghibli', 'Gaumont', 'BBC Films', "Miramax's Dimension"]
+
+# Variants drawn per row; the real files mix all of them
+VARIANTS_PER_FORMAT = 256
+
+
+def _pick(rng: np.random.Generator, names: list, size: int, max_items: int) -> list:
+    """size lists of 1..max_items distinct picks from names."""
+    return [list(rng.choice(len(names), size=rng.integers(1, max_items + 1), replace=False)) for _ in range(size)]
+
+
+def _genre_variants(rng: np.random.Generator) -> Dict[str, list]:
+    picks = _pick(rng, GENRES, VARIANTS_PER_FORMAT, 4)
+    return {
+        'repr': [str([{'id': int(i) + 1, 'name': GENRES[i]} for i in p]) for p in picks],
+        'json': [json.dumps([GENRES[i] for i in p]) for p in picks],
+        'comma': [', '.join(GENRES[i] for i in p) for p in picks],
+        'empty': ['[]'],
+    }
+
+
+def _country_variants(rng: np.random.Generator) -> Dict[str, list]:
+    picks = _pick(rng, COUNTRIES, VARIANTS_PER_FORMAT, 3)
+    return {
+        'repr': [str([{'iso_3166_1': COUNTRIES[i][0], 'name': COUNTRIES[i][1]} for i in p]) for p in picks],
+        'iso_only': [str([{'iso_3166_1': COUNTRIES[i][0]} for i in p]) for p in picks],
+        'names': [', '.join(COUNTRIES[i][1] for i in p) for p in picks],
+        'codes': [', '.join(COUNTRIES[i][0] for i in p) for p in picks],
+        'empty': ['[]'],
+    }
+
+
+def _language_variants(rng: np.random.Generator) -> Dict[str, list]:
+    picks = _pick(rng, LANGUAGES, VARIANTS_PER_FORMAT, 3)
+    return {
+        'repr': [str([{'english_name': LANGUAGES[i][1], 'iso_639_1': LANGUAGES[i][0], 'name': LANGUAGES[i][2]}
+                      for i in p]) for p in picks],
+        'native': [str([{'iso_639_1': LANGUAGES[i][0], 'name': LANGUAGES[i][2]} for i in p]) for p in picks],
+        'iso_only': [str([{'iso_639_1': LANGUAGES[i][0]} for i in p]) for p in picks],
+        'names': [', '.join(LANGUAGES[i][1] for i in p) for p in picks],
+        'codes': [', '.join(LANGUAGES[i][0] for i in p) for p in picks],
+    }
+
+
+def _company_variants(rng: np.random.Generator) -> Dict[str, list]:
+    picks = _pick(rng, COMPANIES, VARIANTS_PER_FORMAT, 3)
+    return {
+        'repr': [str([{'name': COMPANIES[i], 'id': int(i) + 1} for i in p]) for p in picks],
+        'empty': ['[]'],
+    }
+
+
+def _mixed_column(rng: np.random.Generator, size: int, variants: Dict[str, list],
+                  weights: Dict[str, float]) -> np.ndarray:
+    """Draw one value per row: a format by weight (None = missing), then a variant of that format."""
+    formats = list(weights)
+    chosen = rng.choice(len(formats), size=size, p=np.array([weights[f] for f in formats]) / sum(weights.values()))
+    column = np.full(size, None, dtype=object)
+    for index, name in enumerate(formats):
+        mask = chosen == index
+        if name is None or not mask.any():
+            continue
+        pool = np.array(variants[name], dtype=object)
+        column[mask] = pool[rng.integers(0, len(pool), size=int(mask.sum()))]
+    return column
+
+
+def _release_dates(rng: np.random.Generator, size: int) -> np.ndarray:
+    """Mostly M/D/YYYY, some ISO and DD-MM-YYYY (the pre-1900 rows), a few missing."""
+    days = rng.integers(0, 365 * 120, size=size)
+    dates = pd.Timestamp('1900-01-01') + pd.to_timedelta(days, unit='D')
+    style = rng.choice(4, size=size, p=[0.9955, 0.0025, 0.0015, 0.0005])
+
+    us = dates.month.astype(str) + '/' + dates.day.astype(str) + '/' + dates.year.astype(str)
+    column = np.array(us, dtype=object)
+    column[style == 1] = np.array(dates.strftime('%Y-%m-%d'), dtype=object)[style == 1]
+    early = pd.Timestamp('1874-01-01') + pd.to_timedelta(days % (365 * 26), unit='D')
+    column[style == 2] = np.array(early.strftime('%d-%m-%Y'), dtype=object)[style == 2]
+    column[style == 3] = None
+    return column
+
+
+def generate_catalog(rows: int, out_dir: str, seed: int = 42, extended_fraction: float = 0.9,
+                     ratings_fraction: float = 0.2) -> Dict[str, str]:
+    """
+    Write a synthetic catalog of about `rows` main rows into out_dir.
+
+    Args:
+        rows: Distinct movies in the main CSV (duplicates and bad ids are added on top)
+        out_dir: Directory for movies_main.csv, movies_extended.csv and ratings.json
+        seed: Random seed; the same seed and size give byte-identical files
+        extended_fraction: Share of movies with an extended row (the rest need TMDB data)
+        ratings_fraction: Share of movies with ratings
+
+    Returns:
+        Paths of the three files, keyed 'main', 'extended' and 'ratings'
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        'main': os.path.join(out_dir, 'movies_main.csv'),
+        'extended': os.path.join(out_dir, 'movies_extended.csv'),
+        'ratings': os.path.join(out_dir, 'ratings.json'),
+    }
+
+    # TMDB-like sparse ids in a shuffled order
+    ids = rng.choice(np.arange(2, rows * 8, dtype=np.int64), size=rows, replace=False)
+
+    budget = np.where(rng.random(rows) < 0.8, 0, rng.integers(1, 300, size=rows) * 100000)
+    revenue = np.where(rng.random(rows) < 0.83, 0.0, rng.integers(1, 10 ** 9, size=rows).astype(float))
+    titles = np.array([f"Movie {movie_id}" for movie_id in ids], dtype=object)
+    odd_titles = rng.random(rows)
+    titles[odd_titles < 0.01] = [f'  "Quoted" movie {i}, part {i % 7}  ' for i in range(int((odd_titles < 0.01).sum()))]
+    titles[odd_titles > 0.99993] = None
+
+    main = pd.DataFrame({
+        'id': ids.astype(str),
+        'title': titles,
+        'release_date': _release_dates(rng, rows),
+        'budget': budget.astype(str),
+        'revenue': revenue.astype(str),
+    })
+
+    # Duplicated ids (about 0.2%) and the shifted rows whose id is a date and budget a poster path
+    duplicates = main.sample(frac=0.002, random_state=seed)
+    bad_count = max(1, rows // 15000)
+    bad_rows = pd.DataFrame({
+        'id': [f"{rng.integers(1, 29):02d}/{rng.integers(1, 13):02d}/{rng.integers(1990, 2016)}"
+               for _ in range(bad_count)],
+        'title': None,
+        'release_date': None,
+        'budget': [f"/{''.join(rng.choice(list('abcdefghijkXYZ0123456789'), size=27))}.jpg" if i % 3 else '0'
+                   for i in range(bad_count)],
+        'revenue': None,
+    })
+    main = pd.concat([main, duplicates, bad_rows], ignore_index=True)
+    main = main.iloc[rng.permutation(len(main))]
+    main.to_csv(paths['main'], index=False)
+
+    # Extended rows for most movies, some ids the main file does not have, and the same shifted rows
+    extended_ids = ids[rng.random(rows) < extended_fraction]
+    orphans = np.arange(rows * 8, rows * 8 + max(1, rows // 200), dtype=np.int64)
+    extended_ids = np.concatenate([extended_ids.astype(str), orphans.astype(str), bad_rows['id'].to_numpy(str)])
+    size = len(extended_ids)
+    extended = pd.DataFrame({
+        'id': extended_ids,
+        'genres': _mixed_column(rng, size, _genre_variants(rng),
+                                {'repr': 0.6, 'json': 0.1, 'comma': 0.15, 'empty': 0.05, None: 0.1}),
+        'production_countries': _mixed_column(rng, size, _country_variants(rng),
+                                              {'repr': 0.55, 'iso_only': 0.1, 'names': 0.1, 'codes': 0.1,
+                                               'empty': 0.05, None: 0.1}),
+        'spoken_languages': _mixed_column(rng, size, _language_variants(rng),
+                                          {'repr': 0.5, 'native': 0.15, 'iso_only': 0.1, 'names': 0.1,
+                                           'codes': 0.05, None: 0.1}),
+        'production_companies': _mixed_column(rng, size, _company_variants(rng),
+                                              {'repr': 0.6, 'empty': 0.25, None: 0.15}),
+        'title': np.where(rng.random(size) < 0.05, 'Extended title', None),
+        'budget': np.where(rng.random(size) < 0.03, '1,000,000', None),
+    })
+    extended.iloc[rng.permutation(size)].to_csv(paths['extended'], index=False)
+
+    # Ratings summaries for some movies (and a few unknown ids)
+    rated = np.concatenate([ids[rng.random(rows) < ratings_fraction], orphans[:max(1, len(orphans) // 2)] + rows])
+    totals = rng.integers(1, 5000, size=len(rated))
+    averages = rng.uniform(0.5, 5.0, size=len(rated))
+    spreads = rng.uniform(0.0, 1.5, size=len(rated))
+    last_rated = rng.integers(789652009, 1501505581, size=len(rated))
+    ratings = [
+        {'movie_id': int(movie_id),
+         'ratings_summary': {'avg_rating': float(avg), 'total_ratings': int(total), 'std_dev': float(std)},
+         'last_rated': int(last)}
+        for movie_id, avg, total, std, last in zip(rated, averages, totals, spreads, last_rated)
+    ]
+    with open(paths['ratings'], 'w', encoding='utf-8') as file:
+        json.dump(ratings, file, indent=2)
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000, help='Distinct movies in the main file')
+    parser.add_argument('--out', required=True, help='Output directory')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--extended-fraction', type=float, default=0.9)
+    parser.add_argument('--ratings-fraction', type=float, default=0.2)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths = generate_catalog(args.rows, args.out, seed=args.seed, extended_fraction=args.extended_fraction,
+                             ratings_fraction=args.ratings_fraction)
+    print(f"Generated {args.rows} movies in {time.perf_counter() - start:.1f}s:")
+    for name, path in paths.items():
+        print(f"  {name:>8}: {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
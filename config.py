@@ -4,4 +4,74 @@ TMDB_ACCESS_TOKEN = "eyJhbGciOiJIUzI1NiJ9.eyJhdWQiOiI1NGU4ZGNjZGY3NmRhYmRhNmUyM2
 
 MAX_RETRIES = 3
 REQUEST_TIMEOUT = 30  # seconds
-USE_BEARER_TOKEN = True  
\ No newline at end of file
+USE_BEARER_TOKEN = True
+
+# Concurrency and rate limiting for TMDB enrichment
+MAX_IN_FLIGHT = 8  # Maximum concurrent TMDB requests in concurrent fetch mode
+TMDB_RATE_LIMIT = 40  # Requests per second allowed across all workers
+TMDB_RATE_BURST = 40  # Maximum burst size for the token bucket
+TMDB_RATE_MIN = 1  # Adaptive limiter never slows below this (requests per second)
+TMDB_RATE_MAX = 50  # ...nor speeds up beyond this
+TMDB_RATE_INCREASE = 2  # Requests/second added per second of successful responses
+TMDB_RATE_DECREASE = 0.5  # Rate multiplier applied on every 429
+TMDB_THROTTLE_PAUSE = 1.0  # Seconds all requests pause after a 429 without a Retry-After header
+TMDB_LANGUAGE_POLICY = 'always'  # When to refetch spoken_languages: 'always', 'if_malformed' or 'if_missing'
+
+# Persistent TMDB response cache
+USE_TMDB_CACHE = True
+TMDB_CACHE_PATH = 'cache/tmdb_responses.sqlite'
+TMDB_CACHE_TTL = 7 * 24 * 3600  # seconds a cached response stays fresh
+TMDB_CACHE_NEGATIVE_TTL = 24 * 3600  # seconds a cached "not found" stays fresh
+TMDB_CACHE_MAX_ENTRIES = 200000  # least recently used entries are evicted beyond this
+
+# Cleaning engine: 'vectorized' (column-wise) or 'object' (per-row Movie/Rating reference)
+CLEANING_MODE = 'vectorized'
+CLEANING_WORKERS = None  # Worker processes for parallel cleaning (None = CPU count)
+CLEANING_CHUNK_SIZE = 5000  # Rows per chunk for parallel cleaning
+
+# ISO country/language resolution
+ISO_LOOKUP_TABLE_PATH = 'cache/iso_lookup.json'  # Prebuilt code -> name tables (see ISOMapper.save_lookup_tables)
+ISO_FIELD_CACHE_SIZE = 65536  # Parsed country/language field strings kept in memory
+
+# Streaming loader (run_streaming_pipeline / iter_merged_batches)
+STREAMING_CHUNK_SIZE = 50000  # Rows read from each input at a time
+STREAMING_PARTITIONS = 16  # Movie-id partitions; each is merged and cleaned as one batch
+STREAMING_SPILL_DIR = None  # Directory for partition spill files (None = system temp dir)
+
+# Loading
+TYPED_LOAD = False  # Read columns as compact dtypes (utils/dtypes.py) at parse time; float32 ratings can shift the 2nd decimal of avg_rating
+CSV_ENGINE = 'c'  # pandas CSV parser: 'c', 'python' or 'pyarrow' (requires pyarrow)
+MERGE_ENGINE = 'indexed'  # 'indexed' (dedup, then align on a sorted id index) or 'outer' (pd.merge on raw ids); same output
+
+# Final dataset output
+OUTPUT_FORMAT = 'csv'  # 'csv', 'parquet' or 'feather' (Parquet/Feather keep list columns as lists; need pyarrow)
+OUTPUT_COMPRESSION = 'zstd'  # Parquet/Feather compression codec (None for uncompressed)
+PARQUET_ROW_GROUP_SIZE = 100000  # Rows per Parquet row group
+
+# Incremental runs (run_incremental_pipeline)
+INCREMENTAL_MANIFEST_PATH = 'cache/incremental_manifest.npz'  # Per-id input hashes of the previous run
+
+# TMDB fill checkpoints (resume interrupted runs)
+USE_TMDB_CHECKPOINT = True  # Record fetched results after every batch
+TMDB_CHECKPOINT_PATH = 'cache/tmdb_checkpoint.sqlite'
+
+# TMDB HTTP connection pooling (utils/http_session.py)
+TMDB_POOL_CONNECTIONS = 4  # Hosts whose connection pools are kept
+TMDB_POOL_MAXSIZE = MAX_IN_FLIGHT  # Keep-alive connections per host; at least the number of concurrent fetches
+TMDB_TRANSPORT_RETRIES = 2  # urllib3 retries for connection errors and 5xx (503 waits for Retry-After); 429s go to the rate limiter
+TMDB_RETRY_BACKOFF = 0.5  # Exponential backoff factor between transport retries (seconds)
+TMDB_COMPRESSION = True  # Negotiate gzip (and brotli, when installed) responses
+
+# TMDB enrichment profile (TMDbFetcher.ENRICHMENT_PROFILES): 'basic' details only, or 'analytics'
+# to also fill cast, directors, keywords and certification from the same request
+TMDB_ENRICHMENT_PROFILE = 'basic'
+TMDB_TOP_CAST = 5  # Top-billed cast members kept per movie
+TMDB_CERTIFICATION_COUNTRY = 'US'  # Country whose age certification is kept
+
+# asyncio TMDB client (async_tmdb_fetcher.py, needs aiohttp)
+ASYNC_MAX_IN_FLIGHT = 64  # Requests (and connections) open at once; the rate limiter still caps requests/second
+
+# Run reports and profiling (utils/run_profiler.py)
+RUN_REPORT_PATH = 'output/run_report.json'  # Per-stage timings, memory, rows and TMDB statistics; None to skip
+CODE_PROFILER = None  # 'cprofile' or 'pyinstrument' (pip install pyinstrument) to profile every stage
+CODE_PROFILE_DIR = 'output/profiles'  # Where per-stage profile dumps are written
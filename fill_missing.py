@@ -1,20 +1,27 @@
+import asyncio
 import logging
 import os
+from config import MAX_IN_FLIGHT, ASYNC_MAX_IN_FLIGHT, TMDB_ENRICHMENT_PROFILE, CODE_PROFILER, CODE_PROFILE_DIR
 from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from utils.run_profiler import RunProfiler
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data_enrichment.log'),
-        logging.StreamHandler()
-    ]
-)
+async def enrich_async(processor, batch_size, language_policy, resume):
+    """Async entry point: fill merged_df from TMDB with the asyncio client, applying results as they complete."""
+    return await processor.fill_missing_with_tmdb_async(batch_size=batch_size, max_in_flight=ASYNC_MAX_IN_FLIGHT,
+                                                        language_policy=language_policy, resume=resume)
 
 def main():
     """Main function for DATA ENRICHMENT ONLY - merging and TMDB API integration."""
     
+    # Set up logging (here rather than at import, so importing this module configures nothing)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('data_enrichment.log'),
+            logging.StreamHandler()
+        ]
+    )
     logger = logging.getLogger(__name__)
     
     try:
@@ -27,6 +34,7 @@ def main():
         extended_csv_path = 'dataset/movie_extended_enriched.csv'
         ratings_json_path = 'dataset/ratings.json'
         output_path = 'output/enriched_movies_raw.csv'  # Raw enriched data (not cleaned yet)
+        report_path = 'output/enrichment_run_report.json'  # Per-stage timings, memory and TMDB statistics
         
         # Create output directory if it doesn't exist
         os.makedirs('output', exist_ok=True)
@@ -40,17 +48,45 @@ def main():
         # Configuration for enrichment
         USE_TMDB_API = True  # Set to False if you want to skip TMDB API calls
         BATCH_SIZE = 50      # Number of movies to process before logging progress
+        CONCURRENT_FETCH = True  # Fetch each batch with a bounded thread pool
+        ASYNC_FETCH = False  # Use the asyncio client instead (needs aiohttp); results are applied as they arrive
+        LANGUAGE_POLICY = 'if_malformed'  # Skip rows whose spoken_languages are already readable names
+        INCREMENTAL = False  # Only re-enrich movies whose input rows changed since the last run
+        MANIFEST_PATH = 'cache/enrichment_manifest.npz'  # Input hashes of the last incremental run
+        RESUME = False  # Reuse TMDB results checkpointed by an interrupted run
         
         print(f"🔧 Enrichment configuration:")
         print(f"  - TMDB API enabled: {USE_TMDB_API}")
         print(f"  - Batch size: {BATCH_SIZE}")
+        if ASYNC_FETCH:
+            print(f"  - Async fetch: {ASYNC_FETCH} (max in flight: {ASYNC_MAX_IN_FLIGHT})")
+        else:
+            print(f"  - Concurrent fetch: {CONCURRENT_FETCH} (max in flight: {MAX_IN_FLIGHT})")
+        print(f"  - Language refetch policy: {LANGUAGE_POLICY}")
+        print(f"  - Enrichment profile: {TMDB_ENRICHMENT_PROFILE}")
+        print(f"  - Incremental: {INCREMENTAL}")
+        print(f"  - Resume from checkpoint: {RESUME}")
         print()
         
         # Initialize processor for enrichment only
         processor = EnhancedMovieDataProcessor()
+        processor.profiler = RunProfiler(CODE_PROFILER, CODE_PROFILE_DIR)
         
         print("🚀 Starting enrichment process...")
         
+        if INCREMENTAL:
+            # Merge, enrich and patch only new, changed and deleted movies into the previous output
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            processor.run_incremental_pipeline(main_csv_path, extended_csv_path, ratings_json_path,
+                                               output_path=output_path, manifest_path=MANIFEST_PATH,
+                                               clean=False, use_tmdb_api=USE_TMDB_API, batch_size=BATCH_SIZE,
+                                               concurrent_fetch=CONCURRENT_FETCH, max_in_flight=MAX_IN_FLIGHT,
+                                               language_policy=LANGUAGE_POLICY, resume=RESUME,
+                                               report_path=report_path)
+            print(f"✅ Incremental enrichment completed: {processor.incremental_delta}")
+            print(f"📊 Enriched dataset saved to: {output_path}")
+            return
+        
         # Step 1: Load and merge all data sources
         logger.info("Step 1: Loading and merging data sources...")
         merged_df = processor.load_and_merge_data(main_csv_path, extended_csv_path, ratings_json_path)
@@ -60,7 +96,12 @@ def main():
         if USE_TMDB_API:
             logger.info("Step 2: Enriching with TMDB API data...")
             print("🌐 Fetching missing data from TMDB API...")
-            enriched_df = processor.fill_missing_with_tmdb(batch_size=BATCH_SIZE)
+            if ASYNC_FETCH:
+                enriched_df = asyncio.run(enrich_async(processor, BATCH_SIZE, LANGUAGE_POLICY, RESUME))
+            else:
+                enriched_df = processor.fill_missing_with_tmdb(batch_size=BATCH_SIZE, concurrent=CONCURRENT_FETCH,
+                                                               max_in_flight=MAX_IN_FLIGHT,
+                                                               language_policy=LANGUAGE_POLICY, resume=RESUME)
             print("✅ TMDB enrichment completed")
         else:
             logger.info("Step 2: Skipping TMDB API integration (disabled)")
@@ -75,11 +116,15 @@ def main():
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Save the raw enriched data
-        enriched_df.to_csv(output_path, index=False)
+        with processor.profiler.stage('save', len(enriched_df)) as stage:
+            enriched_df.to_csv(output_path, index=False)
+            stage['rows_out'] = len(enriched_df)
+        processor.write_run_report(report_path, 'enrichment', use_tmdb_api=USE_TMDB_API, output_path=output_path)
         
         print("✅ Data enrichment completed successfully!")
         print(f"📊 Enriched dataset saved to: {output_path}")
         print(f"📋 Dataset shape: {enriched_df.shape}")
+        print(f"⏱️ Run report: {report_path}")
         
         # Show enrichment summary
         print("\n📈 Enrichment Summary:")
@@ -1,34 +1,46 @@
-import pandas as pd
+import numbers
 import re
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 import logging
 
+from utils.json_tokenizer import tokenize_json_field
+from utils.na import is_na
+
 logger = logging.getLogger(__name__)
 
 class Movie:
     """Movie class to represent individual movie data with cleaning and validation methods."""
     
+    # Cleaned fields, in output order; slots keep each instance free of a per-row __dict__
+    FIELDS = ('id', 'title', 'release_date', 'genres', 'production_companies',
+              'production_countries', 'spoken_languages', 'budget', 'revenue')
+    __slots__ = FIELDS
+    
     def __init__(self, movie_id: int, title: str, release_date: str, 
                  genres: str = "", production_companies: str = "", 
                  production_countries: str = "", spoken_languages: str = "",
                  budget: Union[int, str] = 0, revenue: Union[int, str] = 0):
-        # Check if movie_id is date-like or invalid
-        movie_id_str = str(movie_id).strip()
-        if ('/' in movie_id_str or '-' in movie_id_str or 
-            re.match(r'\d{1,2}/\d{1,2}/\d{4}', movie_id_str) or 
-            re.match(r'\d{4}-\d{1,2}-\d{1,2}', movie_id_str)):
-            raise ValueError(f"Invalid movie ID (date-like): {movie_id}")
-        
         # Check if budget contains .jpg or similar file extensions
         budget_str = str(budget).strip().lower()
         if any(ext in budget_str for ext in ['.jpg', '.png', '.gif', '.pdf']):
             raise ValueError(f"Invalid budget (contains file extension): {budget}")
         
-        try:
-            self.id = int(float(movie_id_str))
-        except (ValueError, TypeError):
-            raise ValueError(f"Cannot convert movie_id to integer: {movie_id}")
+        if isinstance(movie_id, numbers.Integral) and not isinstance(movie_id, bool):
+            # IDs sanitized at load time (utils.id_sanitizer) are already integers
+            self.id = int(movie_id)
+        else:
+            # Check if movie_id is date-like or invalid
+            movie_id_str = str(movie_id).strip()
+            if ('/' in movie_id_str or '-' in movie_id_str or 
+                re.match(r'\d{1,2}/\d{1,2}/\d{4}', movie_id_str) or 
+                re.match(r'\d{4}-\d{1,2}-\d{1,2}', movie_id_str)):
+                raise ValueError(f"Invalid movie ID (date-like): {movie_id}")
+            
+            try:
+                self.id = int(float(movie_id_str))
+            except (ValueError, TypeError):
+                raise ValueError(f"Cannot convert movie_id to integer: {movie_id}")
         
         if self.id <= 0:
             raise ValueError(f"Movie ID must be positive: {self.id}")
@@ -44,7 +56,7 @@ class Movie:
     
     def _clean_movie_id(self, movie_id: Union[int, str]) -> Optional[int]:
         """Clean and validate movie ID, return None if invalid."""
-        if pd.isna(movie_id) or movie_id is None:
+        if is_na(movie_id) or movie_id is None:
             return None
         
         try:
@@ -82,7 +94,7 @@ class Movie:
     
     def _clean_text(self, text: str) -> str:
         """Clean text by trimming whitespaces and handling special characters."""
-        if pd.isna(text) or text is None:
+        if is_na(text) or text is None:
             return ""
         
         text = str(text).strip()
@@ -94,7 +106,7 @@ class Movie:
     
     def _standardize_date(self, date_str: str) -> Optional[str]:
         """Standardize date format to YYYY-MM-DD."""
-        if pd.isna(date_str) or date_str is None or str(date_str).strip() == "":
+        if is_na(date_str) or date_str is None or str(date_str).strip() == "":
             return None
         
         try:
@@ -125,7 +137,7 @@ class Movie:
     
     def _clean_financial_data(self, value: Union[int, str, float]) -> int:
         """Clean and validate budget/revenue data."""
-        if pd.isna(value) or value is None or str(value).strip() == "":
+        if is_na(value) or value is None or str(value).strip() == "":
             return 0
         
         try:
@@ -155,7 +167,11 @@ class Movie:
     
     def _parse_flexible_field(self, field_str: str, field_type: str) -> List[str]:
         """Parse field that can be either JSON-like or comma-separated."""
-        if pd.isna(field_str) or field_str is None or str(field_str).strip() == "":
+        if isinstance(field_str, list):
+            # Already parsed into names (e.g. filled from TMDB)
+            return [cleaned for cleaned in (self._clean_text(item) for item in field_str) if cleaned]
+        
+        if is_na(field_str) or field_str is None or str(field_str).strip() == "":
             return []
         
         try:
@@ -179,12 +195,8 @@ class Movie:
         """Parse JSON-like strings and extract names."""
         try:
             # Look for 'name' field in JSON-like structure
-            name_pattern = r"'name':\s*'([^']+)'|\"name\":\s*\"([^\"]+)\""
-            matches = re.findall(name_pattern, json_str)
-            
             names = []
-            for match in matches:
-                name = match[0] if match[0] else match[1]
+            for name in tokenize_json_field(json_str).names:
                 if name:
                     cleaned_name = self._clean_text(name)
                     if cleaned_name:
@@ -222,14 +234,4 @@ class Movie:
     
     def to_dict(self) -> Dict:
         """Convert movie object to dictionary.""" 
-        return {
-            'id': self.id,
-            'title': self.title,
-            'release_date': self.release_date,
-            'genres': self.genres,
-            'production_companies': self.production_companies,
-            'production_countries': self.production_countries,
-            'spoken_languages': self.spoken_languages,
-            'budget': self.budget,
-            'revenue': self.revenue
-        }
\ No newline at end of file
+        return {field: getattr(self, field) for field in self.FIELDS}
\ No newline at end of file
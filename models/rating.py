@@ -1,13 +1,20 @@
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Optional, Union
 import logging
 
+from utils.na import is_na
+
 logger = logging.getLogger(__name__)
 
 class Rating:
     """Rating class to represent movie ratings data with cleaning and validation methods."""
     
+    FIELDS = ('movie_id', 'avg_rating', 'total_ratings', 'std_dev', 'last_rated')
+    __slots__ = FIELDS
+    
+    # Values of the rating fields for a movie without ratings
+    DEFAULTS = {'avg_rating': 0.0, 'total_ratings': 0, 'std_dev': 0.0, 'last_rated': None}
+    
     def __init__(self, movie_id: int, ratings_data: Dict):
         self.movie_id = movie_id
         self.avg_rating = self._clean_rating(ratings_data.get('avg_rating'))
@@ -17,7 +24,7 @@ class Rating:
     
     def _clean_rating(self, rating: Union[float, str]) -> float:
         """Clean and validate rating value."""
-        if pd.isna(rating) or rating is None:
+        if is_na(rating) or rating is None:
             return 0.0
         
         try:
@@ -33,7 +40,7 @@ class Rating:
     
     def _clean_count(self, count: Union[int, str]) -> int:
         """Clean and validate rating count."""
-        if pd.isna(count) or count is None:
+        if is_na(count) or count is None:
             return 0
         
         try:
@@ -45,7 +52,7 @@ class Rating:
     
     def _clean_std_dev(self, std_dev: Union[float, str], total_ratings: int) -> float:
         """Clean standard deviation, set to 0 if NaN or only one rating."""
-        if pd.isna(std_dev) or std_dev is None or total_ratings <= 1:
+        if is_na(std_dev) or std_dev is None or total_ratings <= 1:
             return 0.0
         
         try:
@@ -57,10 +64,15 @@ class Rating:
     
     def _clean_timestamp(self, timestamp: Union[int, str]) -> Optional[str]:
         """Clean and convert timestamp to readable format."""
-        if pd.isna(timestamp) or timestamp is None:
+        if is_na(timestamp) or timestamp is None:
             return None
         
         try:
+            if isinstance(timestamp, datetime):
+                # Typed loads hold last_rated as a naive UTC datetime
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
+                timestamp = timestamp.timestamp()
             timestamp_int = int(float(timestamp))
             dt = datetime.fromtimestamp(timestamp_int)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -70,10 +82,4 @@ class Rating:
     
     def to_dict(self) -> Dict:
         """Convert rating object to dictionary."""
-        return {
-            'movie_id': self.movie_id,
-            'avg_rating': self.avg_rating,
-            'total_ratings': self.total_ratings,
-            'std_dev': self.std_dev,
-            'last_rated': self.last_rated
-        }
\ No newline at end of file
+        return {field: getattr(self, field) for field in self.FIELDS}
\ No newline at end of file
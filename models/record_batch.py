@@ -0,0 +1,89 @@
+import operator
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
+
+from models.movie import Movie
+from models.rating import Rating
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns of a cleaned movie row: the Movie fields, then the Rating fields (without movie_id)
+RECORD_COLUMNS = Movie.FIELDS + tuple(Rating.DEFAULTS)
+
+_movie_values = attrgetter(*Movie.FIELDS)
+_rating_values = attrgetter(*Rating.DEFAULTS)
+_default_rating_values = tuple(Rating.DEFAULTS.values())
+
+
+class MovieRecordBatch:
+    """
+    Cleaned movies held column by column.
+
+    The object cleaner appends each Movie and Rating straight into per-column lists, and
+    the DataFrame cleaners wrap their frame as is, so no dict is built per row. to_frame
+    turns the columns into a DataFrame in one pass; iterating or indexing yields row dicts
+    one at a time, for callers that still expect the old list of dicts.
+    """
+
+    __slots__ = ('_columns', '_lists', '_frame')
+
+    def __init__(self):
+        self._columns: Optional[Dict[str, List]] = {column: [] for column in RECORD_COLUMNS}
+        # The same lists in RECORD_COLUMNS order, for append
+        self._lists = list(self._columns.values())
+        self._frame: Optional['pd.DataFrame'] = None
+
+    @classmethod
+    def from_frame(cls, frame: 'pd.DataFrame') -> 'MovieRecordBatch':
+        """A read-only batch backed by an already cleaned DataFrame (not copied)."""
+        batch = cls.__new__(cls)
+        batch._columns = batch._lists = None
+        batch._frame = frame
+        return batch
+
+    def append(self, movie: Movie, rating: Optional[Rating] = None):
+        """Add one cleaned movie; without a rating the rating columns get Rating.DEFAULTS."""
+        if self._columns is None:
+            raise ValueError("Cannot append to a batch backed by a DataFrame")
+        values = _movie_values(movie) + (_rating_values(rating) if rating is not None else _default_rating_values)
+        for column, value in zip(self._lists, values):
+            column.append(value)
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """The batch as a DataFrame with RECORD_COLUMNS (the wrapped frame itself when backed by one)."""
+        if self._frame is not None:
+            return self._frame
+        import pandas as pd
+        return pd.DataFrame(self._columns, columns=list(RECORD_COLUMNS))
+
+    def __len__(self) -> int:
+        if self._frame is not None:
+            return len(self._frame)
+        return len(self._columns['id'])
+
+    def _rows(self, selection: slice) -> Iterator[Dict]:
+        """Row dicts for a positional slice, with Python values (as DataFrame.tolist gives them)."""
+        if self._frame is not None:
+            part = self._frame.iloc[selection]
+            names = list(part.columns)
+            columns = [part[name].tolist() for name in names]
+        else:
+            names = list(self._columns)
+            columns = [values[selection] for values in self._columns.values()]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self._rows(slice(None))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        """One row dict, or a list of row dicts for a slice (like the old list of dicts)."""
+        if isinstance(index, slice):
+            return list(self._rows(index))
+        position = operator.index(index)
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("MovieRecordBatch index out of range")
+        return next(self._rows(slice(position, position + 1)))
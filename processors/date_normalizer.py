@@ -0,0 +1,76 @@
+import logging
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.movie import Movie
+
+logger = logging.getLogger(__name__)
+
+# Bare Movie used to run Movie._standardize_date on values outside pandas' datetime range
+_REFERENCE_MOVIE = Movie.__new__(Movie)
+
+# Movie._standardize_date's formats, in the order it tries them
+DATE_FORMATS = ["%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d.%m.%Y"]
+
+# Shape of each value -> the formats that can parse it, in Movie's order. Ambiguous
+# slash dates try dd/mm first and only fall back to mm/dd when that fails.
+DATE_SHAPES = [
+    (r'\d{1,2}/\d{1,2}/\d{4}', ["%d/%m/%Y", "%m/%d/%Y"]),
+    (r'\d{4}-\d{1,2}-\d{1,2}', ["%Y-%m-%d"]),
+    (r'\d{1,2}-\d{1,2}-\d{4}', ["%d-%m-%Y"]),
+    (r'\d{4}/\d{1,2}/\d{1,2}', ["%Y/%m/%d"]),
+    (r'\d{1,2}\.\d{1,2}\.\d{4}', ["%d.%m.%Y"]),
+]
+
+YEAR_PATTERN = r'\b((?:19|20)\d{2})\b'
+
+
+def normalize_dates(values: pd.Series) -> Tuple[pd.Series, Dict[str, int]]:
+    """
+    Column-wise Movie._standardize_date.
+
+    Each value is classified by shape once, every shape group is parsed in bulk with
+    pd.to_datetime(format=...), and only values no format parsed go to the year fallback.
+    Returns 'YYYY-MM-DD' strings (or None) and the number of values that took each path.
+    """
+    text = values.astype(str).str.strip()
+    pending = (values.notna() & (text != '')).to_numpy()
+    result = np.full(len(values), None, dtype=object)
+
+    counts = {fmt: 0 for fmt in DATE_FORMATS}
+    counts.update({'year_only': 0, 'reference': 0, 'missing': int((~pending).sum())})
+
+    for shape, formats in DATE_SHAPES:
+        if not pending.any():
+            break
+        candidates = np.flatnonzero(pending)
+        in_shape = text.iloc[candidates].str.fullmatch(shape).to_numpy(dtype=bool)
+        group = candidates[in_shape]
+
+        for fmt in formats:
+            if len(group) == 0:
+                break
+            parsed = pd.to_datetime(text.iloc[group], format=fmt, errors='coerce')
+            ok = parsed.notna().to_numpy()
+            if ok.any():
+                result[group[ok]] = parsed[ok].dt.strftime('%Y-%m-%d').to_numpy()
+                pending[group[ok]] = False
+                counts[fmt] += int(ok.sum())
+            group = group[~ok]
+
+    if pending.any():
+        positions = np.flatnonzero(pending)
+        years = text.iloc[positions].str.extract(YEAR_PATTERN, expand=False)
+        ok = years.notna().to_numpy()
+        result[positions[ok]] = (years[ok] + '-01-01').to_numpy()
+        pending[positions[ok]] = False
+        counts['year_only'] = int(ok.sum())
+
+    # Whatever is left is either unparseable or outside pandas' datetime range
+    if pending.any():
+        result[pending] = [_REFERENCE_MOVIE._standardize_date(value) for value in text[pending]]
+        counts['reference'] = int(pending.sum())
+
+    return pd.Series(result, index=values.index, dtype=object), counts
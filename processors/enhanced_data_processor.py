@@ -1,95 +1,106 @@
 import pandas as pd
 import json
+import os
 import time
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 import logging
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Import custom modules
 from models.movie import Movie
 from models.rating import Rating
+from models.record_batch import MovieRecordBatch
 from utils.iso_mapper import ISOMapper
-from tmdb_fetcher import tmdb_fetcher
+from processors.object_cleaner import clean_rows_with_objects
+from processors.indexed_merge import MERGE_ENGINES, fill_missing_from, merge_sources_indexed
+from processors.incremental import (IncrementalManifest, combine_source_hashes, filter_by_ids,
+                                    hash_rows_by_id, patch_output)
+from processors.parallel_cleaner import ParallelCleaner
+from processors.streaming_loader import StreamingLoader, flatten_ratings
+from processors.vectorized_cleaner import VectorizedMovieCleaner
+from utils.id_sanitizer import sanitize_ids
+from utils.columnar_output import LIST_COLUMNS, OUTPUT_FORMATS, write_columnar
+from utils.checkpoint_store import FetchCheckpoint
+from utils.run_profiler import RunProfiler, profiled_stage
+from utils.dtypes import MOVIE_SCHEMA, RATINGS_SCHEMA, apply_schema, log_memory_change, memory_report, read_csv
+from utils.missing_values import is_missing_value, missing_mask
+from utils.logger import configure_logging
+from config import (MAX_IN_FLIGHT, TMDB_LANGUAGE_POLICY, CLEANING_MODE, CLEANING_WORKERS, CLEANING_CHUNK_SIZE,
+                    STREAMING_CHUNK_SIZE, STREAMING_PARTITIONS, STREAMING_SPILL_DIR, TYPED_LOAD, CSV_ENGINE,
+                    OUTPUT_FORMAT, OUTPUT_COMPRESSION, PARQUET_ROW_GROUP_SIZE, INCREMENTAL_MANIFEST_PATH,
+                    USE_TMDB_CHECKPOINT, TMDB_CHECKPOINT_PATH, TMDB_ENRICHMENT_PROFILE, RUN_REPORT_PATH,
+                    CODE_PROFILER, CODE_PROFILE_DIR, MERGE_ENGINE)
+
+if TYPE_CHECKING:
+    from async_tmdb_fetcher import AsyncTMDbFetcher
+    from tmdb_fetcher import TMDbFetcher
 
 logger = logging.getLogger(__name__)
 
+LANGUAGE_POLICIES = ('always', 'if_malformed', 'if_missing')
+
 class EnhancedMovieDataProcessor:
     """Enhanced processor class with TMDB API integration for complete data processing."""
     
+    # Columns filled from TMDB only when missing
+    TMDB_TARGET_COLUMNS = ['title', 'release_date', 'genres', 'production_companies',
+                           'production_countries', 'budget', 'revenue']
+    # Columns overwritten with TMDB values whenever a movie is fetched
+    TMDB_ALWAYS_FETCH_COLUMNS = ['spoken_languages']
+    # Extra columns filled (and added when absent) by each append_to_response section
+    TMDB_SECTION_COLUMNS = {
+        'credits': ['cast', 'directors'],
+        'keywords': ['keywords'],
+        'release_dates': ['certification'],
+    }
+    
     def __init__(self):
         self.merged_df = None
-        self.processed_movies = []
-        self.tmdb_fetcher = tmdb_fetcher
+        self.processed_movies = MovieRecordBatch()
+        self.cleaned_df = None
+        self.chunk_timings = []
+        self.memory_reports = {}
+        self.id_rejections = {}
+        self.incremental_delta = {}
+        self.tmdb_checkpoint = None
+        self.profiler = RunProfiler()
+        self._tmdb_fetcher = None
+        self.async_tmdb_fetcher = None
+        configure_logging()
+    
+    @property
+    def tmdb_fetcher(self) -> 'TMDbFetcher':
+        """The TMDB client; the shared one is only built (and the HTTP stack imported) when first needed."""
+        if self._tmdb_fetcher is None:
+            from tmdb_fetcher import get_tmdb_fetcher
+            self._tmdb_fetcher = get_tmdb_fetcher()
+        return self._tmdb_fetcher
     
-    def load_and_merge_data(self, main_csv_path: str, extended_csv_path: str, ratings_json_path: str) -> pd.DataFrame:
+    @tmdb_fetcher.setter
+    def tmdb_fetcher(self, fetcher: 'TMDbFetcher'):
+        self._tmdb_fetcher = fetcher
+    
+    @profiled_stage('load_and_merge', rows_in_attr=None)
+    def load_and_merge_data(self, main_csv_path: str, extended_csv_path: str, ratings_json_path: str,
+                            typed: bool = TYPED_LOAD, csv_engine: str = CSV_ENGINE,
+                            merge_engine: str = MERGE_ENGINE) -> pd.DataFrame:
         """
         Load CSV files and JSON ratings, then merge them with outer join to keep all data.
+        
+        Args:
+            typed: Read columns as the compact dtypes in utils.dtypes (categories and strings
+                at parse time, ids and numbers just after) and log a memory report for each source
+            csv_engine: pandas CSV parser: 'c', 'python' or 'pyarrow' (needs pyarrow installed)
+            merge_engine: 'indexed' or 'outer' (see _merge_sources); both give the same rows
         """
         try:
             logger.info("Loading and merging all data sources...")
             
-            # Load main CSV
-            logger.info(f"Reading main CSV from {main_csv_path}")
-            main_df = pd.read_csv(main_csv_path)
-            
-            # Load extended CSV
-            logger.info(f"Reading extended CSV from {extended_csv_path}")
-            extended_df = pd.read_csv(extended_csv_path)
-            
-            # Load ratings JSON
-            logger.info(f"Reading ratings JSON from {ratings_json_path}")
-            with open(ratings_json_path, 'r') as file:
-                ratings_data = json.load(file)
-            ratings_df = pd.DataFrame(ratings_data)
-            
-            # Flatten ratings_summary if it exists
-            if 'ratings_summary' in ratings_df.columns:
-                # Extract nested ratings_summary data
-                ratings_summary_df = pd.json_normalize(ratings_df['ratings_summary'])
-                ratings_summary_df['movie_id'] = ratings_df['movie_id']
-                ratings_summary_df['last_rated'] = ratings_df['last_rated']
-                ratings_df = ratings_summary_df
-            
-            # Merge CSVs first (outer join to keep all movies)
-            logger.info("Merging CSV files...")
-            movies_df = pd.merge(main_df, extended_df, on='id', how='outer', suffixes=('', '_extended'))
-            
-            # Handle duplicate columns from merge
-            for col in movies_df.columns:
-                if col.endswith('_extended'):
-                    base_col = col.replace('_extended', '')
-                    if base_col in movies_df.columns:
-                        # Fill missing values from extended dataset
-                        movies_df[base_col] = movies_df[base_col].fillna(movies_df[col])
-                        movies_df.drop(col, axis=1, inplace=True)
-            
-            # Fix ID column types before merging
-            movies_df, ratings_df = self._fix_id_column_types(movies_df, ratings_df)
-
-            # Merge with ratings (outer join to keep all data from both sources)
-            logger.info("Merging with ratings data...")
-            self.merged_df = pd.merge(
-                movies_df, 
-                ratings_df, 
-                left_on='id', 
-                right_on='movie_id', 
-                how='outer',
-                suffixes=('', '_rating')
-            )
-            
-            # Clean up duplicate ID column
-            if 'movie_id' in self.merged_df.columns:
-                # Fill missing IDs from either source
-                self.merged_df['id'] = self.merged_df['id'].fillna(self.merged_df['movie_id'])
-                self.merged_df.drop('movie_id', axis=1, inplace=True)
-            
-            # Remove exact duplicates based on ID
-            initial_rows = len(self.merged_df)
-            self.merged_df = self.merged_df.drop_duplicates(subset=['id'], keep='first')
-            final_rows = len(self.merged_df)
+            main_df, extended_df, ratings_df = self._read_sources(main_csv_path, extended_csv_path, ratings_json_path,
+                                                                  typed=typed, csv_engine=csv_engine)
             
-            if initial_rows != final_rows:
-                logger.info(f"Removed {initial_rows - final_rows} duplicate rows")
+            self.merged_df = self._merge_sources(main_df, extended_df, ratings_df, engine=merge_engine)
             
             logger.info(f"Merged dataset created with {len(self.merged_df)} rows and {len(self.merged_df.columns)} columns")
             return self.merged_df
@@ -98,270 +109,710 @@ class EnhancedMovieDataProcessor:
             logger.error(f"Error in load_and_merge_data: {e}")
             raise
 
+    @profiled_stage('read_sources', rows_in_attr=None)
+    def _read_sources(self, main_csv_path: str, extended_csv_path: str, ratings_json_path: str,
+                      typed: bool = TYPED_LOAD,
+                      csv_engine: str = CSV_ENGINE) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Read the main CSV, extended CSV and flattened ratings, optionally with compact dtypes."""
+        # Load main CSV
+        logger.info(f"Reading main CSV from {main_csv_path}")
+        main_df = read_csv(main_csv_path, engine=csv_engine, schema=MOVIE_SCHEMA if typed else None)
+        
+        # Load extended CSV
+        logger.info(f"Reading extended CSV from {extended_csv_path}")
+        extended_df = read_csv(extended_csv_path, engine=csv_engine, schema=MOVIE_SCHEMA if typed else None)
+        
+        # Load ratings JSON
+        logger.info(f"Reading ratings JSON from {ratings_json_path}")
+        with open(ratings_json_path, 'r') as file:
+            ratings_data = json.load(file)
+        
+        # Flatten ratings_summary if it exists
+        ratings_df = flatten_ratings(pd.DataFrame(ratings_data))
+        
+        if typed:
+            # Main and extended are merged column by column, so they are typed together
+            main_df, extended_df = self._apply_schema(['main CSV', 'extended CSV'], [main_df, extended_df],
+                                                      MOVIE_SCHEMA)
+            ratings_df, = self._apply_schema(['ratings'], [ratings_df], RATINGS_SCHEMA)
+        
+        return main_df, extended_df, ratings_df
+
+    def _apply_schema(self, names: List[str], frames: List[pd.DataFrame],
+                      schema: Dict[str, str]) -> List[pd.DataFrame]:
+        """
+        Finish typing sources read with the schema (see apply_schema) and record each one's
+        memory as read (read-time dtypes already applied) and after the conversions.
+        """
+        as_read = [memory_report(df) for df in frames]
+        frames, skipped = apply_schema(frames, schema)
+        
+        for name, before, df in zip(names, as_read, frames):
+            after = memory_report(df)
+            self.memory_reports[name] = {'as_read': before, 'after': after}
+            log_memory_change(name, before, after)
+        if skipped:
+            logger.info(f"{' and '.join(names)}: kept {skipped} as read because they hold non-numeric values")
+        return frames
+
+    def iter_merged_batches(self, main_csv_path: str, extended_csv_path: str, ratings_json_path: str,
+                            chunk_size: int = STREAMING_CHUNK_SIZE,
+                            partitions: int = STREAMING_PARTITIONS,
+                            merge_engine: str = MERGE_ENGINE) -> Iterator[pd.DataFrame]:
+        """
+        Streaming version of load_and_merge_data.
+        
+        Reads the inputs in chunks, partitions them by movie id on disk and yields one merged
+        DataFrame per partition. Every row for a movie lands in the same batch, so the batches
+        together hold the same rows as load_and_merge_data (in a different order).
+        
+        Args:
+            chunk_size: Rows read from each CSV (and records from the ratings JSON) at a time
+            partitions: Number of id partitions; more partitions mean smaller batches
+            merge_engine: 'indexed' or 'outer' (see _merge_sources)
+        """
+        loader = StreamingLoader(chunk_size=chunk_size, partitions=partitions, spill_dir=STREAMING_SPILL_DIR)
+        
+        for batch_number, (main_df, extended_df, ratings_df) in enumerate(
+                loader.iter_partitions(main_csv_path, extended_csv_path, ratings_json_path)):
+            merged_df = self._merge_sources(main_df, extended_df, ratings_df, engine=merge_engine)
+            logger.info(f"Merged batch {batch_number + 1}: {len(merged_df)} rows")
+            yield merged_df
+
+    @profiled_stage('merge')
+    def _merge_sources(self, main_df: pd.DataFrame, extended_df: pd.DataFrame,
+                       ratings_df: pd.DataFrame, engine: str = MERGE_ENGINE) -> pd.DataFrame:
+        """
+        Outer-join the main CSV, extended CSV and flattened ratings on movie id.
+        
+        Args:
+            engine: 'indexed' sanitizes and deduplicates each source, then aligns them on a
+                sorted id index (processors/indexed_merge.py); 'outer' merges on the raw ids
+                and deduplicates afterwards. Both give the same rows; 'indexed' falls back to
+                'outer' when an id is spelled more than one way.
+        """
+        if engine not in MERGE_ENGINES:
+            raise ValueError(f"Unknown merge engine '{engine}'. Expected one of {MERGE_ENGINES}")
+        
+        if engine == 'indexed':
+            result = merge_sources_indexed(main_df, extended_df, ratings_df)
+            if result is not None:
+                merged_df, rejections = result
+                self._record_id_rejections(rejections)
+                return merged_df
+            logger.info("Ids are not spelled consistently across the sources; using the outer merge")
+        
+        # Merge CSVs first (outer join to keep all movies)
+        logger.info("Merging CSV files...")
+        movies_df = pd.merge(main_df, extended_df, on='id', how='outer', suffixes=('', '_extended'))
+        
+        # Handle duplicate columns from merge
+        for col in movies_df.columns:
+            if col.endswith('_extended'):
+                base_col = col.replace('_extended', '')
+                if base_col in movies_df.columns:
+                    # Fill missing values from extended dataset
+                    movies_df[base_col] = fill_missing_from(movies_df[base_col], movies_df[col])
+                    movies_df.drop(col, axis=1, inplace=True)
+        
+        # Fix ID column types before merging
+        movies_df, ratings_df = self._fix_id_column_types(movies_df, ratings_df)
+
+        # Merge with ratings (outer join to keep all data from both sources)
+        logger.info("Merging with ratings data...")
+        merged_df = pd.merge(
+            movies_df, 
+            ratings_df, 
+            left_on='id', 
+            right_on='movie_id', 
+            how='outer',
+            suffixes=('', '_rating')
+        )
+        
+        # Clean up duplicate ID column
+        if 'movie_id' in merged_df.columns:
+            # Fill missing IDs from either source
+            merged_df['id'] = merged_df['id'].fillna(merged_df['movie_id'])
+            if merged_df['id'].notna().all():
+                # Both sides hold sanitized ids; keep them integers rather than the float the outer join produced
+                merged_df['id'] = merged_df['id'].astype('int64')
+            merged_df.drop('movie_id', axis=1, inplace=True)
+        
+        # Remove exact duplicates based on ID
+        initial_rows = len(merged_df)
+        merged_df = merged_df.drop_duplicates(subset=['id'], keep='first')
+        final_rows = len(merged_df)
+        
+        if initial_rows != final_rows:
+            logger.info(f"Removed {initial_rows - final_rows} duplicate rows")
+        
+        return merged_df
+
+    @profiled_stage('fix_id_types')
     def _fix_id_column_types(self, movies_df, ratings_df):
-        """Fix ID column type mismatches before merging."""
-        
-        # Function to clean and convert IDs
-        def clean_id(id_val):
-            if pd.isna(id_val) or id_val is None:
-                return None
-            
-            id_str = str(id_val).strip()
-            
-            # Skip date-like patterns
-            if '/' in id_str or '-' in id_str:
-                if len(id_str) > 7:  # Likely a date if long and has separators
-                    return None
-            
-            try:
-                # Convert to int, handling floats first
-                return int(float(id_str))
-            except (ValueError, TypeError):
-                return None
-        
-        # Make explicit copies to avoid SettingWithCopyWarning
-        movies_df = movies_df.copy()
-        ratings_df = ratings_df.copy()
-        
-        # Clean movie IDs
-        if 'id' in movies_df.columns:
-            movies_df.loc[:, 'id'] = movies_df['id'].apply(clean_id)
-            movies_df = movies_df.dropna(subset=['id'])
-            movies_df.loc[:, 'id'] = movies_df['id'].astype('int64')
-        
-        # Clean rating movie IDs  
-        if 'movie_id' in ratings_df.columns:
-            ratings_df.loc[:, 'movie_id'] = ratings_df['movie_id'].apply(clean_id)
-            ratings_df = ratings_df.dropna(subset=['movie_id'])
-            ratings_df.loc[:, 'movie_id'] = ratings_df['movie_id'].astype('int64')
+        """
+        Sanitize the movie and rating ids column-wise before merging.
         
+        Rows whose id is missing, date-like, file-like, non-numeric or not positive are
+        dropped, so every id that reaches the merge and the Movie model is a positive int.
+        """
+        movies_df, movie_rejections = self._sanitize_id_column(movies_df, 'id')
+        ratings_df, rating_rejections = self._sanitize_id_column(ratings_df, 'movie_id')
+        self._record_id_rejections({'movies': movie_rejections, 'ratings': rating_rejections})
         return movies_df, ratings_df
+    
+    def _record_id_rejections(self, rejections: Dict[str, Dict[str, int]]):
+        """Keep (and log) the invalid-id counts of a merge, per source."""
+        for name, counts in rejections.items():
+            self.id_rejections[name] = counts
+            rejected = {reason: count for reason, count in counts.items() if count}
+            if rejected:
+                logger.info(f"Dropped {sum(rejected.values())} {name} rows with invalid ids: {rejected}")
+
+    @staticmethod
+    def _sanitize_id_column(df: pd.DataFrame, col: str) -> Tuple[pd.DataFrame, Dict[str, int]]:
+        """Keep the rows of df with a valid id in col, converted to int64."""
+        if col not in df.columns:
+            return df.copy(), {}
+        
+        ids, rejections = sanitize_ids(df[col])
+        keep = ids.notna().to_numpy()
+        df = df[keep].copy()
+        df[col] = ids[keep].astype('int64').to_numpy()
+        return df, rejections
 
     def _is_missing_value(self, value) -> bool:
         """
         Check if a value should be considered as missing.
         Handles null, 0, nan, [], [ ], and other indicators.
+        Use missing_mask for whole columns.
+        """
+        return is_missing_value(value)
+    
+    def profile_columns(self, profile: str) -> List[str]:
+        """Extra columns an enrichment profile fills (see TMDbFetcher.ENRICHMENT_PROFILES)."""
+        profiles = self.tmdb_fetcher.ENRICHMENT_PROFILES
+        if profile not in profiles:
+            raise ValueError(f"Unknown enrichment profile '{profile}'. Expected one of {tuple(profiles)}")
+        return [col for section in profiles[profile] for col in self.TMDB_SECTION_COLUMNS.get(section, [])]
+    
+    def plan_tmdb_fetch(self, language_policy: str = TMDB_LANGUAGE_POLICY,
+                        profile_columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
-        if pd.isna(value) or value is None:
-            return True
+        Work out which rows need a TMDB call and which columns each one needs.
         
-        if isinstance(value, (int, float)) and value == 0:
-            return True
+        Args:
+            language_policy: When to refetch spoken_languages -
+                'always' (every valid row), 'if_malformed' (skip rows whose languages
+                are already well-formed) or 'if_missing' (only rows with no languages)
+            profile_columns: Enrichment profile columns; needed wherever missing,
+                or on every row when merged_df does not have them yet
         
-        if isinstance(value, str):
-            cleaned_val = str(value).strip()
-            if cleaned_val in ['', '0', 'null', 'NULL', 'nan', 'NaN', '[]', '[ ]', '{}']:
-                return True
+        Returns:
+            DataFrame with one row per movie to fetch: 'row' (position in merged_df),
+            'id', and a boolean column per fillable column marking what it needs.
+        """
+        if language_policy not in LANGUAGE_POLICIES:
+            raise ValueError(f"Unknown language policy '{language_policy}'. Expected one of {LANGUAGE_POLICIES}")
         
-        if isinstance(value, list) and len(value) == 0:
-            return True
-            
-        return False
+        df = self.merged_df
+        movie_ids = pd.to_numeric(df['id'], errors='coerce')
+        valid_id = (movie_ids.notna() & (movie_ids > 0)).to_numpy()
+        
+        # Missing target columns need filling; columns absent from merged_df are never filled
+        need = pd.DataFrame(index=df.index)
+        for col in self.TMDB_TARGET_COLUMNS:
+            if col in df.columns:
+                need[col] = missing_mask(df[col])
+            else:
+                need[col] = False
+        for col in profile_columns or []:
+            need[col] = missing_mask(df[col]) if col in df.columns else True
+        
+        if language_policy == 'always' or 'spoken_languages' not in df.columns:
+            need['spoken_languages'] = True
+        elif language_policy == 'if_missing':
+            need['spoken_languages'] = missing_mask(df['spoken_languages'])
+        else:
+            need['spoken_languages'] = ~self._languages_well_formed(df['spoken_languages'])
+        
+        need_mask = need.to_numpy().any(axis=1) & valid_id
+        
+        plan = need[need_mask].copy()
+        plan.insert(0, 'id', movie_ids[need_mask].astype('int64'))
+        plan.insert(0, 'row', np.flatnonzero(need_mask))
+        plan = plan.reset_index(drop=True)
+        
+        logger.info(f"TMDB fetch plan: {len(plan)} of {len(df)} rows need API data "
+                    f"(language policy: {language_policy})")
+        return plan
     
-    def fill_missing_with_tmdb(self, batch_size: int = 50) -> pd.DataFrame:
+    def _languages_well_formed(self, languages: pd.Series) -> pd.Series:
         """
-        Fill missing values using TMDB API for specified columns.
-        Always fetch spoken_languages regardless of existing values.
+        Flag language values that already hold readable names.
+        Non-empty lists and plain-text names qualify, as do JSON-like values with english_name;
+        JSON-like values carrying only ISO codes or native names do not.
         """
-        logger.info("Starting TMDB API data filling process...")
+        missing = missing_mask(languages)
+        is_list = languages.map(lambda value: isinstance(value, list))
+        
+        text = languages.astype(str).str.strip()
+        json_like = text.str.contains(r"['\"]") & text.str.contains(':', regex=False)
+        has_english_name = text.str.contains('english_name', regex=False)
         
-        target_columns = ['title', 'release_date', 'genres', 'production_companies', 
-                         'production_countries', 'budget', 'revenue']
+        return ~missing & (is_list | ~json_like | has_english_name)
+    
+    @profiled_stage('tmdb_fill')
+    def fill_missing_with_tmdb(self, batch_size: int = 50, concurrent: bool = False,
+                               max_in_flight: Optional[int] = None,
+                               language_policy: str = TMDB_LANGUAGE_POLICY,
+                               checkpoint: bool = USE_TMDB_CHECKPOINT, resume: bool = False,
+                               profile: str = TMDB_ENRICHMENT_PROFILE) -> pd.DataFrame:
+        """
+        Fill missing values using TMDB API for specified columns.
+        Only rows that plan_tmdb_fetch marks as needing data are requested;
+        fetched spoken_languages always replace the existing value.
         
-        # Always fetch spoken_languages
-        always_fetch_columns = ['spoken_languages']
+        Args:
+            batch_size: Number of planned movies fetched and applied together
+            concurrent: Fetch each batch with a bounded thread pool instead of one call at a time
+            max_in_flight: Maximum concurrent requests in concurrent mode (defaults to MAX_IN_FLIGHT)
+            language_policy: When to refetch spoken_languages (see plan_tmdb_fetch)
+            checkpoint: Record each batch's results in the checkpoint store (TMDB_CHECKPOINT_PATH)
+            resume: Reuse results checkpointed by an earlier, interrupted run instead of
+                fetching those movies again; without it the checkpoint store starts empty
+            profile: Enrichment profile; 'analytics' also fills cast, directors, keywords
+                and certification, fetched in the same request as the details
+        """
+        logger.info("Starting TMDB API data filling process...")
         
-        total_rows = len(self.merged_df)
-        updated_count = 0
+        plan, profile_columns, store, first_batch, updated_count = self._start_tmdb_fill(
+            language_policy, profile, checkpoint, resume)
         api_calls_made = 0
+        total_planned = len(plan)
         
-        # Process in batches to manage memory and API rate limits
-        for i in range(0, total_rows, batch_size):
-            batch_end = min(i + batch_size, total_rows)
-            logger.info(f"Processing batch {i//batch_size + 1}: rows {i+1} to {batch_end}")
-            
-            for idx in range(i, batch_end):
-                row = self.merged_df.iloc[idx]
-                movie_id = row['id']
-                
-                # Skip if no valid movie ID
-                if pd.isna(movie_id) or movie_id <= 0:
-                    continue
+        executor = None
+        if concurrent:
+            max_in_flight = max_in_flight or MAX_IN_FLIGHT
+            logger.info(f"Concurrent TMDB fetch mode enabled with {max_in_flight} requests in flight")
+            executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='tmdb-fetch')
+        
+        try:
+            # Process in batches to manage memory and API rate limits
+            for i in range(0, total_planned, batch_size):
+                batch_end = min(i + batch_size, total_planned)
+                logger.info(f"Processing batch {i//batch_size + 1}: planned movies {i+1} to {batch_end} of {total_planned}")
                 
-                # Check if we need to fetch data for this movie
-                needs_update = False
+                batch = plan.iloc[i:batch_end]
+                batch_rows = list(zip(batch['row'].tolist(), batch['id'].tolist()))
                 
-                # Check target columns for missing values
-                for col in target_columns:
-                    if col in self.merged_df.columns and self._is_missing_value(row[col]):
-                        needs_update = True
-                        break
+                # Fetch the whole batch, then write the results back together
+                movie_ids = [movie_id for _, movie_id in batch_rows]
+                if executor is not None:
+                    fetched = list(executor.map(self._fetch_tmdb_data, movie_ids, [profile] * len(movie_ids)))
+                else:
+                    fetched = [self._fetch_tmdb_data(movie_id, profile) for movie_id in movie_ids]
                 
-                # Always update spoken_languages
-                needs_update = True  # Force update for spoken_languages
+                # Only calls that returned data count; failures (None) and unknown ids ({}) do not
+                api_calls_made += sum(1 for tmdb_data in fetched if tmdb_data)
+                updated_count += self._store_tmdb_batch(
+                    [row for row, _ in batch_rows], movie_ids, fetched, profile, profile_columns,
+                    store, first_batch + i // batch_size)
                 
-                if needs_update:
-                    try:
-                        logger.info(f"Fetching TMDB data for movie ID: {movie_id}")
-                        tmdb_data = self.tmdb_fetcher.fetch_movie_details(int(movie_id))
-                        api_calls_made += 1
-                        
-                        if tmdb_data:
-                            self._update_row_with_tmdb_data(idx, tmdb_data, target_columns, always_fetch_columns)
-                            updated_count += 1
-                        
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch TMDB data for movie ID {movie_id}: {e}")
-                        continue
-            
-            # Log progress
-            logger.info(f"Completed batch {i//batch_size + 1}. Updated {updated_count} movies so far.")
+                # Log progress
+                logger.info(f"Completed batch {i//batch_size + 1}. Updated {updated_count} movies so far.")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
         
         logger.info(f"TMDB data filling completed. Updated {updated_count} movies with {api_calls_made} API calls.")
+        self._log_tmdb_stats(self.tmdb_fetcher)
         return self.merged_df
     
-    def _update_row_with_tmdb_data(self, row_idx: int, tmdb_data: Dict, 
-                                  target_columns: List[str], always_fetch_columns: List[str]):
-        """Update a specific row with TMDB data."""
+    def _start_tmdb_fill(self, language_policy: str, profile: str, checkpoint: bool, resume: bool):
+        """
+        Plan a TMDB fill and open its checkpoint store, applying checkpointed results when resuming.
+        
+        Returns the plan still to fetch, the profile columns, the store (None without
+        checkpointing), the first batch number to use and the rows already updated.
+        """
+        profile_columns = self.profile_columns(profile)
+        plan = self.plan_tmdb_fetch(language_policy=language_policy, profile_columns=profile_columns)
+        updated_count = 0
+        first_batch = 0
+        
+        store = self._checkpoint_store() if checkpoint else None
+        if store is not None and not resume:
+            store.clear()
+        elif store is not None:
+            # Apply what the interrupted run already fetched and plan only the rest
+            stored = store.load(plan['id'].tolist(), profile)
+            if stored:
+                done = plan['id'].isin(list(stored)).to_numpy()
+                resumed = [(row, stored[movie_id]) for row, movie_id in
+                           zip(plan['row'][done].tolist(), plan['id'][done].tolist())]
+                updated_count += self._apply_tmdb_results(resumed, self.TMDB_TARGET_COLUMNS,
+                                                          self.TMDB_ALWAYS_FETCH_COLUMNS, profile_columns)
+                plan = plan[~done].reset_index(drop=True)
+                completed = store.completed_batches()
+                first_batch = completed[-1] + 1 if completed else 0
+                logger.info(f"Resuming from checkpoint: applied {len(resumed)} stored results, "
+                            f"{len(plan)} movies left to fetch")
+        
+        return plan, profile_columns, store, first_batch, updated_count
+    
+    def _store_tmdb_batch(self, rows: List[int], movie_ids: List[int], fetched: List[Optional[Dict]],
+                          profile: str, profile_columns: List[str], store: Optional[FetchCheckpoint],
+                          batch_number: int) -> int:
+        """Apply one batch of fetched results to merged_df and checkpoint it. Returns rows updated."""
+        batch_results = [(row, tmdb_data) for row, tmdb_data in zip(rows, fetched) if tmdb_data]
+        updated = self._apply_tmdb_results(batch_results, self.TMDB_TARGET_COLUMNS,
+                                           self.TMDB_ALWAYS_FETCH_COLUMNS, profile_columns)
+        
+        # Empty results (failures, unknown ids) are not recorded, so a resumed run retries them;
+        # unknown ids are answered from the response cache's negative entries
+        if store is not None:
+            store.save_batch(batch_number, [(movie_id, tmdb_data) for movie_id, tmdb_data in zip(movie_ids, fetched)
+                                            if tmdb_data], profile)
+        return updated
+    
+    @staticmethod
+    def _log_tmdb_stats(fetcher):
+        """Log the cache, HTTP latency and rate limiting counters of a TMDB fetcher."""
+        cache_stats = fetcher.cache_stats()
+        if cache_stats:
+            logger.info(f"TMDB cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                        f"({cache_stats['stale']} stale), {cache_stats['entries']} entries")
+        
+        latency = fetcher.latency_stats()
+        if latency['requests']:
+            logger.info(f"TMDB HTTP: {latency['requests']} requests, {latency['reused_connections']} on reused "
+                        f"connections; mean connect {latency['connect']['mean_ms']:.1f} ms, "
+                        f"TTFB {latency['ttfb']['mean_ms']:.1f} ms (p95 {latency['ttfb']['p95_ms']:.1f}), "
+                        f"body {latency['body']['mean_ms']:.1f} ms")
+        
+        limits = fetcher.rate_limit_stats()
+        if limits['throttle_events'] or limits['dropped']:
+            logger.info(f"TMDB rate limiting: {limits['throttle_events']} throttled responses, "
+                        f"{limits['throttled_time']:.1f}s waited, {limits['dropped']} requests dropped, "
+                        f"rate now {limits['rate']:.1f}/s")
+    
+    def write_run_report(self, report_path: Optional[str], pipeline: str, use_tmdb_api: bool = False,
+                         **sections) -> Optional[Dict]:
+        """
+        Write the JSON run report of the current self.profiler run.
+        
+        Besides the stage timings it records the TMDB fetcher's HTTP latency (with a
+        histogram), rate limiting and cache counters when the API was used, the ISO parser
+        cache counters, id rejections and memory reports. Failing to write it is logged,
+        never raised, so a report cannot fail the run it describes.
+        
+        Args:
+            report_path: Where to write the report; None skips it
+            pipeline: Which pipeline ran ('complete', 'streaming', 'incremental')
+            use_tmdb_api: Include the TMDB fetcher statistics
+            sections: Extra top-level entries (output path, error, ...)
+        """
+        if not report_path:
+            return None
+        
+        tmdb_stats = {}
+        if use_tmdb_api:
+            for name, fetcher in (('threaded', self._tmdb_fetcher), ('async', self.async_tmdb_fetcher)):
+                if fetcher is None:
+                    continue
+                tmdb_stats[name] = {
+                    'http': dict(fetcher.latency_stats(), histogram=fetcher.latency_histogram()),
+                    'rate_limit': fetcher.rate_limit_stats(),
+                    'cache': fetcher.cache_stats(),
+                }
+        
+        try:
+            return self.profiler.write_report(
+                report_path,
+                pipeline=pipeline,
+                tmdb=tmdb_stats,
+                iso_cache=ISOMapper.cache_stats(),
+                id_rejections=self.id_rejections,
+                memory=self.memory_reports,
+                **sections
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write run report to {report_path}: {e}")
+            return None
+    
+    @profiled_stage('tmdb_fill')
+    async def fill_missing_with_tmdb_async(self, batch_size: int = 50, max_in_flight: Optional[int] = None,
+                                           language_policy: str = TMDB_LANGUAGE_POLICY,
+                                           checkpoint: bool = USE_TMDB_CHECKPOINT, resume: bool = False,
+                                           profile: str = TMDB_ENRICHMENT_PROFILE,
+                                           fetcher: Optional['AsyncTMDbFetcher'] = None) -> pd.DataFrame:
+        """
+        Fill missing values from TMDB with the asyncio client (needs aiohttp).
+        
+        Plans, fills and checkpoints exactly like fill_missing_with_tmdb, but keeps up to
+        max_in_flight requests open from a single thread and applies results in batches of
+        batch_size in the order they complete, rather than waiting for whole batches.
+        
+        Args:
+            max_in_flight: Concurrent requests (defaults to ASYNC_MAX_IN_FLIGHT)
+            fetcher: AsyncTMDbFetcher to use; by default one is built that shares the
+                threaded fetcher's base URL, rate limiter and response cache
+            Other arguments are as for fill_missing_with_tmdb.
+        """
+        logger.info("Starting async TMDB API data filling process...")
+        
+        plan, profile_columns, store, first_batch, updated_count = self._start_tmdb_fill(
+            language_policy, profile, checkpoint, resume)
+        
+        # Duplicate ids are fetched once and applied to every row that carries them
+        rows_by_id = {}
+        for row, movie_id in zip(plan['row'].tolist(), plan['id'].tolist()):
+            rows_by_id.setdefault(movie_id, []).append(row)
+        
+        if fetcher is None:
+            from async_tmdb_fetcher import AsyncTMDbFetcher
+            fetcher = AsyncTMDbFetcher(base_url=self.tmdb_fetcher.base_url, rate_limiter=self.tmdb_fetcher.rate_limiter,
+                                       cache=self.tmdb_fetcher.cache, max_in_flight=max_in_flight)
+        logger.info(f"Async TMDB fetch: {len(rows_by_id)} movies, {fetcher.max_in_flight} requests in flight")
+        
+        api_calls_made = 0
+        completed = 0
+        batch_number = first_batch
+        pending = []
+        
+        async with fetcher:
+            async for movie_id, tmdb_data in fetcher.fetch_many(list(rows_by_id), profile):
+                completed += 1
+                # Counted as in fill_missing_with_tmdb: only calls that returned data
+                if tmdb_data:
+                    api_calls_made += 1
+                pending.append((movie_id, tmdb_data))
+                if len(pending) >= batch_size:
+                    updated_count += self._store_async_batch(pending, rows_by_id, profile, profile_columns,
+                                                             store, batch_number)
+                    batch_number += 1
+                    pending = []
+                    logger.info(f"Completed {completed} of {len(rows_by_id)} movies. "
+                                f"Updated {updated_count} movies so far.")
+            
+            if pending:
+                updated_count += self._store_async_batch(pending, rows_by_id, profile, profile_columns,
+                                                         store, batch_number)
+        
+        logger.info(f"Async TMDB data filling completed. Updated {updated_count} movies with {api_calls_made} API calls.")
+        self.async_tmdb_fetcher = fetcher
+        self._log_tmdb_stats(fetcher)
+        return self.merged_df
+    
+    def _store_async_batch(self, results: List[Tuple[int, Dict]], rows_by_id: Dict[int, List[int]], profile: str,
+                           profile_columns: List[str], store: Optional[FetchCheckpoint], batch_number: int) -> int:
+        """Expand (movie id, data) results to every planned row with that id, then apply and checkpoint them."""
+        rows, movie_ids, fetched = [], [], []
+        for movie_id, tmdb_data in results:
+            for row in rows_by_id[movie_id]:
+                rows.append(row)
+                movie_ids.append(movie_id)
+                fetched.append(tmdb_data)
+        return self._store_tmdb_batch(rows, movie_ids, fetched, profile, profile_columns, store, batch_number)
+    
+    def _checkpoint_store(self) -> FetchCheckpoint:
+        """The TMDB checkpoint store, opened once per processor."""
+        if self.tmdb_checkpoint is None:
+            self.tmdb_checkpoint = FetchCheckpoint(TMDB_CHECKPOINT_PATH)
+        return self.tmdb_checkpoint
+    
+    def _fetch_tmdb_data(self, movie_id: int, profile: str = 'basic') -> Optional[Dict]:
+        """Fetch TMDB details (plus the profile's sections) for one movie. Returns None if the call raised."""
+        try:
+            logger.info(f"Fetching TMDB data for movie ID: {movie_id}")
+            if profile != 'basic':
+                return self.tmdb_fetcher.fetch_movie_profile(movie_id, profile)
+            return self.tmdb_fetcher.fetch_movie_details(movie_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch TMDB data for movie ID {movie_id}: {e}")
+            return None
+    
+    def _apply_tmdb_results(self, results: List[Tuple[int, Dict]], 
+                            target_columns: List[str], always_fetch_columns: List[str],
+                            profile_columns: Optional[List[str]] = None) -> int:
+        """
+        Write a batch of (row position, TMDB data) results back to merged_df. Returns rows updated.
+        
+        Results are staged column-wise, then combined per column by row position:
+        target columns are filled only where missing, always-fetch columns are
+        overwritten wherever TMDB returned a value. Profile columns are filled where
+        missing and added to merged_df if it does not have them yet.
+        """
+        if not results:
+            return 0
+        
+        profile_columns = list(profile_columns or [])
+        positions = np.fromiter((row_idx for row_idx, _ in results), dtype=np.intp, count=len(results))
+        staging = pd.DataFrame.from_records(
+            [tmdb_data for _, tmdb_data in results],
+            columns=list(target_columns) + list(always_fetch_columns) + profile_columns
+        )
         
-        # Update target columns only if they're missing
         for col in target_columns:
-            if col in self.merged_df.columns and self._is_missing_value(self.merged_df.iloc[row_idx][col]):
-                if col == 'genres' and 'genres' in tmdb_data:
-                    # Extract only genre names
-                    self.merged_df.at[row_idx, col] = tmdb_data['genres']
-                elif col == 'production_companies' and 'production_companies' in tmdb_data:
-                    self.merged_df.at[row_idx, col] = tmdb_data['production_companies']
-                elif col == 'production_countries' and 'production_countries' in tmdb_data:
-                    # Extract only country names
-                    self.merged_df.at[row_idx, col] = tmdb_data['production_countries']
-                elif col in tmdb_data:
-                    self.merged_df.at[row_idx, col] = tmdb_data[col]
-        
-        # Always update spoken_languages with english_name values
-        if 'spoken_languages' in tmdb_data:
-            # tmdb_data['spoken_languages'] already contains just the english_name values
-            self.merged_df.at[row_idx, 'spoken_languages'] = tmdb_data['spoken_languages']
+            if col not in self.merged_df.columns:
+                continue
+            current = self.merged_df[col].iloc[positions]
+            fill = missing_mask(current).to_numpy() & staging[col].notna().to_numpy()
+            self._combine_column(col, positions, staging[col], fill)
+        
+        for col in always_fetch_columns:
+            self._combine_column(col, positions, staging[col], staging[col].notna().to_numpy())
+        
+        for col in profile_columns:
+            fill = staging[col].notna().to_numpy()
+            if col in self.merged_df.columns:
+                fill &= missing_mask(self.merged_df[col].iloc[positions]).to_numpy()
+            self._combine_column(col, positions, staging[col], fill)
+        
+        return len(results)
+    
+    def _combine_column(self, col: str, positions: np.ndarray, incoming: pd.Series, take: np.ndarray):
+        """Copy incoming values into merged_df[col] at the given row positions where take is True."""
+        if not take.any():
+            return
+        
+        values = incoming.to_numpy()[take]
+        if col not in self.merged_df.columns:
+            self.merged_df[col] = pd.Series(np.nan, index=self.merged_df.index, dtype=object)
+        elif values.dtype == object and self.merged_df[col].dtype != object:
+            # Lists and strings need an object column; upcast once rather than per cell
+            self.merged_df[col] = self.merged_df[col].astype(object)
+        
+        self.merged_df.iloc[positions[take], self.merged_df.columns.get_loc(col)] = values
     
-    def clean_data_with_proper_methods(self) -> List[Movie]:
+    @profiled_stage('clean')
+    def clean_data_with_proper_methods(self, mode: str = CLEANING_MODE, parallel: bool = False,
+                                       workers: Optional[int] = CLEANING_WORKERS,
+                                       chunk_size: int = CLEANING_CHUNK_SIZE) -> MovieRecordBatch:
         """
         Apply PROPER cleaning methods including Rating class for timestamps and formatting.
+        
+        Args:
+            mode: 'vectorized' cleans whole columns with VectorizedMovieCleaner;
+                'object' builds a Movie and Rating per row (the reference implementation)
+            parallel: Split merged_df into chunks and clean them in worker processes
+            workers: Number of worker processes in parallel mode (defaults to the CPU count)
+            chunk_size: Rows per chunk in parallel mode
         """
+        if mode not in ('vectorized', 'object'):
+            raise ValueError(f"Unknown cleaning mode '{mode}'. Expected 'vectorized' or 'object'")
+        if parallel:
+            return self._clean_parallel(mode, workers, chunk_size)
+        if mode == 'vectorized':
+            return self._clean_vectorized()
+        
         logger.info("Applying proper cleaning methods with Rating class...")
         
-        self.processed_movies = []
-        dropped_count = 0
-        
-        for idx, row in self.merged_df.iterrows():
-            try:
-                # Create movie instance with existing cleaning logic
-                movie = Movie(
-                    movie_id=row.get('id', 0),
-                    title=row.get('title', ''),
-                    release_date=row.get('release_date', ''),
-                    genres=row.get('genres', ''),
-                    production_companies=row.get('production_companies', ''),
-                    production_countries=row.get('production_countries', ''),
-                    spoken_languages=row.get('spoken_languages', ''),  # This will be cleaned
-                    budget=row.get('budget', 0),
-                    revenue=row.get('revenue', 0)
-                )
-                
-                # PROPERLY clean production countries with ISO mapping
-                movie.production_countries = ISOMapper.clean_and_map_countries(
-                    row.get('production_countries', '')
-                )
-                
-                # PROPERLY clean spoken languages with ISO mapping  
-                movie.spoken_languages = ISOMapper.clean_and_map_languages(
-                    row.get('spoken_languages', '')
-                )
-                
-                # Convert movie to dict
-                movie_dict = movie.to_dict()
-                
-                # PROPERLY process ratings data using Rating class
-                if any(col in row and not pd.isna(row[col]) for col in ['avg_rating', 'total_ratings', 'std_dev', 'last_rated']):
-                    ratings_data = {
-                        'avg_rating': row.get('avg_rating'),
-                        'total_ratings': row.get('total_ratings'), 
-                        'std_dev': row.get('std_dev'),
-                        'last_rated': row.get('last_rated')
-                    }
-                    
-                    # Use Rating class to properly clean and format ratings
-                    rating = Rating(movie.id, ratings_data)
-                    rating_dict = rating.to_dict()
-                    
-                    # Add cleaned ratings to movie dict
-                    movie_dict.update({
-                        'avg_rating': rating_dict['avg_rating'],
-                        'total_ratings': rating_dict['total_ratings'],
-                        'std_dev': rating_dict['std_dev'],
-                        'last_rated': rating_dict['last_rated']  # This will be properly formatted timestamp
-                    })
-                else:
-                    # Set defaults for missing ratings
-                    movie_dict.update({
-                        'avg_rating': 0.0,
-                        'total_ratings': 0,
-                        'std_dev': 0.0,
-                        'last_rated': None
-                    })
-                
-                # Store the properly cleaned movie data
-                self.processed_movies.append(movie_dict)
-                
-            except ValueError as e:
-                # Skip movies with invalid IDs or other validation errors
-                logger.debug(f"Skipping invalid movie at index {idx}: {e}")
-                dropped_count += 1
-                continue
-            except Exception as e:
-                logger.error(f"Error processing movie at index {idx}: {e}")
-                continue
+        processed_movies, dropped_count = clean_rows_with_objects(self.merged_df)
+        self.cleaned_df = processed_movies.to_frame()
+        # Keep only the frame; the batch's column lists are released with it
+        self.processed_movies = MovieRecordBatch.from_frame(self.cleaned_df)
         
         logger.info(f"Data cleaning completed. Processed {len(self.processed_movies)} movies, dropped {dropped_count} invalid movies")
+        iso_stats = ISOMapper.cache_stats()
+        logger.info(f"ISO field cache hit rates: countries {iso_stats['countries']['hit_rate']:.1%}, "
+                    f"languages {iso_stats['languages']['hit_rate']:.1%}")
+        return self.processed_movies
+    
+    def _clean_parallel(self, mode: str, workers: Optional[int], chunk_size: int) -> MovieRecordBatch:
+        """Clean merged_df in chunks across worker processes, keeping the original row order."""
+        logger.info(f"Applying parallel cleaning ({mode} mode)...")
+        
+        cleaner = ParallelCleaner(workers=workers, chunk_size=chunk_size, mode=mode)
+        self.cleaned_df, dropped_count = cleaner.clean(self.merged_df)
+        self.chunk_timings = cleaner.chunk_timings
+        self.processed_movies = MovieRecordBatch.from_frame(self.cleaned_df)
+        
+        logger.info(f"Data cleaning completed. Processed {len(self.cleaned_df)} movies, dropped {dropped_count} invalid movies")
         return self.processed_movies
     
-    def save_final_dataset(self, output_path: str = 'final_cleaned_movies.csv') -> str:
+    def _clean_vectorized(self) -> MovieRecordBatch:
+        """Clean merged_df column by column; produces the same rows as the object path."""
+        logger.info("Applying vectorized cleaning (Movie/Rating rules on whole columns)...")
+        
+        self.cleaned_df, dropped_count = VectorizedMovieCleaner.clean(self.merged_df)
+        self.processed_movies = MovieRecordBatch.from_frame(self.cleaned_df)
+        
+        logger.info(f"Data cleaning completed. Processed {len(self.cleaned_df)} movies, dropped {dropped_count} invalid movies")
+        return self.processed_movies
+    
+    @staticmethod
+    def _prepare_output_frame(final_df: pd.DataFrame) -> pd.DataFrame:
+        """Join list columns with ' | ' and put the standard columns first."""
+        # Convert list columns to pipe-separated strings for CSV compatibility
+        for col in LIST_COLUMNS:
+            if col in final_df.columns:
+                final_df[col] = final_df[col].apply(
+                    lambda x: ' | '.join(x) if isinstance(x, list) and x else ''
+                )
+        
+        return EnhancedMovieDataProcessor._order_output_columns(final_df)
+    
+    @staticmethod
+    def _order_output_columns(final_df: pd.DataFrame) -> pd.DataFrame:
+        """Put the standard columns first, followed by any others."""
+        # Reorder columns for better readability
+        column_order = [
+            'id', 'title', 'release_date', 'genres', 
+            'production_companies', 'production_countries', 'spoken_languages',
+            'budget', 'revenue', 'avg_rating', 'total_ratings', 'std_dev', 'last_rated'
+        ]
+        
+        # Only include columns that exist in the DataFrame
+        existing_columns = [col for col in column_order if col in final_df.columns]
+        remaining_columns = [col for col in final_df.columns if col not in existing_columns]
+        final_column_order = existing_columns + remaining_columns
+
+        return final_df[final_column_order]
+    
+    @profiled_stage('save')
+    def save_final_dataset(self, output_path: str = 'final_cleaned_movies.csv',
+                           output_format: str = OUTPUT_FORMAT, compression: Optional[str] = OUTPUT_COMPRESSION,
+                           row_group_size: Optional[int] = PARQUET_ROW_GROUP_SIZE) -> str:
         """
-        Save the final cleaned and enhanced dataset to a single CSV file.
+        Save the final cleaned and enhanced dataset to a single file.
+        
+        Args:
+            output_path: Destination file. A '.csv' suffix is swapped for the format's own
+                suffix when writing Parquet or Feather
+            output_format: 'csv' (list columns joined with ' | '), or 'parquet' / 'feather',
+                which keep list columns as native lists and need pyarrow
+            compression: Codec for Parquet/Feather (e.g. 'zstd', 'snappy', 'lz4'); None for none
+            row_group_size: Rows per Parquet row group (None lets pyarrow decide)
+        
+        Returns:
+            Path of the written file
         """
         try:
             logger.info("Preparing final dataset for saving...")
             
+            if output_format not in OUTPUT_FORMATS:
+                raise ValueError(f"Unknown output format '{output_format}'. Expected one of {OUTPUT_FORMATS}")
+            
             if not self.processed_movies:
                 raise ValueError("No processed movies data available. Run the complete pipeline first.")
             
-            # Convert processed movies to DataFrame
-            final_df = pd.DataFrame(self.processed_movies)
-            
-            # Convert list columns to pipe-separated strings for CSV compatibility
-            list_columns = ['genres', 'production_companies', 'production_countries', 'spoken_languages']
-            for col in list_columns:
-                if col in final_df.columns:
-                    final_df[col] = final_df[col].apply(
-                        lambda x: ' | '.join(x) if isinstance(x, list) and x else ''
-                    )
-            
-            # Reorder columns for better readability
-            column_order = [
-                'id', 'title', 'release_date', 'genres', 
-                'production_companies', 'production_countries', 'spoken_languages',
-                'budget', 'revenue', 'avg_rating', 'total_ratings', 'std_dev', 'last_rated'
-            ]
-            
-            # Only include columns that exist in the DataFrame
-            existing_columns = [col for col in column_order if col in final_df.columns]
-            remaining_columns = [col for col in final_df.columns if col not in existing_columns]
-            final_column_order = existing_columns + remaining_columns
-            
-            final_df = final_df[final_column_order]
+            # Reuse the cleaned DataFrame when available instead of rebuilding it from the batch
+            if self.cleaned_df is not None and len(self.cleaned_df) == len(self.processed_movies):
+                final_df = self.cleaned_df.copy()
+            else:
+                final_df = self.processed_movies.to_frame().copy()
             
-            # Save to CSV
-            final_df.to_csv(output_path, index=False)
+            if output_format == 'csv':
+                final_df = self._prepare_output_frame(final_df)
+                
+                # Save to CSV
+                final_df.to_csv(output_path, index=False)
+            else:
+                final_df = self._order_output_columns(final_df)
+                output_path = write_columnar(final_df, output_path, output_format,
+                                             compression=compression, row_group_size=row_group_size)
             
             logger.info(f"Final dataset saved to {output_path}")
             logger.info(f"Dataset contains {len(final_df)} rows and {len(final_df.columns)} columns")
@@ -383,7 +834,16 @@ class EnhancedMovieDataProcessor:
     
     def run_complete_pipeline(self, main_csv_path: str, extended_csv_path: str, 
                             ratings_json_path: str, output_path: str = 'final_cleaned_movies.csv',
-                            use_tmdb_api: bool = True, batch_size: int = 50) -> str:
+                            use_tmdb_api: bool = True, batch_size: int = 50,
+                            concurrent_fetch: bool = False, max_in_flight: Optional[int] = None,
+                            language_policy: str = TMDB_LANGUAGE_POLICY,
+                            cleaning_mode: str = CLEANING_MODE, parallel_cleaning: bool = False,
+                            cleaning_workers: Optional[int] = CLEANING_WORKERS,
+                            typed_load: bool = TYPED_LOAD, csv_engine: str = CSV_ENGINE,
+                            merge_engine: str = MERGE_ENGINE, output_format: str = OUTPUT_FORMAT,
+                            output_compression: Optional[str] = OUTPUT_COMPRESSION,
+                            resume: bool = False, report_path: Optional[str] = RUN_REPORT_PATH,
+                            code_profiler: Optional[str] = CODE_PROFILER) -> str:
         """
         Run the complete data processing pipeline with PROPER cleaning.
         
@@ -394,32 +854,54 @@ class EnhancedMovieDataProcessor:
             output_path: Path for final output CSV
             use_tmdb_api: Whether to use TMDB API for missing data
             batch_size: Batch size for TMDB API calls
+            concurrent_fetch: Whether to fetch TMDB data with a bounded thread pool
+            max_in_flight: Maximum concurrent TMDB requests when concurrent_fetch is enabled
+            language_policy: When to refetch spoken_languages ('always', 'if_malformed', 'if_missing')
+            cleaning_mode: 'vectorized' (column-wise) or 'object' (per-row Movie/Rating reference)
+            parallel_cleaning: Whether to clean chunks in worker processes
+            cleaning_workers: Worker processes for parallel cleaning (defaults to the CPU count)
+            typed_load: Convert columns to compact dtypes at read time and log memory reports
+            csv_engine: pandas CSV parser: 'c', 'python' or 'pyarrow'
+            merge_engine: 'indexed' or 'outer' (see _merge_sources)
+            output_format: 'csv', 'parquet' or 'feather' (the last two keep list columns as lists)
+            output_compression: Compression codec for Parquet/Feather output
+            resume: Reuse TMDB results checkpointed by an interrupted run (see fill_missing_with_tmdb)
+            report_path: Where to write the JSON run report (per-stage timings, memory, rows,
+                TMDB latency and cache statistics); None skips it
+            code_profiler: 'cprofile' or 'pyinstrument' to also dump a profile of every stage
+                into CODE_PROFILE_DIR; None (the default) to skip profiling
         
         Returns:
             Path to saved final dataset
         """
+        self.profiler = RunProfiler(code_profiler, CODE_PROFILE_DIR)
         try:
             logger.info("🎬 Starting Enhanced Movie Data Processing Pipeline WITH PROPER CLEANING")
             logger.info("=" * 70)
             
             # Step 1: Load and merge all data sources
             logger.info("Step 1: Loading and merging data sources...")
-            self.load_and_merge_data(main_csv_path, extended_csv_path, ratings_json_path)
+            self.load_and_merge_data(main_csv_path, extended_csv_path, ratings_json_path,
+                                     typed=typed_load, csv_engine=csv_engine, merge_engine=merge_engine)
             
             # Step 2: Fill missing values with TMDB API (optional)
             if use_tmdb_api:
                 logger.info("Step 2: Filling missing values with TMDB API...")
-                self.fill_missing_with_tmdb(batch_size=batch_size)
+                self.fill_missing_with_tmdb(batch_size=batch_size, concurrent=concurrent_fetch,
+                                            max_in_flight=max_in_flight, language_policy=language_policy,
+                                            resume=resume)
             else:
                 logger.info("Step 2: Skipping TMDB API integration (disabled)")
             
             # Step 3: Apply PROPER cleaning methods (including Rating class)
             logger.info("Step 3: Applying PROPER data cleaning methods with Rating class...")
-            self.clean_data_with_proper_methods()  # FIXED: Use proper cleaning method
+            self.clean_data_with_proper_methods(mode=cleaning_mode, parallel=parallel_cleaning,
+                                                workers=cleaning_workers)  # FIXED: Use proper cleaning method
             
             # Step 4: Save final dataset
             logger.info("Step 4: Saving final cleaned dataset...")
-            final_path = self.save_final_dataset(output_path)
+            final_path = self.save_final_dataset(output_path, output_format=output_format,
+                                                 compression=output_compression)
             
             logger.info("✅ Pipeline completed successfully with PROPER cleaning!")
             logger.info(f"📁 Final dataset saved to: {final_path}")
@@ -429,10 +911,198 @@ class EnhancedMovieDataProcessor:
             logger.info("  ✅ Countries and languages properly mapped")
             logger.info("  ✅ Rating data properly cleaned and validated")
             
+            self.write_run_report(report_path, 'complete', use_tmdb_api=use_tmdb_api, output_path=final_path)
             return final_path
             
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
+            self.write_run_report(report_path, 'complete', use_tmdb_api=use_tmdb_api, error=str(e))
+            raise
+
+    def run_streaming_pipeline(self, main_csv_path: str, extended_csv_path: str,
+                               ratings_json_path: str, output_path: str = 'final_cleaned_movies.csv',
+                               use_tmdb_api: bool = True, batch_size: int = 50,
+                               concurrent_fetch: bool = False, max_in_flight: Optional[int] = None,
+                               language_policy: str = TMDB_LANGUAGE_POLICY,
+                               cleaning_mode: str = CLEANING_MODE,
+                               chunk_size: int = STREAMING_CHUNK_SIZE,
+                               partitions: int = STREAMING_PARTITIONS, merge_engine: str = MERGE_ENGINE,
+                               resume: bool = False,
+                               report_path: Optional[str] = RUN_REPORT_PATH,
+                               code_profiler: Optional[str] = CODE_PROFILER) -> str:
+        """
+        Run the pipeline one merged batch at a time so memory stays bounded by the batch size.
+        
+        Each batch from iter_merged_batches is filled from TMDB, cleaned and appended to the
+        output CSV before the next one is read. The output holds the same rows as
+        run_complete_pipeline, grouped by id partition rather than in global id order.
+        
+        Args:
+            chunk_size: Rows read from each input at a time
+            partitions: Number of id partitions (batches); raise it for inputs larger than memory
+            resume: Reuse TMDB results checkpointed by an interrupted run; the output is
+                still rewritten from the start
+            Other arguments are as for run_complete_pipeline.
+        
+        Returns:
+            Path to saved final dataset
+        """
+        self.profiler = RunProfiler(code_profiler, CODE_PROFILE_DIR)
+        try:
+            logger.info("🎬 Starting streaming movie data pipeline")
+            logger.info("=" * 70)
+            
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            if use_tmdb_api and USE_TMDB_CHECKPOINT and not resume:
+                self._checkpoint_store().clear()
+            
+            total_rows = 0
+            batches = self.iter_merged_batches(main_csv_path, extended_csv_path, ratings_json_path,
+                                               chunk_size=chunk_size, partitions=partitions,
+                                               merge_engine=merge_engine)
+            for batch_number, merged_df in enumerate(batches):
+                self.merged_df = merged_df
+                
+                if use_tmdb_api:
+                    # The checkpoint is cleared once below, so each batch resumes from the ones before it
+                    self.fill_missing_with_tmdb(batch_size=batch_size, concurrent=concurrent_fetch,
+                                                max_in_flight=max_in_flight, language_policy=language_policy,
+                                                resume=True)
+                
+                self.clean_data_with_proper_methods(mode=cleaning_mode)
+                if not self.processed_movies:
+                    continue
+                
+                final_df = self.cleaned_df if self.cleaned_df is not None else self.processed_movies.to_frame()
+                with self.profiler.stage('save', len(final_df)) as stage:
+                    final_df = self._prepare_output_frame(final_df.copy())
+                    final_df.to_csv(output_path, mode='a', header=total_rows == 0, index=False)
+                    stage['rows_out'] = len(final_df)
+                total_rows += len(final_df)
+                logger.info(f"Batch {batch_number + 1}: wrote {len(final_df)} rows ({total_rows} total)")
+            
+            logger.info(f"✅ Streaming pipeline completed: {total_rows} rows saved to {output_path}")
+            self.write_run_report(report_path, 'streaming', use_tmdb_api=use_tmdb_api, output_path=output_path)
+            return output_path
+            
+        except Exception as e:
+            logger.error(f"Streaming pipeline failed: {e}")
+            self.write_run_report(report_path, 'streaming', use_tmdb_api=use_tmdb_api, error=str(e))
+            raise
+
+    def run_incremental_pipeline(self, main_csv_path: str, extended_csv_path: str,
+                                 ratings_json_path: str, output_path: str = 'final_cleaned_movies.csv',
+                                 manifest_path: str = INCREMENTAL_MANIFEST_PATH, full_refresh: bool = False,
+                                 clean: bool = True, use_tmdb_api: bool = True, batch_size: int = 50,
+                                 concurrent_fetch: bool = False, max_in_flight: Optional[int] = None,
+                                 language_policy: str = TMDB_LANGUAGE_POLICY,
+                                 cleaning_mode: str = CLEANING_MODE,
+                                 typed_load: bool = TYPED_LOAD, csv_engine: str = CSV_ENGINE,
+                                 merge_engine: str = MERGE_ENGINE, output_format: str = OUTPUT_FORMAT,
+                                 output_compression: Optional[str] = OUTPUT_COMPRESSION,
+                                 resume: bool = False, report_path: Optional[str] = RUN_REPORT_PATH,
+                                 code_profiler: Optional[str] = CODE_PROFILER) -> str:
+        """
+        Reprocess only the movies whose input rows changed since the previous run.
+        
+        Every source row is hashed and the hashes are combined per movie id. Ids that are new
+        or whose hash differs from the manifest of the previous run are merged, filled from
+        TMDB and cleaned; their rows (and those of deleted ids) are then patched into the
+        previous output. The first run, or any run whose output or settings no longer match
+        the manifest, processes everything and writes the output from scratch.
+        
+        Args:
+            manifest_path: Where the per-id hashes of the previous run are kept
+            full_refresh: Ignore the manifest and reprocess every movie
+            clean: Clean the rows (the full pipeline); False writes the enriched, uncleaned
+                rows as CSV, like fill_missing.py
+            Other arguments are as for run_complete_pipeline.
+        
+        Returns:
+            Path to the (patched) output
+        """
+        self.profiler = RunProfiler(code_profiler, CODE_PROFILE_DIR)
+        try:
+            logger.info("🎬 Starting incremental movie data pipeline")
+            logger.info("=" * 70)
+            
+            if not clean and output_format != 'csv':
+                raise ValueError("Enriched (uncleaned) output is only written as CSV")
+            
+            main_df, extended_df, ratings_df = self._read_sources(main_csv_path, extended_csv_path, ratings_json_path,
+                                                                  typed=typed_load, csv_engine=csv_engine)
+            hashes = combine_source_hashes(
+                hash_rows_by_id(main_df, 'id'),
+                hash_rows_by_id(extended_df, 'id'),
+                hash_rows_by_id(ratings_df, 'movie_id')
+            )
+            
+            meta = {'requested_path': output_path, 'output_format': output_format,
+                    'stage': 'clean' if clean else 'enrich'}
+            manifest = IncrementalManifest(manifest_path)
+            incremental = (
+                not full_refresh
+                and manifest.load()
+                and all(manifest.meta.get(key) == value for key, value in meta.items())
+                and os.path.exists(manifest.meta.get('output_path', ''))
+            )
+            
+            if incremental:
+                delta = manifest.diff(hashes)
+                self.incremental_delta = {name: len(ids) for name, ids in delta.items()}
+                logger.info(f"Delta since the previous run: {self.incremental_delta}")
+                process_ids = np.concatenate([delta['new'], delta['changed']])
+                main_df = filter_by_ids(main_df, 'id', process_ids)
+                extended_df = filter_by_ids(extended_df, 'id', process_ids)
+                ratings_df = filter_by_ids(ratings_df, 'movie_id', process_ids)
+            else:
+                self.incremental_delta = {'new': len(hashes), 'changed': 0, 'unchanged': 0, 'deleted': 0}
+                logger.info(f"No usable manifest at {manifest_path}; processing all {len(hashes)} movies")
+            
+            self.merged_df = self._merge_sources(main_df, extended_df, ratings_df, engine=merge_engine)
+            logger.info(f"Merged {len(self.merged_df)} rows to process")
+            
+            if use_tmdb_api and not self.merged_df.empty:
+                self.fill_missing_with_tmdb(batch_size=batch_size, concurrent=concurrent_fetch,
+                                            max_in_flight=max_in_flight, language_policy=language_policy,
+                                            resume=resume)
+            
+            if clean:
+                if self.merged_df.empty:
+                    self.processed_movies, self.cleaned_df = MovieRecordBatch(), pd.DataFrame()
+                else:
+                    self.clean_data_with_proper_methods(mode=cleaning_mode)
+                output_rows = self.cleaned_df if self.cleaned_df is not None else self.processed_movies.to_frame()
+            else:
+                output_rows = self.merged_df
+            
+            if incremental:
+                if clean and output_format == 'csv':
+                    output_rows = self._prepare_output_frame(output_rows.copy())
+                elif clean:
+                    output_rows = self._order_output_columns(output_rows)
+                removed_ids = np.concatenate([delta['changed'], delta['deleted']])
+                final_path = manifest.meta['output_path']
+                patch_output(final_path, output_format, output_rows, removed_ids, compression=output_compression,
+                             row_group_size=PARQUET_ROW_GROUP_SIZE)
+            elif clean:
+                final_path = self.save_final_dataset(output_path, output_format=output_format,
+                                                     compression=output_compression)
+            else:
+                final_path = output_path
+                output_rows.to_csv(final_path, index=False)
+            
+            manifest.save(hashes, dict(meta, output_path=final_path))
+            
+            logger.info(f"✅ Incremental pipeline completed: {final_path}")
+            self.write_run_report(report_path, 'incremental', use_tmdb_api=use_tmdb_api, output_path=final_path,
+                                  incremental=self.incremental_delta)
+            return final_path
+            
+        except Exception as e:
+            logger.error(f"Incremental pipeline failed: {e}")
+            self.write_run_report(report_path, 'incremental', use_tmdb_api=use_tmdb_api, error=str(e))
             raise
 
 # Usage example and backward compatibility
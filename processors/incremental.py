@@ -0,0 +1,190 @@
+import io
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.columnar_output import FILE_SUFFIXES, read_final_dataset, write_columnar
+from utils.id_sanitizer import sanitize_ids
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Odd multipliers that keep each source's hash in its own "slot" of the combined hash
+_SOURCE_WEIGHTS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64)
+
+
+def hash_rows_by_id(df: pd.DataFrame, id_col: str) -> pd.Series:
+    """
+    Content hash of every row of df, combined per sanitized id.
+
+    Returns a uint64 Series indexed by id. Rows whose id is rejected are ignored, as the
+    merge drops them too. Repeated ids hash in file order, so reordering them counts as a change.
+    """
+    if df.empty or id_col not in df.columns:
+        return pd.Series(dtype=np.uint64)
+
+    ids, _ = sanitize_ids(df[id_col])
+    keep = ids.notna().to_numpy()
+    if not keep.any():
+        return pd.Series(dtype=np.uint64)
+
+    ids = ids[keep].to_numpy(dtype=np.int64)
+    row_hashes = pd.util.hash_pandas_object(df[keep], index=False).to_numpy()
+
+    # Mix in each row's position among rows with the same id, then add up per id
+    occurrence = pd.Series(ids).groupby(ids).cumcount().to_numpy(dtype=np.uint64)
+    row_hashes = pd.util.hash_array(row_hashes + occurrence)
+
+    order = np.argsort(ids, kind='stable')
+    sorted_ids = ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    sums = np.add.reduceat(row_hashes[order], starts)
+    return pd.Series(sums, index=sorted_ids[starts], dtype=np.uint64)
+
+
+def combine_source_hashes(*source_hashes: pd.Series) -> pd.Series:
+    """Combine per-id hashes from each source into one uint64 hash per id."""
+    index = pd.Index([], dtype=np.int64)
+    for hashes in source_hashes:
+        index = index.union(hashes.index.astype(np.int64))
+
+    # Reindex each source on its own so the hashes never pass through float64
+    combined = np.zeros(len(index), dtype=np.uint64)
+    for weight, hashes in zip(_SOURCE_WEIGHTS, source_hashes):
+        combined += hashes.reindex(index, fill_value=0).to_numpy(dtype=np.uint64) * weight
+
+    return pd.Series(pd.util.hash_array(combined), index=index, dtype=np.uint64)
+
+
+class IncrementalManifest:
+    """
+    Per-id content hashes from the previous run, stored next to a note of the output they produced.
+
+    Saved as a .npz file that is written to a temporary file and renamed into place, so a
+    crash mid-save leaves the previous manifest intact.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hashes: Optional[pd.Series] = None
+        self.meta: Dict = {}
+
+    def load(self) -> bool:
+        """Read the manifest. Returns False if there is none or it cannot be used."""
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self.meta = json.loads(str(data['meta']))
+                self.hashes = pd.Series(data['hashes'], index=data['ids'], dtype=np.uint64)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return False
+
+        if self.meta.get('version') != MANIFEST_VERSION:
+            logger.info(f"Manifest {self.path} is from another version; starting from scratch")
+            return False
+        return True
+
+    def save(self, hashes: pd.Series, meta: Dict):
+        """Atomically replace the manifest with the hashes of this run."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        meta = dict(meta, version=MANIFEST_VERSION)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            np.savez(file, ids=hashes.index.to_numpy(dtype=np.int64),
+                     hashes=hashes.to_numpy(dtype=np.uint64), meta=np.array(json.dumps(meta)))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+        self.hashes = hashes
+        self.meta = meta
+
+    def diff(self, hashes: pd.Series) -> Dict[str, np.ndarray]:
+        """Split the current ids into new, changed and unchanged, and list the deleted ones."""
+        previous = self.hashes if self.hashes is not None else pd.Series(dtype=np.uint64)
+
+        current_ids = hashes.index.to_numpy()
+        known = np.isin(current_ids, previous.index.to_numpy())
+        previous_hashes = previous.reindex(current_ids[known]).to_numpy(dtype=np.uint64)
+        same = hashes.to_numpy()[known] == previous_hashes
+
+        return {
+            'new': current_ids[~known],
+            'changed': current_ids[known][~same],
+            'unchanged': current_ids[known][same],
+            'deleted': np.setdiff1d(previous.index.to_numpy(), current_ids),
+        }
+
+
+def filter_by_ids(df: pd.DataFrame, id_col: str, ids: Iterable[int]) -> pd.DataFrame:
+    """Rows of df whose sanitized id is in ids."""
+    if df.empty or id_col not in df.columns:
+        return df
+
+    sanitized, _ = sanitize_ids(df[id_col])
+    keep = sanitized.isin(np.asarray(list(ids), dtype=np.int64)).fillna(False).to_numpy(dtype=bool)
+    return df[keep]
+
+
+def _atomic_csv(df: pd.DataFrame, path: str):
+    """Write df as CSV to a temporary file and rename it over path."""
+    tmp_path = path + '.tmp'
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def patch_output(path: str, output_format: str, new_rows: pd.DataFrame, removed_ids: Iterable[int],
+                 compression: Optional[str] = None, row_group_size: Optional[int] = None) -> int:
+    """
+    Replace the rows for removed_ids in a previous output file with new_rows, in place.
+
+    new_rows must already be in the output layout (CSV rows with joined list columns for
+    'csv'). Rows are kept in id order, as a full run writes them. Returns the new row count.
+    """
+    removed = np.asarray(list(removed_ids), dtype=np.int64)
+
+    if output_format == 'csv':
+        # Work on the text as written so untouched rows are copied byte for byte
+        previous = pd.read_csv(path, dtype=str, keep_default_na=False)
+        if new_rows.empty:
+            incoming = previous.iloc[0:0]
+        else:
+            buffer = io.StringIO()
+            new_rows.to_csv(buffer, index=False)
+            buffer.seek(0)
+            incoming = pd.read_csv(buffer, dtype=str, keep_default_na=False)
+    else:
+        previous = read_final_dataset(path)
+        incoming = new_rows
+
+    previous_ids = pd.to_numeric(previous['id'], errors='coerce')
+    kept = previous[~previous_ids.isin(removed).to_numpy()]
+    patched = pd.concat([kept, incoming], ignore_index=True)
+    if output_format == 'csv':
+        patched = patched.fillna('')
+
+    order = np.argsort(pd.to_numeric(patched['id'], errors='coerce').to_numpy(), kind='stable')
+    patched = patched.iloc[order].reset_index(drop=True)
+
+    if output_format == 'csv':
+        _atomic_csv(patched, path)
+    else:
+        tmp_path = path + '.tmp' + FILE_SUFFIXES[output_format]
+        written = write_columnar(patched, tmp_path, output_format, compression=compression,
+                                 row_group_size=row_group_size)
+        os.replace(written, path)
+
+    logger.info(f"Patched {path}: removed {len(previous) - len(kept)} rows, wrote {len(incoming)} rows, "
+                f"{len(patched)} rows in total")
+    return len(patched)
@@ -0,0 +1,179 @@
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_extension_array_dtype, is_numeric_dtype
+
+from utils.id_sanitizer import ID_REJECTION_REASONS, sanitize_ids
+
+logger = logging.getLogger(__name__)
+
+# 'outer': two outer pd.merge calls on the raw ids, then a fillna/drop loop and drop_duplicates
+# 'indexed': sanitize and dedup each source first, then align the frames on a sorted id index
+MERGE_ENGINES = ('outer', 'indexed')
+
+# Label of the stand-in row used to upcast columns the way an outer join's unmatched rows do; never a valid id
+_GAP_LABEL = -1
+
+
+def fill_missing_from(base: pd.Series, extra: pd.Series) -> pd.Series:
+    """base with its missing values taken from extra (aligned with it), as the outer merge fills _extended columns."""
+    if isinstance(base.dtype, pd.CategoricalDtype) or isinstance(extra.dtype, pd.CategoricalDtype):
+        # Categoricals only accept known categories, so combine as objects
+        filled = base.astype(object).fillna(extra.astype(object))
+        return filled.astype('category')
+    if base.dtype != extra.dtype and (is_extension_array_dtype(base.dtype) or is_extension_array_dtype(extra.dtype)):
+        # Nullable and Arrow dtypes reject (or silently wrap) values of another type, so both sides
+        # go to the dtype concat would give them: Int32 and Int64 to Int64, Int32 and object to object
+        common = pd.concat([base.iloc[:0], extra.iloc[:0]]).dtype
+        return base.astype(common).fillna(extra.astype(common))
+    return base.fillna(extra)
+
+
+def _canonical_ids(raw: pd.Series, ids: pd.Series) -> bool:
+    """True when every valid raw id is already spelled as its sanitized value ('862' or 862, not ' 862' or '862.0')."""
+    valid = ids.notna().to_numpy()
+    if not valid.any():
+        return True
+    values = raw[valid]
+    sanitized = ids[valid].to_numpy(dtype=np.int64)
+    if is_numeric_dtype(values):
+        return bool((values.to_numpy() == sanitized).all())
+    if infer_dtype(values, skipna=False) != 'string':
+        return False
+    return bool((values.to_numpy(dtype=str) == sanitized.astype(str)).all())
+
+
+def _sanitize_shared(main_raw: pd.Series, extended_raw: pd.Series) -> Optional[Tuple[pd.Series, pd.Series]]:
+    """
+    Sanitized ids of both raw id columns, validating each distinct raw value once
+    (most ids appear in both files). None when a valid id is not spelled canonically.
+    """
+    codes, uniques = pd.factorize(pd.concat([main_raw, extended_raw], ignore_index=True))
+    raw = pd.Series(uniques)
+    ids, _ = sanitize_ids(raw)
+    if not _canonical_ids(raw, ids):
+        return None
+    values = ids.to_numpy(dtype='float64', na_value=np.nan)
+    # Code -1 marks a missing raw id
+    taken = np.where(codes >= 0, values[codes], np.nan)
+    return (pd.Series(taken[:len(main_raw)], index=main_raw.index).astype('Int64'),
+            pd.Series(taken[len(main_raw):], index=extended_raw.index).astype('Int64'))
+
+
+def _first_by_id(df: pd.DataFrame, col: str, ids: pd.Series) -> pd.DataFrame:
+    """The rows of df with a valid id, first occurrence of each id only, indexed by the sorted ids."""
+    positions = np.flatnonzero(ids.notna().to_numpy())
+    keys = ids.to_numpy(dtype='float64', na_value=np.nan)[positions].astype(np.int64)
+    first = ~pd.Index(keys).duplicated(keep='first')
+    positions, keys = positions[first], keys[first]
+    order = np.argsort(keys, kind='stable')
+    # One take for the filter, dedup and sort together
+    frame = df.drop(columns=col).take(positions[order])
+    frame.index = pd.Index(keys[order], name=col)
+    return frame
+
+
+def _align(frame: pd.DataFrame, index: pd.Index, has_gaps: bool) -> pd.DataFrame:
+    """
+    Reindex frame to index. With has_gaps, columns are upcast as if a row were missing
+    (int to float, bool to object) even when none of index is, because the outer merge
+    had unmatched rows for ids the sanitized frames no longer hold.
+    """
+    if not has_gaps:
+        return frame.reindex(index)
+    return frame.reindex(index.append(pd.Index([_GAP_LABEL]))).iloc[:len(index)]
+
+
+def _unmatched(left_raw: pd.Series, left_ids: pd.Series, left_index: pd.Index,
+               right_raw: pd.Series, right_ids: pd.Series, right_index: pd.Index) -> bool:
+    """Whether an outer merge on the raw ids would give right some rows with no left match."""
+    if not right_index.isin(left_index).all():
+        return True
+    # Rejected ids still took part in the raw-id merge (a missing id matches a missing id)
+    right_rejected = right_raw[right_ids.isna().to_numpy()]
+    return not right_rejected.isin(left_raw[left_ids.isna().to_numpy()]).all()
+
+
+def _rejected_merge_rows(main_raw: pd.Series, main_ids: pd.Series,
+                         extended_raw: pd.Series, extended_ids: pd.Series) -> Dict[str, int]:
+    """Rejection counts over the rows an outer merge of the raw ids would have produced for the rejected ids."""
+    main_counts = main_raw[main_ids.isna().to_numpy()].value_counts(dropna=False)
+    extended_counts = extended_raw[extended_ids.isna().to_numpy()].value_counts(dropna=False)
+    if main_counts.empty and extended_counts.empty:
+        return {reason: 0 for reason in ID_REJECTION_REASONS}
+
+    counts = pd.concat([main_counts.rename('main'), extended_counts.rename('extended')], axis=1).fillna(0)
+    # An id on both sides yields one row per pair, otherwise one row per occurrence
+    rows = np.where((counts['main'] > 0) & (counts['extended'] > 0),
+                    counts['main'] * counts['extended'], counts['main'] + counts['extended']).astype(np.int64)
+    keys = pd.Series(np.repeat(counts.index.to_numpy(dtype=object), rows), dtype=object)
+    return sanitize_ids(keys)[1]
+
+
+def merge_sources_indexed(main_df: pd.DataFrame, extended_df: pd.DataFrame,
+                          ratings_df: pd.DataFrame) -> Optional[Tuple[pd.DataFrame, Dict[str, Dict[str, int]]]]:
+    """
+    Merge the three sources on a sorted id index instead of outer merges on the raw ids.
+
+    Ids are sanitized and each source is deduplicated (first row per id) up front; main is
+    then filled from extended where it is missing, and the ratings columns are joined, over
+    frames aligned on the union of ids. The result holds the same rows, columns, values
+    and dtypes as the outer merge (with a fresh RangeIndex), without materializing the
+    row products of repeated ids.
+
+    Returns the merged frame and the id rejections ({'movies': ..., 'ratings': ...}, counted
+    as the outer merge counts them), or None when a valid id is spelled more than one way
+    ('862' and '862.0') or the sources' id columns cannot be compared; the raw-id merge
+    pairs such rows differently, so the caller should fall back to it.
+    """
+    if 'id' not in main_df.columns or 'id' not in extended_df.columns or 'movie_id' not in ratings_df.columns:
+        return None
+
+    main_raw, extended_raw = main_df['id'], extended_df['id']
+    if is_numeric_dtype(main_raw) != is_numeric_dtype(extended_raw):
+        return None
+
+    sanitized = _sanitize_shared(main_raw, extended_raw)
+    if sanitized is None:
+        return None
+    main_ids, extended_ids = sanitized
+    ratings_ids, ratings_rejections = sanitize_ids(ratings_df['movie_id'])
+
+    main = _first_by_id(main_df, 'id', main_ids)
+    extended = _first_by_id(extended_df, 'id', extended_ids)
+    ratings = _first_by_id(ratings_df, 'movie_id', ratings_ids)
+
+    # Main filled from extended, over the ids of either
+    movie_index = main.index.union(extended.index)
+    main_gaps = _unmatched(main_raw, main_ids, main.index, extended_raw, extended_ids, extended.index)
+    extended_gaps = _unmatched(extended_raw, extended_ids, extended.index, main_raw, main_ids, main.index)
+    movies = _align(main, movie_index, main_gaps)
+    extended = _align(extended, movie_index, extended_gaps)
+    for col in extended.columns:
+        if col in movies.columns:
+            movies[col] = fill_missing_from(movies[col], extended[col])
+        else:
+            movies[col] = extended[col]
+    # Only the filled frame is needed from here on; free the rest before aligning again
+    del main, extended
+
+    # Ratings joined over every id; clashing rating columns keep a _rating suffix
+    index = movie_index.union(ratings.index)
+    movies = _align(movies, index, not ratings.index.isin(movie_index).all())
+    ratings = _align(ratings, index, not movie_index.isin(ratings.index).all())
+    ratings.columns = [f"{col}_rating" if col in movies.columns or col == 'id' else col for col in ratings.columns]
+
+    # Assembled once, in the outer merge's column order: main's (id where main has it), extended's, then ratings'
+    ids = pd.Series(index.to_numpy(), name='id')
+    movies.index = ratings.index = ids.index
+    columns = {'id': ids, **{col: movies[col] for col in movies.columns}, **{col: ratings[col] for col in ratings.columns}}
+    order = list(main_df.columns) + [col for col in columns if col not in main_df.columns]
+    merged = pd.DataFrame({col: columns[col] for col in order}, copy=False)
+
+    rejections = {
+        'movies': _rejected_merge_rows(main_raw, main_ids, extended_raw, extended_ids),
+        'ratings': ratings_rejections,
+    }
+    return merged, rejections
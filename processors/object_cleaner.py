@@ -0,0 +1,73 @@
+import pandas as pd
+from typing import Tuple
+import logging
+
+from models.movie import Movie
+from models.rating import Rating
+from models.record_batch import MovieRecordBatch
+from utils.iso_mapper import ISOMapper
+
+logger = logging.getLogger(__name__)
+
+
+def clean_rows_with_objects(df: pd.DataFrame) -> Tuple[MovieRecordBatch, int]:
+    """
+    Clean rows one at a time by building a Movie and a Rating per row.
+    This is the reference implementation the other cleaning engines must match.
+    
+    Returns the cleaned movies (one column per field) and the number of rows dropped as invalid.
+    """
+    processed_movies = MovieRecordBatch()
+    dropped_count = 0
+    
+    for idx, row in df.iterrows():
+        try:
+            # Create movie instance with existing cleaning logic
+            movie = Movie(
+                movie_id=row.get('id', 0),
+                title=row.get('title', ''),
+                release_date=row.get('release_date', ''),
+                genres=row.get('genres', ''),
+                production_companies=row.get('production_companies', ''),
+                production_countries=row.get('production_countries', ''),
+                spoken_languages=row.get('spoken_languages', ''),  # This will be cleaned
+                budget=row.get('budget', 0),
+                revenue=row.get('revenue', 0)
+            )
+            
+            # PROPERLY clean production countries with ISO mapping
+            movie.production_countries = ISOMapper.clean_and_map_countries(
+                row.get('production_countries', '')
+            )
+            
+            # PROPERLY clean spoken languages with ISO mapping  
+            movie.spoken_languages = ISOMapper.clean_and_map_languages(
+                row.get('spoken_languages', '')
+            )
+            
+            # PROPERLY process ratings data using Rating class
+            rating = None
+            if any(col in row and not pd.isna(row[col]) for col in ['avg_rating', 'total_ratings', 'std_dev', 'last_rated']):
+                ratings_data = {
+                    'avg_rating': row.get('avg_rating'),
+                    'total_ratings': row.get('total_ratings'), 
+                    'std_dev': row.get('std_dev'),
+                    'last_rated': row.get('last_rated')
+                }
+                
+                # Use Rating class to properly clean and format ratings
+                rating = Rating(movie.id, ratings_data)
+            
+            # Store the properly cleaned movie data (missing ratings get the Rating defaults)
+            processed_movies.append(movie, rating)
+            
+        except ValueError as e:
+            # Skip movies with invalid IDs or other validation errors
+            logger.debug(f"Skipping invalid movie at index {idx}: {e}")
+            dropped_count += 1
+            continue
+        except Exception as e:
+            logger.error(f"Error processing movie at index {idx}: {e}")
+            continue
+    
+    return processed_movies, dropped_count
@@ -0,0 +1,88 @@
+import importlib
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from processors.object_cleaner import clean_rows_with_objects
+from processors.vectorized_cleaner import OUTPUT_COLUMNS, VectorizedMovieCleaner
+
+logger = logging.getLogger(__name__)
+
+# Modules every worker loads once at start-up rather than on its first chunk
+WORKER_PRELOAD_MODULES = ['models.movie', 'models.rating', 'utils.iso_mapper']
+
+
+def _init_worker():
+    """Process-pool initializer: import the cleaning modules once per worker."""
+    for module_name in WORKER_PRELOAD_MODULES:
+        importlib.import_module(module_name)
+
+
+def _clean_chunk(chunk_number: int, chunk: pd.DataFrame, mode: str) -> Tuple[int, pd.DataFrame, int, float]:
+    """Clean one chunk in a worker. Returns (chunk number, cleaned frame, dropped rows, seconds)."""
+    start = time.perf_counter()
+
+    if mode == 'vectorized':
+        cleaned, dropped_count = VectorizedMovieCleaner.clean(chunk)
+    else:
+        processed_movies, dropped_count = clean_rows_with_objects(chunk)
+        cleaned = processed_movies.to_frame()
+
+    return chunk_number, cleaned, dropped_count, time.perf_counter() - start
+
+
+class ParallelCleaner:
+    """Clean the merged DataFrame in chunks across a pool of worker processes."""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 5000, mode: str = 'object'):
+        if mode not in ('object', 'vectorized'):
+            raise ValueError(f"Unknown cleaning mode '{mode}'. Expected 'vectorized' or 'object'")
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.mode = mode
+        self.chunk_timings: List[Dict] = []
+
+    def clean(self, merged_df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """
+        Clean merged_df chunk by chunk in worker processes.
+
+        Returns the cleaned DataFrame in the original row order and the number of rows dropped.
+        Per-chunk timings are kept in chunk_timings.
+        """
+        chunks = [merged_df.iloc[start:start + self.chunk_size]
+                  for start in range(0, len(merged_df), self.chunk_size)]
+        self.chunk_timings = []
+
+        logger.info(f"Cleaning {len(merged_df)} rows in {len(chunks)} chunks of up to {self.chunk_size} "
+                    f"rows with {self.workers} worker processes ({self.mode} mode)")
+
+        results = []
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            # map yields results in submission order, so chunks come back in row order
+            for chunk_number, cleaned, dropped_count, seconds in executor.map(
+                    _clean_chunk, range(len(chunks)), chunks, [self.mode] * len(chunks)):
+                rows = len(chunks[chunk_number])
+                self.chunk_timings.append({
+                    'chunk': chunk_number,
+                    'rows': rows,
+                    'cleaned': len(cleaned),
+                    'dropped': dropped_count,
+                    'seconds': round(seconds, 4)
+                })
+                logger.info(f"Chunk {chunk_number + 1}/{len(chunks)}: {rows} rows cleaned in {seconds:.2f}s "
+                            f"({rows / seconds if seconds else 0:.0f} rows/s), dropped {dropped_count}")
+                results.append(cleaned)
+
+        dropped_total = sum(timing['dropped'] for timing in self.chunk_timings)
+        non_empty = [cleaned for cleaned in results if not cleaned.empty]
+        if not non_empty:
+            return pd.DataFrame(columns=OUTPUT_COLUMNS), dropped_total
+
+        return pd.concat(non_empty, ignore_index=True), dropped_total
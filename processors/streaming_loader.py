@@ -0,0 +1,188 @@
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.id_sanitizer import ID_REJECTION_REASONS, sanitize_ids
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ('main', 'extended', 'ratings')
+
+
+def iter_json_array(path: str, block_size: int = 1 << 20) -> Iterator:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in blocks of block_size characters, so memory stays bounded by the
+    largest single element. Python's json accepts the NaN/Infinity literals found in
+    ratings.json, so they decode to float('nan') as with json.load.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+
+    with open(path, 'r') as file:
+        while True:
+            # Skip whitespace and separators between elements
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+
+            if pos < len(buffer) and not started:
+                if buffer[pos] != '[':
+                    raise ValueError(f"{path} does not contain a JSON array")
+                started = True
+                pos += 1
+                continue
+
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+
+            if pos < len(buffer):
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                    # A value that runs to the end of the buffer may continue in the next block
+                    if end < len(buffer) or eof:
+                        yield element
+                        pos = end
+                        continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+            if eof:
+                if not started:
+                    raise ValueError(f"{path} does not contain a JSON array")
+                raise ValueError(f"Unexpected end of file in {path}")
+
+            block = file.read(block_size)
+            eof = not block
+            buffer = buffer[pos:] + block
+            pos = 0
+
+
+def flatten_ratings(ratings_df: pd.DataFrame) -> pd.DataFrame:
+    """Flatten the nested ratings_summary column into avg_rating, total_ratings and std_dev."""
+    if 'ratings_summary' not in ratings_df.columns:
+        return ratings_df
+
+    ratings_summary_df = pd.json_normalize(ratings_df['ratings_summary'])
+    ratings_summary_df['movie_id'] = ratings_df['movie_id'].to_numpy()
+    ratings_summary_df['last_rated'] = ratings_df['last_rated'].to_numpy()
+    return ratings_summary_df
+
+
+class StreamingLoader:
+    """
+    Partition the three input sources by cleaned movie id with bounded memory.
+
+    The CSVs are read in chunks and ratings.json is parsed element by element. Every row
+    is spilled to one of `partitions` files on disk according to its cleaned id, so all
+    rows for a movie end up in the same partition. Iterating the loader then yields one
+    (main, extended, ratings) triple per partition, each small enough to merge in memory.
+    """
+
+    def __init__(self, chunk_size: int = 50000, partitions: int = 16, spill_dir: Optional[str] = None):
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_size}")
+        if partitions <= 0:
+            raise ValueError(f"Partition count must be positive: {partitions}")
+
+        self.chunk_size = chunk_size
+        self.partitions = partitions
+        self.spill_dir = spill_dir
+        self.rows_read: Dict[str, int] = {source: 0 for source in SOURCES}
+        self.id_rejections: Dict[str, Dict[str, int]] = {
+            source: {reason: 0 for reason in ID_REJECTION_REASONS} for source in SOURCES
+        }
+        self.columns: Dict[str, List[str]] = {source: [] for source in SOURCES}
+
+    def _spill(self, directory: str, source: str, chunk: pd.DataFrame, id_col: str):
+        """Append each row of chunk to the spill file of its partition."""
+        self.rows_read[source] += len(chunk)
+        if not self.columns[source]:
+            self.columns[source] = list(chunk.columns)
+        ids, rejections = sanitize_ids(chunk[id_col])
+        for reason, count in rejections.items():
+            self.id_rejections[source][reason] += count
+
+        # Rows without a usable id are dropped by the merge anyway
+        valid = ids.notna().to_numpy()
+        chunk = chunk[valid]
+        partition = ids[valid].astype('int64').to_numpy() % self.partitions
+
+        for number, part in chunk.groupby(partition, sort=False):
+            with open(os.path.join(directory, f"{source}_{number}.pkl"), 'ab') as file:
+                pickle.dump(part, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read_spill(directory: str, source: str, number: int) -> Optional[pd.DataFrame]:
+        """Load every chunk spilled for one source and partition, in the order they were written."""
+        path = os.path.join(directory, f"{source}_{number}.pkl")
+        if not os.path.exists(path):
+            return None
+
+        parts: List[pd.DataFrame] = []
+        with open(path, 'rb') as file:
+            while True:
+                try:
+                    parts.append(pickle.load(file))
+                except EOFError:
+                    break
+        return pd.concat(parts, ignore_index=True)
+
+    def _iter_ratings_chunks(self, ratings_json_path: str) -> Iterator[pd.DataFrame]:
+        """Yield flattened ratings DataFrames of up to chunk_size records."""
+        records = []
+        for record in iter_json_array(ratings_json_path):
+            records.append(record)
+            if len(records) >= self.chunk_size:
+                yield flatten_ratings(pd.DataFrame(records))
+                records = []
+        if records:
+            yield flatten_ratings(pd.DataFrame(records))
+
+    def iter_partitions(self, main_csv_path: str, extended_csv_path: str,
+                        ratings_json_path: str) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """
+        Yield (main, extended, ratings) frames for each non-empty partition.
+
+        IDs are read as strings so every chunk compares them the same way in the merge;
+        the other columns are typed per chunk, as pandas does for large files.
+        """
+        directory = tempfile.mkdtemp(prefix='movie_stream_', dir=self.spill_dir)
+        try:
+            logger.info(f"Partitioning inputs into {self.partitions} partitions "
+                        f"(chunks of {self.chunk_size} rows, spill directory {directory})")
+
+            for source, path in (('main', main_csv_path), ('extended', extended_csv_path)):
+                logger.info(f"Streaming {source} CSV from {path}")
+                for chunk in pd.read_csv(path, chunksize=self.chunk_size, dtype={'id': str}):
+                    self._spill(directory, source, chunk, 'id')
+
+            logger.info(f"Streaming ratings JSON from {ratings_json_path}")
+            for chunk in self._iter_ratings_chunks(ratings_json_path):
+                if 'movie_id' in chunk.columns:
+                    self._spill(directory, 'ratings', chunk, 'movie_id')
+
+            logger.info(f"Rows read: {self.rows_read}")
+            for source, rejections in self.id_rejections.items():
+                rejected = {reason: count for reason, count in rejections.items() if count}
+                if rejected:
+                    logger.info(f"{source}: skipped {sum(rejected.values())} rows with invalid ids: {rejected}")
+
+            for number in range(self.partitions):
+                frames = [self._read_spill(directory, source, number) for source in SOURCES]
+                if all(frame is None for frame in frames):
+                    continue
+                yield tuple(frame if frame is not None else pd.DataFrame(columns=self.columns[source])
+                            for source, frame in zip(SOURCES, frames))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
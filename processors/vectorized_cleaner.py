@@ -0,0 +1,292 @@
+import pandas as pd
+import numpy as np
+from typing import Callable, Tuple
+import logging
+
+from dateutil import tz
+from pandas.api.types import is_integer_dtype
+
+from models.movie import Movie
+from models.rating import Rating
+from processors.date_normalizer import normalize_dates
+from utils.iso_mapper import ISOMapper
+from utils.json_tokenizer import NAME_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Bare Movie used to run the per-value reference cleaner on the rare values the
+# column-wise rules cannot decide (unusual numeric spellings)
+_REFERENCE_MOVIE = Movie.__new__(Movie)
+_REFERENCE_RATING = Rating.__new__(Rating)
+
+TEXT_STRIP_PATTERN = r'[^\w\s\-\':.,!?()\[\]{}]'
+FILE_EXTENSION_PATTERN = r'\.(?:jpg|png|gif|pdf)'
+
+# datetime.fromtimestamp overflows outside time_t; pandas datetimes stop around 2262
+TIME_T_MIN, TIME_T_MAX = -2 ** 63, 2 ** 63
+PANDAS_MAX_SECONDS = pd.Timestamp.max.value // 10 ** 9
+
+OUTPUT_COLUMNS = [
+    'id', 'title', 'release_date', 'genres', 'production_companies',
+    'production_countries', 'spoken_languages', 'budget', 'revenue',
+    'avg_rating', 'total_ratings', 'std_dev', 'last_rated'
+]
+
+
+def _column(df: pd.DataFrame, name: str, default) -> pd.Series:
+    """Return df[name], or a column of default values when it is absent (like row.get)."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def _reference_financial(value: str) -> float:
+    """Movie._clean_financial_data for one value; inf where it overflows (the per-row path drops those rows)."""
+    try:
+        return _REFERENCE_MOVIE._clean_financial_data(value)
+    except OverflowError:
+        return np.inf
+
+
+def _numeric(df: pd.DataFrame, name: str) -> pd.Series:
+    """df[name] as float64 (unparseable values become NaN), or all NaN when the column is absent."""
+    if name not in df.columns:
+        return pd.Series(np.nan, index=df.index)
+    return pd.to_numeric(df[name], errors='coerce').astype('float64')
+
+
+def _reference_timestamp(seconds: float):
+    """Rating._clean_timestamp for one value; None where it overflows."""
+    try:
+        return _REFERENCE_RATING._clean_timestamp(seconds)
+    except OverflowError:
+        return None
+
+
+def _round_like_python(values: pd.Series, digits: int) -> pd.Series:
+    """
+    Round with Python's round() semantics, once per distinct value.
+    np.round scales by 10**digits first and can land on the other side of a half.
+    """
+    uniques, inverse = np.unique(values.to_numpy(dtype='float64'), return_inverse=True)
+    rounded = np.array([round(float(value), digits) for value in uniques], dtype='float64')
+    return pd.Series(rounded[inverse.ravel()], index=values.index)
+
+
+def _object_array(items) -> np.ndarray:
+    """Build a 1-D object array without numpy unpacking list elements into extra dimensions."""
+    items = list(items)
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array
+
+
+class VectorizedMovieCleaner:
+    """
+    Column-wise cleaning engine.
+
+    Applies the same rules as Movie and Rating, and the ISOMapper country and language
+    parsers, to whole columns of the merged DataFrame instead of one row at a time.
+    """
+
+    @staticmethod
+    def clean_text(values: pd.Series) -> pd.Series:
+        """Column-wise Movie._clean_text."""
+        text = (
+            values.astype(str)
+            .str.strip()
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.replace('"', "'", regex=False)
+            .str.replace(TEXT_STRIP_PATTERN, '', regex=True)
+        )
+        return text.where(values.notna(), '')
+
+    @staticmethod
+    def standardize_dates(values: pd.Series) -> pd.Series:
+        """Column-wise Movie._standardize_date. Returns 'YYYY-MM-DD' strings or None."""
+        dates, counts = normalize_dates(values)
+        taken = ', '.join(f"{path}={count}" for path, count in counts.items() if count)
+        logger.info(f"Release dates by parse path: {taken or 'none'}")
+        return dates
+
+    @staticmethod
+    def clean_financial(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Column-wise Movie._clean_financial_data.
+
+        Returns the cleaned int64 values and a mask of infinite values, which the
+        per-row path cannot convert and therefore drops.
+        """
+        text = values.astype(str).str.strip()
+        present = values.notna() & (text != '')
+        text = text.str.replace(',', '', regex=False).str.replace('$', '', regex=False)
+        file_like = text.str.contains(FILE_EXTENSION_PATTERN + '$', case=False, regex=True)
+
+        candidates = present & ~file_like
+        numbers = pd.to_numeric(text.where(candidates), errors='coerce').astype('float64')
+
+        # Spellings float() accepts but to_numeric does not go through the reference cleaner
+        undecided = candidates & numbers.isna() & (text.str.lower() != 'nan')
+        if undecided.any():
+            numbers[undecided] = [_reference_financial(value) for value in text[undecided]]
+
+        infinite = pd.Series(np.isinf(numbers.to_numpy()), index=values.index)
+        numbers = np.trunc(numbers.where(~infinite))
+        numbers = numbers.where(numbers >= 0, 0).fillna(0)
+        return numbers.astype('int64'), infinite
+
+    @staticmethod
+    def parse_flexible_field(values: pd.Series) -> pd.Series:
+        """Column-wise Movie._parse_flexible_field. Returns a Series of lists."""
+        values = values.reset_index(drop=True)
+        parsed = pd.Series(dtype=object)
+
+        # Already-parsed lists only need each name cleaned
+        is_list = values.map(lambda value: isinstance(value, list)).to_numpy(dtype=bool)
+        if is_list.any():
+            items = VectorizedMovieCleaner.clean_text(values[is_list].explode())
+            parsed = items[items != ''].groupby(level=0).agg(list)
+
+        text = values[~is_list & values.notna().to_numpy()].astype(str).str.strip()
+        text = text[text != '']
+
+        # JSON-like values: collect every 'name' entry
+        json_like = text.str.startswith('[') & text.str.endswith(']') & text.str.contains('[\'"]', regex=True)
+        if json_like.any():
+            matches = text[json_like].str.extractall(NAME_PATTERN)
+            if not matches.empty:
+                names = VectorizedMovieCleaner.clean_text(matches[0].fillna(matches[1]).droplevel(1))
+                names = names[names != '']
+                parsed = pd.concat([parsed, names.groupby(level=0).agg(list)])
+
+        # Everything else (including JSON-like values without names) is comma-separated
+        comma = text[~text.index.isin(parsed.index)]
+        if not comma.empty:
+            items = comma.str.strip('[]').str.split(',').explode()
+            items = items.str.strip().str.strip('"\'')
+            items = VectorizedMovieCleaner.clean_text(items[items.str.len() > 1])
+            parsed = pd.concat([parsed, items.groupby(level=0).agg(list)])
+
+        result = _object_array([] for _ in range(len(values)))
+        if not parsed.empty:
+            result[parsed.index.to_numpy()] = _object_array(parsed.to_numpy())
+        return pd.Series(result, dtype=object)
+
+    @staticmethod
+    def map_unique(values: pd.Series, func: Callable) -> pd.Series:
+        """Apply a per-value cleaner once per distinct value and broadcast the results."""
+        values = values.reset_index(drop=True)
+        result = np.empty(len(values), dtype=object)
+
+        is_list = values.map(lambda value: isinstance(value, list)).to_numpy(dtype=bool)
+        if is_list.any():
+            result[is_list] = _object_array(func(value) for value in values[is_list])
+
+        codes, uniques = pd.factorize(values[~is_list])
+        # Slot -1 (missing values) maps to the cleaner's result for NaN
+        mapped = _object_array([func(value) for value in uniques] + [func(np.nan)])
+        result[~is_list] = mapped[codes]
+
+        return pd.Series(result, dtype=object)
+
+    @staticmethod
+    def clean_ratings(df: pd.DataFrame) -> pd.DataFrame:
+        """Column-wise Rating cleaning for avg_rating, total_ratings, std_dev and last_rated."""
+        def numeric(col):
+            return _numeric(df, col)
+
+        avg_rating = numeric('avg_rating')
+        avg_rating = _round_like_python(avg_rating.where((avg_rating >= 0) & (avg_rating <= 10), 0.0), 2)
+
+        total_ratings = np.trunc(numeric('total_ratings'))
+        total_ratings = total_ratings.where(np.isfinite(total_ratings), 0).clip(lower=0).astype('int64')
+
+        std_dev = numeric('std_dev')
+        std_dev = _round_like_python(std_dev.clip(lower=0), 4).where(std_dev.notna() & (total_ratings > 1), 0.0)
+
+        if 'last_rated' in df.columns and pd.api.types.is_datetime64_any_dtype(df['last_rated']):
+            # Typed loads hold last_rated as a naive UTC datetime
+            moments = df['last_rated'].dt.floor('s').dt.tz_localize('UTC')
+            timestamps, beyond_pandas = None, pd.Series(False, index=df.index)
+        else:
+            timestamps = np.trunc(numeric('last_rated'))
+            beyond_pandas = timestamps.abs() > PANDAS_MAX_SECONDS
+            moments = pd.to_datetime(timestamps.where(~beyond_pandas), unit='s', utc=True, errors='coerce')
+        # Rating uses datetime.fromtimestamp, i.e. the machine's local time zone
+        local = moments.dt.tz_convert(tz.tzlocal()).dt.strftime('%Y-%m-%d %H:%M:%S')
+        last_rated = local.astype(object).where(moments.notna(), None)
+        if beyond_pandas.any():
+            # Rare far-future or far-past timestamps datetime can still represent
+            last_rated[beyond_pandas] = [_reference_timestamp(value) for value in timestamps[beyond_pandas]]
+
+        return pd.DataFrame({
+            'avg_rating': avg_rating,
+            'total_ratings': total_ratings,
+            'std_dev': std_dev,
+            'last_rated': last_rated
+        })
+
+    @staticmethod
+    def unconvertible_ratings(df: pd.DataFrame) -> pd.Series:
+        """
+        Rows Rating cannot clean: an infinite total_ratings or last_rated, or a last_rated
+        outside time_t, raise OverflowError there and the per-row path skips the row.
+        """
+        unconvertible = pd.Series(np.isinf(_numeric(df, 'total_ratings').to_numpy()), index=df.index)
+        if 'last_rated' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['last_rated']):
+            timestamps = np.trunc(_numeric(df, 'last_rated'))
+            unconvertible |= (timestamps < TIME_T_MIN) | (timestamps >= TIME_T_MAX)
+        return unconvertible
+
+    @classmethod
+    def clean(cls, merged_df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """
+        Clean the merged DataFrame column by column.
+
+        Returns the cleaned DataFrame (same columns and row order as the per-row path)
+        and the number of rows dropped as invalid.
+        """
+        df = merged_df.reset_index(drop=True)
+
+        # Same validity rules as Movie.__init__: date-like, non-numeric or non-positive IDs,
+        # and budgets that hold file names, drop the whole row
+        raw_ids = _column(df, 'id', 0)
+        if is_integer_dtype(raw_ids):
+            # IDs sanitized at load time only need the positivity check
+            ids = raw_ids.astype('float64')
+        else:
+            id_text = raw_ids.astype(str).str.strip()
+            date_like = id_text.str.contains('/', regex=False) | id_text.str.contains('-', regex=False)
+            ids = np.trunc(pd.to_numeric(id_text.where(~date_like), errors='coerce').astype('float64'))
+        valid = ids.notna() & np.isfinite(ids) & (ids > 0)
+
+        budget_raw = _column(df, 'budget', 0)
+        budget_file = budget_raw.astype(str).str.strip().str.lower().str.contains(FILE_EXTENSION_PATTERN, regex=True)
+        valid &= ~budget_file
+
+        budget, budget_infinite = cls.clean_financial(budget_raw)
+        revenue, revenue_infinite = cls.clean_financial(_column(df, 'revenue', 0))
+        valid &= ~(budget_infinite | revenue_infinite | cls.unconvertible_ratings(df))
+
+        keep = valid.to_numpy()
+        dropped_count = int((~keep).sum())
+        df = df[keep].reset_index(drop=True)
+
+        cleaned = pd.DataFrame({
+            'id': ids[keep].astype('int64').to_numpy(),
+            'title': cls.clean_text(_column(df, 'title', '')).to_numpy(),
+            'release_date': cls.standardize_dates(_column(df, 'release_date', '')).to_numpy(),
+            'genres': cls.parse_flexible_field(_column(df, 'genres', '')).to_numpy(),
+            'production_companies': cls.parse_flexible_field(_column(df, 'production_companies', '')).to_numpy(),
+            'production_countries': cls.map_unique(_column(df, 'production_countries', ''), ISOMapper.clean_and_map_countries).to_numpy(),
+            'spoken_languages': cls.map_unique(_column(df, 'spoken_languages', ''), ISOMapper.clean_and_map_languages).to_numpy(),
+            'budget': budget[keep].to_numpy(),
+            'revenue': revenue[keep].to_numpy(),
+        })
+
+        ratings = cls.clean_ratings(df)
+        for col in ['avg_rating', 'total_ratings', 'std_dev', 'last_rated']:
+            cleaned[col] = ratings[col].to_numpy()
+
+        return cleaned[OUTPUT_COLUMNS], dropped_count
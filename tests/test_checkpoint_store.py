@@ -0,0 +1,44 @@
+import sqlite3
+
+from utils.checkpoint_store import LOAD_CHUNK_SIZE, FetchCheckpoint
+
+
+def test_load_returns_only_wanted_ids_across_chunks(tmp_path):
+    store = FetchCheckpoint(str(tmp_path / 'checkpoint.sqlite'))
+    total = LOAD_CHUNK_SIZE * 2 + 50
+    store.save_batch(0, [(movie_id, {'id': movie_id}) for movie_id in range(1, total + 1)], 'basic')
+
+    wanted = list(range(1, total + 1, 2)) + [total + 10]
+    loaded = store.load(wanted, 'basic')
+
+    assert sorted(loaded) == list(range(1, total + 1, 2))
+    assert loaded[LOAD_CHUNK_SIZE + 1] == {'id': LOAD_CHUNK_SIZE + 1}
+    store.close()
+
+
+def test_results_are_kept_per_profile(tmp_path):
+    store = FetchCheckpoint(str(tmp_path / 'checkpoint.sqlite'))
+    store.save_batch(0, [(862, {'title': 'Toy Story'})], 'basic')
+
+    # A run resumed with another profile must fetch again rather than reuse the basic result
+    assert store.load([862], 'analytics') == {}
+
+    store.save_batch(1, [(862, {'title': 'Toy Story', 'credits': {'cast': []}})], 'analytics')
+    assert store.load([862], 'basic') == {862: {'title': 'Toy Story'}}
+    assert store.load([862], 'analytics') == {862: {'title': 'Toy Story', 'credits': {'cast': []}}}
+    assert store.count() == 2
+    store.close()
+
+
+def test_store_without_profiles_is_discarded(tmp_path):
+    path = str(tmp_path / 'checkpoint.sqlite')
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE fetched (movie_id INTEGER PRIMARY KEY, batch INTEGER NOT NULL, '
+                     'data TEXT NOT NULL, fetched_at REAL NOT NULL)')
+        conn.execute("INSERT INTO fetched VALUES (862, 0, '{}', 0)")
+    conn.close()
+
+    store = FetchCheckpoint(path)
+    assert store.load([862], 'basic') == {}
+    assert store.count() == 0
+    store.close()
@@ -0,0 +1,83 @@
+"""
+Parity of the vectorized cleaner with the per-row Movie/Rating reference (clean_rows_with_objects).
+
+Each case is a small merged-like frame of awkward inputs for one group of columns; the
+other columns get plain valid values. Both cleaners must produce the same frame.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from processors.object_cleaner import clean_rows_with_objects
+from processors.vectorized_cleaner import VectorizedMovieCleaner
+
+DEFAULT_ROW = {
+    'id': 1, 'title': 'Title', 'release_date': '1995-10-30', 'genres': 'Drama',
+    'production_companies': 'Pixar', 'production_countries': 'US', 'spoken_languages': 'en',
+    'budget': 1000, 'revenue': 2000, 'avg_rating': 3.5, 'total_ratings': 10, 'std_dev': 0.5,
+    'last_rated': 1475783711,
+}
+
+
+def _frame(column: str, values: list, **other_columns) -> pd.DataFrame:
+    """One row per value of column (ids 1..n unless column is 'id'), other columns from DEFAULT_ROW."""
+    rows = []
+    for position, value in enumerate(values):
+        row = dict(DEFAULT_ROW, id=position + 1, **{name: other[position] for name, other in other_columns.items()})
+        row[column] = value
+        rows.append(row)
+    return pd.DataFrame(rows, columns=list(DEFAULT_ROW))
+
+
+CASES = {
+    'dates': _frame('release_date', [
+        '30/10/1995', '10/30/1995', '1995-10-30', '30-10-1995', '1995/10/30', '30.10.1995',
+        '2000', 'March 2004', 'sometime in 1987', 'not a date', '', '   ', None, np.nan, '31/02/1999',
+    ]),
+    'financial': _frame('budget', [
+        '$30,000,000', '6.3e7', '  1,5  ', '1.999', '-5', '0', '', None, np.nan, 'poster.JPG',
+        '12abc', 'nan', 'inf', '-inf', '1e400', 30000000.7, -2.5, 7,
+    ], revenue=['2.9', '$1', '', None, 'x.pdf', 'abc', '1e3', '-0', '12', '3', 0, 1, 2, 3, 4, 5, 6, 7]),
+    'list_fields': _frame('genres', [
+        "[{'id': 16, 'name': 'Animation'}, {'id': 35, 'name': 'Comedy'}]", "['Drama', 'Comedy']",
+        'Action, Sci-Fi', 'a, bc', '[]', '', None, np.nan, ['Drama', ' Crime  '], [],
+        '[{"name": "Quoted \\"x\\""}]', "[{'name': ''}]", 'Sci-Fi & Fantasy',
+    ], production_companies=[
+        'Pixar, Disney', "[{'name': 'A24', 'id': 41077}]", '', None, np.nan, [], ['Ghibli'],
+        '[]', 'x', "['Lucasfilm']", "[{'id': 1}]", 'Warner Bros.', '  ',
+    ], production_countries=[
+        "[{'iso_3166_1': 'US', 'name': 'United States of America'}]", 'US, GB', 'France', '', None,
+        np.nan, '[{"iso_3166_1": "DE"}]', 'xx', 'United Kingdom', 'JP', [], "['FR']", 'us',
+    ], spoken_languages=[
+        "[{'iso_639_1': 'en', 'name': 'English'}]", 'en', 'fr, de', '', None, np.nan,
+        '[{"iso_639_1": "ja"}]', 'English', 'xx', 'ES', [], "['it']", 'zh',
+    ]),
+    'ratings': _frame('avg_rating', [
+        3.87, '4.2', np.nan, np.inf, -np.inf, 11, -1, 2.675, 'x', None, 0, 10, 5.555,
+    ], total_ratings=[247, '10', np.nan, np.inf, 3, -3, 1, 3.7, 'x', None, 1, 0, 2],
+        std_dev=[0.959, '1.25', np.nan, -np.inf, np.inf, 0.5, 2.0, 0.12345, 'x', None, 1, 0.1, -0.5],
+        last_rated=[1475783711, '1475783711', np.nan, np.inf, 1e20, 0, -1, 'yesterday', None, 1e10, 1e12, -1e10, '']),
+    'ids': _frame('id', [
+        862, '603', '12.0', ' 42 ', '1995-10-30', '30/10/1995', 'abc', -5, 0, '0', 'poster.jpg', None, np.nan,
+        7.0, '1e3', '-12', 'inf',
+    ]),
+}
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_vectorized_matches_object_reference(case):
+    merged = CASES[case]
+    reference, _ = clean_rows_with_objects(merged)
+    vectorized, _ = VectorizedMovieCleaner.clean(merged)
+
+    pd.testing.assert_frame_equal(vectorized.reset_index(drop=True), reference.to_frame())
+
+
+def test_all_cases_together():
+    # One frame mixing every case, so column dtypes see the awkward values side by side
+    merged = pd.concat(CASES.values(), ignore_index=True)
+    merged['id'] = merged['id'].astype(object)
+    reference, _ = clean_rows_with_objects(merged)
+    vectorized, _ = VectorizedMovieCleaner.clean(merged)
+
+    pd.testing.assert_frame_equal(vectorized.reset_index(drop=True), reference.to_frame())
@@ -0,0 +1,45 @@
+"""
+Worst-case request counts of the TMDb fetchers against the stub server answering 503.
+
+Each failure kind has a single retry owner (see TMDbFetcher.fetch_movie_details and
+AsyncTMDbFetcher._get), so a failing movie costs a bounded number of requests.
+"""
+import asyncio
+
+import pytest
+
+from benchmarks.stub_tmdb_server import StubTMDbServer
+from config import MAX_RETRIES, TMDB_TRANSPORT_RETRIES
+from tmdb_fetcher import TMDbFetcher
+from utils.rate_limiter import TokenBucket
+
+
+def _limiter():
+    return TokenBucket(1000)
+
+
+def test_threaded_fetcher_leaves_5xx_to_the_transport():
+    with StubTMDbServer(latency=0, error_status=503) as server:
+        fetcher = TMDbFetcher(base_url=server.base_url, rate_limiter=_limiter(), cache=False)
+        assert fetcher.fetch_movie_details(862) == {}
+        assert server.request_count == 1 + TMDB_TRANSPORT_RETRIES
+
+
+def test_threaded_fetcher_success_is_one_request():
+    with StubTMDbServer(latency=0) as server:
+        fetcher = TMDbFetcher(base_url=server.base_url, rate_limiter=_limiter(), cache=False)
+        assert fetcher.fetch_movie_details(862)['title'] == 'Stub Movie 862'
+        assert server.request_count == 1
+
+
+def test_async_fetcher_shares_one_attempt_budget():
+    pytest.importorskip('aiohttp')
+    from async_tmdb_fetcher import AsyncTMDbFetcher
+
+    async def fetch(base_url):
+        async with AsyncTMDbFetcher(base_url=base_url, rate_limiter=_limiter(), cache=False) as fetcher:
+            return await fetcher.fetch_movie_details(862)
+
+    with StubTMDbServer(latency=0, error_status=503) as server:
+        assert asyncio.run(fetch(server.base_url)) == {}
+        assert server.request_count == MAX_RETRIES
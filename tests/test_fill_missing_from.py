@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from processors.indexed_merge import MERGE_ENGINES, fill_missing_from
+
+BASE = pd.Series([1, pd.NA, pd.NA, 4], dtype='Int32')
+
+
+@pytest.mark.parametrize('extra, dtype, expected', [
+    (pd.Series([None, '1,000,000', None, 'x'], dtype=object), object, [1, '1,000,000', None, 4]),
+    (pd.Series([np.nan, 7.5, np.nan, 1.0]), 'Float64', [1.0, 7.5, None, 4.0]),
+    # Must widen rather than wrap the value into int32
+    (pd.Series([pd.NA, 2 ** 40, pd.NA, 1], dtype='Int64'), 'Int64', [1, 2 ** 40, None, 4]),
+    (pd.Series([pd.NA, 5, pd.NA, 1], dtype='Int32'), 'Int32', [1, 5, None, 4]),
+])
+def test_fill_missing_from_mixed_dtypes(extra, dtype, expected):
+    filled = fill_missing_from(BASE, extra)
+    assert filled.dtype == dtype
+    assert [None if pd.isna(value) else value for value in filled] == expected
+
+
+@pytest.mark.parametrize('engine', MERGE_ENGINES)
+def test_merge_engines_fill_nullable_int_from_object(engine):
+    main_df = pd.DataFrame({'id': pd.array([1, 2, 3], dtype='Int32'), 'title': ['A', 'B', 'C'],
+                            'budget': pd.array([10, pd.NA, pd.NA], dtype='Int32')})
+    extended_df = pd.DataFrame({'id': pd.array([2, 3], dtype='Int32'), 'budget': ['1,000,000', None]})
+    ratings_df = pd.DataFrame({'movie_id': pd.array([1], dtype='Int32'),
+                               'avg_rating': np.array([3.5], dtype='float32')})
+
+    merged = EnhancedMovieDataProcessor()._merge_sources(main_df, extended_df, ratings_df, engine=engine)
+
+    budgets = merged.set_index('id')['budget']
+    assert budgets[1] == 10
+    assert budgets[2] == '1,000,000'
+    assert pd.isna(budgets[3])
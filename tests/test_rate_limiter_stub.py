@@ -0,0 +1,88 @@
+"""
+The adaptive rate limiter against the stub TMDb server's quota, plus its 429 handling in isolation.
+
+The stub answers 429 with Retry-After once more than rate_limit requests arrive in a
+one-second window; the limiter must pause for it, back off its rate, and let every
+request through in the end.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import time
+
+import pytest
+
+from benchmarks.stub_tmdb_server import StubTMDbServer
+from tmdb_fetcher import TMDbFetcher
+from utils.rate_limiter import AdaptiveRateLimiter, TokenBucket, parse_retry_after
+
+SERVER_QUOTA = 10
+START_RATE = 15
+
+
+def test_no_requests_dropped_and_rate_backs_off_after_429():
+    limiter = AdaptiveRateLimiter(START_RATE, START_RATE, min_rate=1, max_rate=START_RATE)
+    movie_ids = list(range(1, 31))
+
+    with StubTMDbServer(latency=0, rate_limit=SERVER_QUOTA) as server:
+        fetcher = TMDbFetcher(base_url=server.base_url, rate_limiter=limiter, cache=False)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(fetcher.fetch_movie_details, movie_ids))
+        throttled = server.throttled_count
+
+    stats = fetcher.rate_limit_stats()
+    assert [result['id'] for result in results] == movie_ids
+    assert stats['dropped'] == 0
+    # Starting above the quota must hit it, and each 429 must pause and slow the limiter
+    assert throttled >= 1
+    assert stats['throttle_events'] == throttled
+    assert stats['throttled_time'] > 0
+    assert stats['rate'] < START_RATE
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2', 2.0), (' 3.5 ', 3.5), ('-4', 0.0), ('0', 0.0), ('', None), (None, None), ('soon', None),
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+
+
+def test_429_pauses_for_retry_after_or_default():
+    limiter = TokenBucket(100, throttle_pause=0.5)
+    limiter.record_response(429, {'Retry-After': '3'})
+    assert 2.5 < limiter.metrics()['paused_for'] <= 3
+    assert not limiter.try_acquire()
+
+    limiter = TokenBucket(100, throttle_pause=0.5)
+    limiter.record_response(429, {})
+    assert 0 < limiter.metrics()['paused_for'] <= 0.5
+    assert limiter.metrics()['rate'] == 100  # a fixed bucket keeps its rate
+
+
+def test_aimd_decrease_and_recovery():
+    limiter = AdaptiveRateLimiter(20, min_rate=2, max_rate=30, increase=2, decrease=0.5)
+
+    limiter.record_response(429, {'Retry-After': '5'})
+    assert limiter.rate == 10
+    # 429s from requests already in flight during the pause only count, they don't back off again
+    limiter.record_response(429, {'Retry-After': '5'})
+    assert limiter.rate == 10
+    assert limiter.metrics()['throttle_events'] == 2
+
+    # With no pause running, every 429 halves the rate again, down to min_rate at most
+    limiter = AdaptiveRateLimiter(20, min_rate=2, max_rate=30, increase=2, decrease=0.5)
+    for _ in range(5):
+        limiter.record_response(429, {'Retry-After': '0'})
+    assert limiter.rate == 2
+
+    # Successes add back about `increase` requests/second per second of traffic, up to max_rate
+    for _ in range(40):
+        limiter.record_response(200, {})
+    assert 10 < limiter.rate < 30
+    for _ in range(1000):
+        limiter.record_response(200, {})
+    assert limiter.rate == 30
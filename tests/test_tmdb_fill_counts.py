@@ -0,0 +1,62 @@
+"""The threaded and async TMDB fills report API calls the same way: only calls that returned data."""
+import asyncio
+import logging
+
+import pandas as pd
+import pytest
+
+from benchmarks.stub_tmdb_server import StubTMDbServer
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from tmdb_fetcher import TMDbFetcher
+from utils.rate_limiter import TokenBucket
+
+MOVIES = 6
+
+
+class HalfEmptyFetcher(TMDbFetcher):
+    """Stub-backed fetcher for which even ids come back empty, as unknown ids and failures do."""
+
+    def fetch_movie_details(self, movie_id, append_to_response=None):
+        if movie_id % 2 == 0:
+            return {}
+        return super().fetch_movie_details(movie_id, append_to_response)
+
+
+def _processor(base_url: str) -> EnhancedMovieDataProcessor:
+    processor = EnhancedMovieDataProcessor()
+    processor.tmdb_fetcher = HalfEmptyFetcher(base_url=base_url, rate_limiter=TokenBucket(1000), cache=False)
+    processor.merged_df = pd.DataFrame({
+        'id': range(1, MOVIES + 1),
+        'title': [None] * MOVIES,
+        'genres': [None] * MOVIES,
+        'spoken_languages': [None] * MOVIES,
+    })
+    return processor
+
+
+def _fill_threaded(processor):
+    processor.fill_missing_with_tmdb(batch_size=4, checkpoint=False, profile='basic')
+
+
+def _fill_async(processor):
+    pytest.importorskip('aiohttp')
+    from async_tmdb_fetcher import AsyncTMDbFetcher
+
+    class HalfEmptyAsyncFetcher(AsyncTMDbFetcher):
+        async def fetch_movie_details(self, movie_id, append_to_response=None):
+            if movie_id % 2 == 0:
+                return {}
+            return await super().fetch_movie_details(movie_id, append_to_response)
+
+    fetcher = HalfEmptyAsyncFetcher(base_url=processor.tmdb_fetcher.base_url,
+                                    rate_limiter=processor.tmdb_fetcher.rate_limiter)
+    asyncio.run(processor.fill_missing_with_tmdb_async(batch_size=4, checkpoint=False, profile='basic',
+                                                       fetcher=fetcher))
+
+
+@pytest.mark.parametrize('fill', [_fill_threaded, _fill_async], ids=['threaded', 'async'])
+def test_api_calls_count_only_results_with_data(fill, caplog):
+    with StubTMDbServer(latency=0) as server, caplog.at_level(logging.INFO):
+        fill(_processor(server.base_url))
+
+    assert f"Updated {MOVIES // 2} movies with {MOVIES // 2} API calls." in caplog.text
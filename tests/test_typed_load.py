@@ -0,0 +1,59 @@
+"""
+Typed loading (utils.dtypes) must not change what the pipeline produces.
+
+The synthetic catalog's main CSV has purely numeric budgets while its extended CSV has
+'1,000,000' ones, so budget must stay as read in both sources for the merge to work.
+"""
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_catalog import generate_catalog
+from processors.enhanced_data_processor import EnhancedMovieDataProcessor
+from processors.indexed_merge import MERGE_ENGINES
+
+
+@pytest.fixture(scope='module')
+def catalog(tmp_path_factory):
+    paths = generate_catalog(1000, str(tmp_path_factory.mktemp('catalog')), seed=42)
+    assert (pd.read_csv(paths['extended'])['budget'] == '1,000,000').any()
+    return paths
+
+
+def _load_and_clean(paths, typed: bool, merge_engine: str, mode: str):
+    processor = EnhancedMovieDataProcessor()
+    merged = processor.load_and_merge_data(paths['main'], paths['extended'], paths['ratings'],
+                                           typed=typed, merge_engine=merge_engine).copy()
+    processor.clean_data_with_proper_methods(mode=mode)
+    return merged, processor.cleaned_df
+
+
+def _as_read(merged: pd.DataFrame) -> pd.DataFrame:
+    """The typed merge with last_rated back in Unix seconds, as the untyped load has it."""
+    merged = merged.copy()
+    merged['last_rated'] = merged['last_rated'].astype('int64').where(merged['last_rated'].notna()) // 10 ** 9
+    return merged
+
+
+@pytest.mark.parametrize('merge_engine', MERGE_ENGINES)
+@pytest.mark.parametrize('mode', ['vectorized', 'object'])
+def test_typed_load_matches_untyped(catalog, merge_engine, mode):
+    merged, cleaned = _load_and_clean(catalog, False, merge_engine, mode)
+    typed_merged, typed_cleaned = _load_and_clean(catalog, True, merge_engine, mode)
+
+    # Same values in compact dtypes (float32 ratings within the default tolerance)
+    pd.testing.assert_frame_equal(_as_read(typed_merged), merged, check_dtype=False, check_categorical=False)
+    pd.testing.assert_frame_equal(typed_cleaned, cleaned)
+
+
+def test_budget_kept_as_read_in_both_sources(catalog):
+    processor = EnhancedMovieDataProcessor()
+    main_df, extended_df, _ = processor._read_sources(catalog['main'], catalog['extended'], catalog['ratings'],
+                                                      typed=True)
+    untyped_main = pd.read_csv(catalog['main'])
+
+    # Main's budgets alone would convert, but not extended's, so neither is converted
+    assert main_df['budget'].dtype == untyped_main['budget'].dtype
+    assert extended_df['budget'].dtype == object
+    assert str(main_df['revenue'].dtype) == 'Int32'
+    assert isinstance(extended_df['genres'].dtype, pd.CategoricalDtype)
+    assert set(processor.memory_reports) == {'main CSV', 'extended CSV', 'ratings'}
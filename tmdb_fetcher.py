@@ -1,114 +1,231 @@
 import requests
-import time
+import threading
 from config import TMDB_API_KEY, TMDB_ACCESS_TOKEN, TMDB_BASE_URL, MAX_RETRIES, REQUEST_TIMEOUT, USE_BEARER_TOKEN
+from config import USE_TMDB_CACHE, TMDB_CACHE_PATH, TMDB_CACHE_TTL, TMDB_CACHE_NEGATIVE_TTL, TMDB_CACHE_MAX_ENTRIES
+from config import (TMDB_POOL_CONNECTIONS, TMDB_POOL_MAXSIZE, TMDB_TRANSPORT_RETRIES, TMDB_RETRY_BACKOFF,
+                    TMDB_COMPRESSION, TMDB_TOP_CAST, TMDB_CERTIFICATION_COUNTRY)
+from utils.http_session import ThreadLocalSessions, accept_encoding, build_adapter
 from utils.logger import log_error, log_info
+from utils.rate_limiter import tmdb_rate_limiter
+from utils.response_cache import ResponseCache
 
 class TMDbFetcher:
-    def __init__(self):
-        self.session = requests.Session()
+    # Sections appended to the details request for each enrichment profile (one request per movie)
+    ENRICHMENT_PROFILES = {
+        'basic': (),
+        'analytics': ('credits', 'keywords', 'release_dates'),
+    }
+    
+    def __init__(self, base_url=None, rate_limiter=None, cache=None, pool_maxsize=None, compression=None):
+        """
+        Args:
+            base_url: TMDb API root (defaults to TMDB_BASE_URL)
+            rate_limiter: Token bucket to draw from (defaults to the shared adaptive TMDB limiter)
+            cache: ResponseCache to use; None builds the default on-disk cache, False disables caching
+            pool_maxsize: Keep-alive connections kept open (defaults to TMDB_POOL_MAXSIZE);
+                should be at least the number of threads fetching at once
+            compression: Ask for gzip/brotli responses (defaults to TMDB_COMPRESSION)
+        """
+        self.base_url = base_url or TMDB_BASE_URL
+        # Shared bucket by default so every fetcher (and thread) draws from the same quota
+        self.rate_limiter = rate_limiter or tmdb_rate_limiter
+        
+        if cache is None and USE_TMDB_CACHE:
+            cache = ResponseCache(TMDB_CACHE_PATH, default_ttl=TMDB_CACHE_TTL, max_entries=TMDB_CACHE_MAX_ENTRIES)
+        self.cache = cache or None
+        
+        # One pooled adapter (keep-alive connections, transport retries, latency metrics) shared by
+        # per-thread sessions, so concurrent fetches reuse sockets without sharing a Session
+        self.adapter = build_adapter(TMDB_POOL_CONNECTIONS, pool_maxsize or TMDB_POOL_MAXSIZE,
+                                     TMDB_TRANSPORT_RETRIES, TMDB_RETRY_BACKOFF)
+        self.compression = TMDB_COMPRESSION if compression is None else compression
+        self.sessions = ThreadLocalSessions(self.adapter)
         self._setup_session()
     
+    @property
+    def session(self):
+        """The calling thread's requests.Session."""
+        return self.sessions.get()
+    
     def _setup_session(self):
         """Setup session with proper headers and authentication"""
         # Set default headers
-        self.session.headers.update({
+        self.sessions.update_headers({
             'User-Agent': 'Movie-Analytics-DataCleaner/1.0',
             'Accept': 'application/json',
+            'Accept-Encoding': accept_encoding(self.compression),
             'Content-Type': 'application/json;charset=utf-8'
         })
         
         # Configure authentication - Bearer token is preferred
-        if USE_BEARER_TOKEN and TMDB_ACCESS_TOKEN and TMDB_ACCESS_TOKEN != "YOUR_TMDB_ACCESS_TOKEN":
-            self.session.headers.update({
-                'Authorization': f'Bearer {TMDB_ACCESS_TOKEN}'
-            })
+        auth_headers = self._get_auth_headers()
+        if auth_headers:
+            self.sessions.update_headers(auth_headers)
             log_info("Using Bearer token authentication (recommended)")
         elif TMDB_API_KEY and TMDB_API_KEY != "YOUR_TMDB_API_KEY":
             log_info("Using API key authentication (legacy)")
         else:
             log_error("No valid TMDb authentication found! Please set TMDB_ACCESS_TOKEN or TMDB_API_KEY")
     
-    def _get_auth_params(self):
+    @staticmethod
+    def _get_auth_headers():
+        """Get the Authorization header for the (preferred) Bearer token method"""
+        if USE_BEARER_TOKEN and TMDB_ACCESS_TOKEN and TMDB_ACCESS_TOKEN != "YOUR_TMDB_ACCESS_TOKEN":
+            return {'Authorization': f'Bearer {TMDB_ACCESS_TOKEN}'}
+        return {}
+    
+    @staticmethod
+    def _get_auth_params():
         """Get authentication parameters for legacy API key method"""
         if not USE_BEARER_TOKEN and TMDB_API_KEY != "YOUR_TMDB_API_KEY":
             return {"api_key": TMDB_API_KEY}
         return {}
     
+    def _cache_get(self, key):
+        """Look up a cached response. Returns None on a miss or when caching is disabled."""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            log_error(f"Cache lookup failed for {key}: {e}")
+            return None
+    
+    def _cache_set(self, key, value, ttl=None):
+        """Store a response in the cache, if caching is enabled."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value, ttl=ttl)
+        except Exception as e:
+            log_error(f"Cache write failed for {key}: {e}")
+    
+    def cache_stats(self):
+        """Return cache hit/miss counters, or an empty dict when caching is disabled."""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def latency_stats(self):
+        """Return request counts, connection reuse and connect/TTFB/body latencies (see RequestMetrics)."""
+        return self.adapter.metrics.summary()
+    
+    def latency_histogram(self):
+        """Return request counts per total-latency bucket (see RequestMetrics.histogram)."""
+        return self.adapter.metrics.histogram()
+    
+    def rate_limit_stats(self):
+        """Return the rate limiter's current rate, throttled time and dropped request counts."""
+        return self.rate_limiter.metrics()
+    
+    def _get(self, url, params):
+        """
+        GET url through the shared rate limiter.
+        
+        Every response is reported back to the limiter. A 429 pauses the limiter (for every
+        thread) until its Retry-After, then the request is retried, up to MAX_RETRIES times.
+        Only 429s are retried here; connection errors, timeouts and 5xx are retried by the
+        transport adapter (see fetch_movie_details).
+        """
+        for attempt in range(MAX_RETRIES):
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            self.rate_limiter.record_response(response.status_code, response.headers)
+            if response.status_code != 429:
+                return response
+            log_error(f"TMDb API rate limit exceeded for {url} - waiting before retry (attempt {attempt + 1})")
+        
+        self.rate_limiter.record_drop()
+        return response
+    
+    def fetch_movie_profile(self, movie_id, profile='analytics'):
+        """
+        Fetch details plus the profile's extra sections in a single request.
+        
+        Args:
+            movie_id: The TMDb movie ID
+            profile: Key of ENRICHMENT_PROFILES; 'analytics' adds cast, directors,
+                keywords and certification to the cleaned details
+        """
+        if profile not in self.ENRICHMENT_PROFILES:
+            raise ValueError(f"Unknown enrichment profile '{profile}'. Expected one of {tuple(self.ENRICHMENT_PROFILES)}")
+        sections = self.ENRICHMENT_PROFILES[profile]
+        return self.fetch_movie_details(movie_id, append_to_response=','.join(sections) or None)
+    
     def fetch_movie_details(self, movie_id, append_to_response=None):
         """
         Fetch comprehensive movie details from TMDb API
         
+        Each failure kind is retried by one layer only: connection errors, timeouts and 5xx
+        by the transport (TMDB_TRANSPORT_RETRIES, exponential backoff), 429s by _get
+        (MAX_RETRIES, through the rate limiter). A movie therefore costs at most
+        MAX_RETRIES * (1 + TMDB_TRANSPORT_RETRIES) HTTP requests (9 with the defaults),
+        and that only when every throttled attempt first hits transport errors; a
+        failure with no retries left returns {}.
+        
         Args:
             movie_id: The TMDb movie ID
             append_to_response: Additional endpoints to append (e.g., "credits,videos,images")
         """
-        for attempt in range(MAX_RETRIES):
-            try:
-                url = f"{TMDB_BASE_URL}/movie/{movie_id}"
-                
-                # Build parameters
-                params = self._get_auth_params()
-                
-                # Add optional append_to_response for getting more data in one request
-                if append_to_response:
-                    params['append_to_response'] = append_to_response
-                
-                # Add language parameter for better localization
-                params['language'] = 'en-US'
-                
-                response = self.session.get(
-                    url, 
-                    params=params, 
-                    timeout=REQUEST_TIMEOUT
-                )
-                
-                # Handle specific HTTP status codes
-                if response.status_code == 401:
-                    log_error("TMDb API authentication failed - check your API key or access token")
-                    return {}
-                elif response.status_code == 404:
-                    log_error(f"Movie ID {movie_id} not found in TMDb")
-                    return {}
-                elif response.status_code == 429:
-                    log_error("TMDb API rate limit exceeded - waiting before retry")
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff for rate limits
-                        continue
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Process and clean the returned data
-                cleaned_data = self._clean_movie_data(data)
-                log_info(f"Successfully fetched data for movie ID: {movie_id}")
-                return cleaned_data
-                
-            except requests.exceptions.Timeout:
-                log_error(f"Timeout occurred for movie ID {movie_id} (attempt {attempt + 1})")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(1)
-                    continue
-                    
-            except requests.exceptions.ConnectionError:
-                log_error(f"Connection error for movie ID {movie_id} (attempt {attempt + 1})")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(2)
-                    continue
-                    
-            except requests.exceptions.RequestException as e:
-                log_error(f"Request failed for movie ID {movie_id} (attempt {attempt + 1}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(1)
-                    continue
-                    
-            except Exception as e:
-                log_error(f"Unexpected error for movie ID {movie_id}: {e}")
-                break
-        
-        log_error(f"All {MAX_RETRIES} attempts failed for movie ID {movie_id}")
+        cache_key = ResponseCache.make_key(f"movie/{movie_id}", language='en-US',
+                                           append_to_response=append_to_response)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._clean_movie_data(cached)
+        
+        try:
+            url = f"{self.base_url}/movie/{movie_id}"
+            
+            # Build parameters
+            params = self._get_auth_params()
+            
+            # Add optional append_to_response for getting more data in one request
+            if append_to_response:
+                params['append_to_response'] = append_to_response
+            
+            # Add language parameter for better localization
+            params['language'] = 'en-US'
+            
+            response = self._get(url, params)
+            
+            # Handle specific HTTP status codes
+            if response.status_code == 401:
+                log_error("TMDb API authentication failed - check your API key or access token")
+                return {}
+            elif response.status_code == 404:
+                log_error(f"Movie ID {movie_id} not found in TMDb")
+                # Remember misses too so unknown IDs are not re-requested every run
+                self._cache_set(cache_key, {}, ttl=TMDB_CACHE_NEGATIVE_TTL)
+                return {}
+            elif response.status_code == 429:
+                # _get already waited out every Retry-After it was given
+                log_error(f"TMDb API rate limit still exceeded for movie ID {movie_id} - dropping it")
+                return {}
+            
+            # A 5xx here has already been retried by the transport
+            response.raise_for_status()
+            data = response.json()
+            self._cache_set(cache_key, data)
+            
+            # Process and clean the returned data
+            cleaned_data = self._clean_movie_data(data)
+            log_info(f"Successfully fetched data for movie ID: {movie_id}")
+            return cleaned_data
+            
+        except requests.exceptions.Timeout:
+            log_error(f"Timeout occurred for movie ID {movie_id} after {TMDB_TRANSPORT_RETRIES} transport retries")
+            
+        except requests.exceptions.ConnectionError:
+            log_error(f"Connection error for movie ID {movie_id} after {TMDB_TRANSPORT_RETRIES} transport retries")
+            
+        except requests.exceptions.RequestException as e:
+            log_error(f"Request failed for movie ID {movie_id}: {e}")
+            
+        except Exception as e:
+            log_error(f"Unexpected error for movie ID {movie_id}: {e}")
+        
         return {}
     
-    def _clean_movie_data(self, data):
+    @staticmethod
+    def _clean_movie_data(data):
         """Clean and standardize TMDb movie data"""
         if not data:
             return {}
@@ -156,12 +273,60 @@ class TMDbFetcher:
         if 'spoken_languages' in data and data['spoken_languages']:
             cleaned['spoken_languages'] = [lang['english_name'] for lang in data['spoken_languages']]
         
+        # Sections added through append_to_response
+        if data.get('credits'):
+            cleaned.update(TMDbFetcher._clean_credits(data['credits']))
+        
+        if data.get('keywords'):
+            keywords = [keyword['name'] for keyword in data['keywords'].get('keywords', []) if keyword.get('name')]
+            if keywords:
+                cleaned['keywords'] = keywords
+        
+        if data.get('release_dates'):
+            certification = TMDbFetcher._pick_certification(data['release_dates'].get('results', []))
+            if certification:
+                cleaned['certification'] = certification
+        
+        return cleaned
+    
+    @staticmethod
+    def _clean_credits(credits):
+        """Top-billed cast names (in billing order) and director names from a credits section."""
+        cleaned = {}
+        
+        cast = sorted(credits.get('cast', []), key=lambda member: member.get('order', 0))
+        cast_names = [member['name'] for member in cast[:TMDB_TOP_CAST] if member.get('name')]
+        if cast_names:
+            cleaned['cast'] = cast_names
+        
+        directors = [member['name'] for member in credits.get('crew', [])
+                     if member.get('job') == 'Director' and member.get('name')]
+        if directors:
+            cleaned['directors'] = list(dict.fromkeys(directors))
+        
         return cleaned
     
+    @staticmethod
+    def _pick_certification(countries):
+        """Age certification for TMDB_CERTIFICATION_COUNTRY, preferring the theatrical release (type 3)."""
+        for country in countries:
+            if country.get('iso_3166_1') != TMDB_CERTIFICATION_COUNTRY:
+                continue
+            releases = sorted(country.get('release_dates', []), key=lambda release: release.get('type') != 3)
+            for release in releases:
+                if release.get('certification'):
+                    return release['certification']
+        return None
+    
     def search_movie(self, query, year=None, page=1):
         """Search for movies by title"""
+        cache_key = ResponseCache.make_key("search/movie", query=query, year=year, page=page, language='en-US')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            url = f"{TMDB_BASE_URL}/search/movie"
+            url = f"{self.base_url}/search/movie"
             params = self._get_auth_params()
             params.update({
                 'query': query,
@@ -172,10 +337,12 @@ class TMDbFetcher:
             if year:
                 params['year'] = year
                 
-            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._get(url, params)
             response.raise_for_status()
             
-            return response.json()
+            data = response.json()
+            self._cache_set(cache_key, data)
+            return data
             
         except Exception as e:
             log_error(f"Movie search failed for query '{query}': {e}")
@@ -183,23 +350,54 @@ class TMDbFetcher:
     
     def get_movie_credits(self, movie_id):
         """Get cast and crew information for a movie"""
+        cache_key = ResponseCache.make_key(f"movie/{movie_id}/credits", language='en-US')
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Credits already fetched as part of an enrichment profile need no request of their own
+        for sections in self.ENRICHMENT_PROFILES.values():
+            if 'credits' in sections:
+                profile = self._cache_get(ResponseCache.make_key(f"movie/{movie_id}", language='en-US',
+                                                                 append_to_response=','.join(sections)))
+                if profile and profile.get('credits'):
+                    return dict(profile['credits'], id=profile.get('id', movie_id))
+        
         try:
-            url = f"{TMDB_BASE_URL}/movie/{movie_id}/credits"
+            url = f"{self.base_url}/movie/{movie_id}/credits"
             params = self._get_auth_params()
             params['language'] = 'en-US'
             
-            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._get(url, params)
             response.raise_for_status()
             
-            return response.json()
+            data = response.json()
+            self._cache_set(cache_key, data)
+            return data
             
         except Exception as e:
             log_error(f"Failed to fetch credits for movie ID {movie_id}: {e}")
             return {}
 
-# Global instance
-tmdb_fetcher = TMDbFetcher()
+# Shared instance, built on first use: it opens the response cache and logs the auth method
+_shared_fetcher = None
+_shared_fetcher_lock = threading.Lock()
+
+def get_tmdb_fetcher():
+    """Return the shared TMDbFetcher, creating it on the first call."""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        with _shared_fetcher_lock:
+            if _shared_fetcher is None:
+                _shared_fetcher = TMDbFetcher()
+    return _shared_fetcher
+
+def __getattr__(name):
+    # Keeps `from tmdb_fetcher import tmdb_fetcher` working without building the fetcher at import
+    if name == 'tmdb_fetcher':
+        return get_tmdb_fetcher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def fetch_movie_details(movie_id):
     """Wrapper function for backward compatibility"""
-    return tmdb_fetcher.fetch_movie_details(movie_id)
\ No newline at end of file
+    return get_tmdb_fetcher().fetch_movie_details(movie_id)
\ No newline at end of file
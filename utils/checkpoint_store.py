@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Ids per SELECT ... IN (...) in load; stays under SQLite's host parameter limit (999 before 3.32)
+LOAD_CHUNK_SIZE = 900
+
+
+class FetchCheckpoint:
+    """
+    Durable record of TMDB results already fetched in a run, so an interrupted run can resume.
+
+    Results are stored per movie id and enrichment profile, together with the batch that
+    fetched them; a run resumed with another profile does not reuse results that lack (or
+    carry extra) appended sections. Each batch is written in a single SQLite transaction
+    (WAL journal, full sync), so a crash leaves either the whole batch or none of it on
+    disk, never a partial or corrupt store.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller must hold the lock)."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=FULL')
+            columns = [row[1] for row in self._conn.execute('PRAGMA table_info(fetched)')]
+            if columns and 'profile' not in columns:
+                # Stores written before results were keyed by profile cannot say what they hold
+                logger.warning(f"Discarding TMDB checkpoint {self.path}: written without enrichment profiles")
+                self._conn.execute('DROP TABLE fetched')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS fetched ('
+                'movie_id INTEGER NOT NULL, profile TEXT NOT NULL, batch INTEGER NOT NULL, '
+                'data TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (movie_id, profile))'
+            )
+            self._conn.commit()
+        return self._conn
+
+    def save_batch(self, batch_number: int, results: Iterable[Tuple[int, Dict]], profile: str):
+        """Record the (movie id, TMDB data) results of one batch, fetched with profile, atomically."""
+        now = time.time()
+        rows = [(int(movie_id), profile, batch_number, json.dumps(data), now) for movie_id, data in results]
+        if not rows:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO fetched (movie_id, profile, batch, data, fetched_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+
+    def load(self, movie_ids: Iterable[int], profile: str) -> Dict[int, Dict]:
+        """Return the results stored for profile for whichever of movie_ids have one."""
+        wanted = sorted({int(movie_id) for movie_id in movie_ids})
+        results = {}
+        with self._lock:
+            conn = self._connect()
+            # Look up only the wanted ids (through the primary key), a chunk at a time
+            for start in range(0, len(wanted), LOAD_CHUNK_SIZE):
+                chunk = wanted[start:start + LOAD_CHUNK_SIZE]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT movie_id, data FROM fetched WHERE profile = ? AND movie_id IN ({placeholders})',
+                    [profile, *chunk]
+                )
+                results.update((movie_id, json.loads(data)) for movie_id, data in rows)
+        return results
+
+    def completed_batches(self) -> List[int]:
+        """Batch numbers with at least one stored result."""
+        with self._lock:
+            conn = self._connect()
+            return [row[0] for row in conn.execute('SELECT DISTINCT batch FROM fetched ORDER BY batch')]
+
+    def count(self) -> int:
+        """Number of stored results (one per movie and profile)."""
+        with self._lock:
+            conn = self._connect()
+            return conn.execute('SELECT COUNT(*) FROM fetched').fetchone()[0]
+
+    def clear(self):
+        """Forget every stored result (start of a fresh, non-resumed run)."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute('DELETE FROM fetched')
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
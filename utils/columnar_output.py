@@ -0,0 +1,104 @@
+import logging
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('csv', 'parquet', 'feather')
+FILE_SUFFIXES = {'parquet': '.parquet', 'feather': '.feather'}
+FEATHER_COMPRESSIONS = ('zstd', 'lz4', 'uncompressed')
+
+# Columns written as list<string> rather than joined text
+LIST_COLUMNS = ['genres', 'production_companies', 'production_countries', 'spoken_languages']
+
+
+def _load_pyarrow():
+    """Import pyarrow on first use; it is only needed for Parquet and Feather output."""
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet and Feather output need pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def _with_suffix(path: str, output_format: str) -> str:
+    """Swap a '.csv' suffix for the format's own suffix."""
+    root, ext = os.path.splitext(path)
+    if ext.lower() == '.csv':
+        return root + FILE_SUFFIXES[output_format]
+    return path
+
+
+def _to_arrow_table(df: pd.DataFrame, list_columns: List[str]):
+    """Build an Arrow table, typing the list columns as list<string> even when every list is empty."""
+    pa = _load_pyarrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    for col in list_columns:
+        if col in table.column_names:
+            index = table.column_names.index(col)
+            table = table.set_column(index, col, table.column(col).cast(pa.list_(pa.string())))
+    return table
+
+
+def write_columnar(df: pd.DataFrame, path: str, output_format: str, compression: Optional[str] = 'zstd',
+                   row_group_size: Optional[int] = None) -> str:
+    """
+    Write df as Parquet or Feather (Arrow IPC), keeping list columns as native lists.
+
+    Returns the path written, which ends in .parquet/.feather if path ended in .csv.
+    """
+    if output_format not in FILE_SUFFIXES:
+        raise ValueError(f"Unknown columnar format '{output_format}'. Expected one of {tuple(FILE_SUFFIXES)}")
+
+    pa = _load_pyarrow()
+    path = _with_suffix(path, output_format)
+    table = _to_arrow_table(df, LIST_COLUMNS)
+
+    if output_format == 'parquet':
+        pa.parquet.write_table(table, path, compression=compression or 'none', row_group_size=row_group_size)
+    else:
+        compression = compression or 'uncompressed'
+        if compression not in FEATHER_COMPRESSIONS:
+            raise ValueError(f"Feather supports {FEATHER_COMPRESSIONS} compression, not '{compression}'")
+        pa.feather.write_feather(table, path, compression=compression)
+
+    logger.info(f"Wrote {table.num_rows} rows as {output_format} ({compression or 'uncompressed'}) "
+                f"to {path}: {os.path.getsize(path) / 1e6:.1f} MB")
+    return path
+
+
+def read_final_dataset(path: str, arrow_backed: bool = False) -> pd.DataFrame:
+    """
+    Load a dataset written by save_final_dataset, whatever its format.
+
+    List columns come back as Python lists: native for Parquet/Feather, split on ' | ' for CSV.
+    With arrow_backed=True, Parquet/Feather columns keep their Arrow types (list columns become
+    list<string> ArrowDtype columns), which skips the conversion and loads several times faster.
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext in (FILE_SUFFIXES['parquet'], FILE_SUFFIXES['feather']):
+        kwargs = {'dtype_backend': 'pyarrow'} if arrow_backed else {}
+        if ext == FILE_SUFFIXES['parquet']:
+            df = pd.read_parquet(path, **kwargs)
+        else:
+            df = pd.read_feather(path, **kwargs)
+        if arrow_backed:
+            return df
+
+        # pandas hands Arrow lists back as numpy arrays
+        for col in LIST_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].map(lambda value: list(value) if value is not None else [])
+        return df
+
+    df = pd.read_csv(path)
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].map(lambda value: value.split(' | ') if isinstance(value, str) and value else [])
+    return df
@@ -0,0 +1,171 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.id_sanitizer import sanitize_ids
+
+logger = logging.getLogger(__name__)
+
+# Compact dtypes for each source.
+# Given to the CSV parser (read_csv), so these columns are never held as Python objects:
+#   'category' -> pandas categorical
+#   'string'   -> Arrow-backed strings (plain object strings when pyarrow is missing)
+# Applied after reading (apply_schema), because the values need checking or sanitizing first:
+#   'id'       -> sanitized id (utils.id_sanitizer); rejected ids become <NA>
+#   'int'      -> nullable integer, only if every value converts without loss
+#   'float32'  -> float32
+#   'datetime' -> Unix seconds to datetime64 (UTC, naive)
+MOVIE_SCHEMA = {
+    'id': 'id',
+    'title': 'string',
+    'release_date': 'string',
+    'budget': 'int',
+    'revenue': 'int',
+    'genres': 'category',
+    'production_companies': 'string',
+    'production_countries': 'category',
+    'spoken_languages': 'category',
+}
+
+RATINGS_SCHEMA = {
+    'movie_id': 'id',
+    'avg_rating': 'float32',
+    'std_dev': 'float32',
+    'total_ratings': 'int',
+    'last_rated': 'datetime',
+}
+
+READ_TIME_KINDS = ('category', 'string')
+
+CSV_ENGINES = ('c', 'python', 'pyarrow')
+
+
+def _smallest_int_dtype(values: pd.Series) -> str:
+    """Int32 when every value fits, otherwise Int64."""
+    info = np.iinfo(np.int32)
+    present = values.dropna()
+    if present.empty or (present.min() >= info.min and present.max() <= info.max):
+        return 'Int32'
+    return 'Int64'
+
+
+def _to_int(values: pd.Series):
+    """Whole numbers as float64 (missing stay NaN), or None if any value would be lost converting to an integer."""
+    numbers = pd.to_numeric(values, errors='coerce')
+    lost = numbers.isna() & values.notna()
+    if lost.any():
+        return None
+
+    numbers = numbers.astype('float64')
+    present = numbers.dropna()
+    if not (np.isfinite(present) & (present == np.trunc(present))).all():
+        return None
+    return numbers
+
+
+def _string_dtype() -> str:
+    """Arrow-backed strings when pyarrow is installed, otherwise object."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return 'object'
+    return 'string[pyarrow]'
+
+
+def read_dtypes(schema: Dict[str, str]) -> Dict[str, str]:
+    """The dtype= mapping for read_csv: the schema's read-time columns (see MOVIE_SCHEMA)."""
+    kinds = {'category': 'category', 'string': _string_dtype()}
+    return {col: kinds[kind] for col, kind in schema.items() if kind in READ_TIME_KINDS}
+
+
+def apply_schema(frames: List[pd.DataFrame], schema: Dict[str, str]) -> Tuple[List[pd.DataFrame], List[str]]:
+    """
+    Convert the columns named in schema to their compact dtypes, in every frame alike.
+
+    The frames are sources merged later (the main and extended CSVs), so each column gets
+    one dtype across all of them. An 'int' column is converted only if it converts without
+    loss in every frame holding it, and 'int' and 'id' columns get the widest integer any
+    of them needs. Read-time columns the parser already typed are left alone.
+
+    Returns the converted frames and the columns left as read because converting them
+    would have lost values (e.g. a budget column holding file names or '1,000,000').
+    """
+    frames = [df.copy() for df in frames]
+    skipped = []
+    read_time = read_dtypes(schema)
+
+    for col, kind in schema.items():
+        holding = [df for df in frames if col in df.columns]
+        if not holding:
+            continue
+
+        if kind == 'id':
+            # Sanitized ids; rejected ids become <NA>
+            ids = [sanitize_ids(df[col])[0] for df in holding]
+            dtype = _smallest_int_dtype(pd.concat(ids, ignore_index=True))
+            for df, sanitized in zip(holding, ids):
+                df[col] = sanitized.astype(dtype)
+        elif kind == 'int':
+            converted = [_to_int(df[col]) for df in holding]
+            if any(numbers is None for numbers in converted):
+                skipped.append(col)
+                continue
+            dtype = _smallest_int_dtype(pd.concat(converted, ignore_index=True))
+            for df, numbers in zip(holding, converted):
+                df[col] = numbers.astype(dtype)
+        elif kind == 'float32':
+            for df in holding:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+        elif kind == 'datetime':
+            for df in holding:
+                seconds = np.trunc(pd.to_numeric(df[col], errors='coerce').astype('float64'))
+                df[col] = pd.to_datetime(seconds, unit='s', errors='coerce')
+        elif kind in READ_TIME_KINDS:
+            # Frames not read through read_csv (or read without the schema) get the dtype here
+            for df in holding:
+                if str(df[col].dtype) != read_time[col]:
+                    df[col] = df[col].astype(read_time[col])
+        else:
+            raise ValueError(f"Unknown schema type '{kind}' for column '{col}'")
+
+    return frames, skipped
+
+
+def memory_report(df: pd.DataFrame) -> Dict:
+    """Deep memory usage in bytes per column, plus the total."""
+    usage = df.memory_usage(deep=True, index=False)
+    report = {col: int(usage[col]) for col in df.columns}
+    report['total'] = int(usage.sum())
+    return report
+
+
+def log_memory_change(name: str, before: Dict, after: Dict):
+    """Log the total and per-column memory saved by a conversion."""
+    saved = before['total'] - after['total']
+    logger.info(f"{name}: {before['total'] / 1e6:.1f} MB -> {after['total'] / 1e6:.1f} MB "
+                f"({saved / before['total'] if before['total'] else 0:.0%} smaller)")
+    for col in after:
+        if col != 'total' and col in before and before[col] != after[col]:
+            logger.info(f"  {col}: {before[col] / 1e6:.2f} MB -> {after[col] / 1e6:.2f} MB")
+
+
+def read_csv(path: str, engine: str = 'c', schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    pd.read_csv with a choice of parser; 'pyarrow' needs the optional pyarrow package.
+
+    With a schema, its 'category' and 'string' columns are parsed straight into those
+    dtypes (see read_dtypes); its other columns are read as usual for apply_schema.
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}'. Expected one of {CSV_ENGINES}")
+
+    if engine == 'pyarrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("pyarrow is not installed; falling back to the C CSV engine")
+            engine = 'c'
+
+    return pd.read_csv(path, engine=engine, dtype=read_dtypes(schema) if schema else None)
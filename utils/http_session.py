@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import Retry, make_headers
+
+# Statuses retried by the transport (503 waits for its Retry-After header). 429 is left to the
+# caller so the shared rate limiter sees it and slows every thread down, not just this request
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Time spent opening sockets by the current thread's request (see TimedHTTPAdapter.send)
+_connect_timer = threading.local()
+
+
+def _add_connect_time(seconds: float):
+    _connect_timer.seconds = getattr(_connect_timer, 'seconds', 0.0) + seconds
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_connect_time(time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _add_connect_time(time.perf_counter() - start)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TransportRetry(Retry):
+    # urllib3 retries any 429 that carries Retry-After, even outside status_forcelist
+    RETRY_AFTER_STATUS_CODES = frozenset(status for status in Retry.RETRY_AFTER_STATUS_CODES if status != 429)
+
+
+# Upper edges (ms) of the request latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RequestMetrics:
+    """
+    Thread-safe latency counters for HTTP requests, split into connect, time to first byte and body.
+
+    connect is the time spent opening (and TLS-handshaking) new sockets, 0 when a pooled
+    keep-alive connection was reused; ttfb is the rest of the wait for the response headers,
+    including any transport retries; body is the time spent reading the response body.
+    """
+
+    PHASES = ('connect', 'ttfb', 'body')
+
+    def __init__(self, max_samples: int = 10000):
+        self._samples = {phase: deque(maxlen=max_samples) for phase in self.PHASES}
+        self._totals = {phase: 0.0 for phase in self.PHASES}
+        self.requests = 0
+        self.new_connections = 0
+        self._lock = threading.Lock()
+
+    def record(self, connect: float, ttfb: float, body: float):
+        """Record the phases of one request."""
+        with self._lock:
+            self.requests += 1
+            if connect > 0:
+                self.new_connections += 1
+            for phase, seconds in zip(self.PHASES, (connect, ttfb, body)):
+                self._samples[phase].append(seconds)
+                self._totals[phase] += seconds
+
+    @staticmethod
+    def _percentile(ordered: list, fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+    def histogram(self, edges_ms: Iterable[float] = LATENCY_BUCKETS_MS) -> Dict[str, int]:
+        """Request counts by total latency (connect + TTFB + body), over the retained samples."""
+        edges = list(edges_ms)
+        labels = [f"<={edge:g}ms" for edge in edges] + [f">{edges[-1]:g}ms"]
+        counts = dict.fromkeys(labels, 0)
+        with self._lock:
+            totals = [sum(phases) * 1000 for phases in zip(*(self._samples[phase] for phase in self.PHASES))]
+        for total in totals:
+            index = next((i for i, edge in enumerate(edges) if total <= edge), len(edges))
+            counts[labels[index]] += 1
+        return counts
+
+    def summary(self) -> Dict:
+        """Request count, connection reuse and mean/p50/p95 milliseconds per phase."""
+        with self._lock:
+            stats = {'requests': self.requests, 'new_connections': self.new_connections,
+                     'reused_connections': self.requests - self.new_connections}
+            for phase in self.PHASES:
+                ordered = sorted(self._samples[phase])
+                stats[phase] = {
+                    'mean_ms': self._totals[phase] / self.requests * 1000 if self.requests else 0.0,
+                    'p50_ms': self._percentile(ordered, 0.50) * 1000,
+                    'p95_ms': self._percentile(ordered, 0.95) * 1000,
+                }
+        return stats
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that times the connect, time-to-first-byte and body phases of every request."""
+
+    def __init__(self, metrics: Optional[RequestMetrics] = None, **kwargs):
+        self.metrics = metrics or RequestMetrics()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool,
+                                                   'https': _TimedHTTPSConnectionPool}
+
+    def send(self, request, stream=False, **kwargs):
+        _connect_timer.seconds = 0.0
+        start = time.perf_counter()
+        # Stream so the headers arrive before the body is read, then read it here unless the caller streams
+        response = super().send(request, stream=True, **kwargs)
+        headers_received = time.perf_counter()
+        if not stream:
+            response.content
+        connect = _connect_timer.seconds
+        self.metrics.record(connect, headers_received - start - connect, time.perf_counter() - headers_received)
+        return response
+
+
+def build_adapter(pool_connections: int, pool_maxsize: int, retries: int, backoff_factor: float,
+                  retry_statuses: Iterable[int] = RETRY_STATUSES,
+                  metrics: Optional[RequestMetrics] = None) -> TimedHTTPAdapter:
+    """
+    Connection-pooling adapter with transport-level retries.
+
+    Args:
+        pool_connections: Number of hosts whose connection pools are kept
+        pool_maxsize: Keep-alive connections kept per host (match the number of concurrent callers)
+        retries: Transport retries for connection errors, read errors and retry_statuses
+        backoff_factor: Exponential backoff between retries; a Retry-After header takes precedence
+    """
+    retry = _TransportRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        status_forcelist=tuple(retry_statuses),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        backoff_factor=backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the final 5xx response back to the caller
+    )
+    return TimedHTTPAdapter(metrics=metrics, pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                            max_retries=retry, pool_block=False)
+
+
+def accept_encoding(compress: bool) -> str:
+    """Accept-Encoding header: every codec urllib3 can decode here (gzip, deflate, br if brotli is installed)."""
+    return make_headers(accept_encoding=True)['accept-encoding'] if compress else 'identity'
+
+
+class ThreadLocalSessions:
+    """
+    One requests.Session per thread, all mounted on the same adapter.
+
+    requests.Session is not documented as thread-safe (its cookie jar and hooks are shared
+    state), but urllib3's connection pools are, so threads keep separate sessions while
+    reusing one set of keep-alive connections.
+    """
+
+    def __init__(self, adapter: HTTPAdapter, headers: Optional[Dict[str, str]] = None):
+        self.adapter = adapter
+        self.headers = dict(headers or {})
+        self._local = threading.local()
+
+    def update_headers(self, headers: Dict[str, str]):
+        """Set headers for sessions created from now on and for the calling thread's session."""
+        self.headers.update(headers)
+        if getattr(self._local, 'session', None) is not None:
+            self._local.session.headers.update(headers)
+
+    def get(self) -> requests.Session:
+        """The calling thread's session, created on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+        return session
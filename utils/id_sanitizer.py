@@ -0,0 +1,59 @@
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+
+# Reasons an id is rejected, in the order they are checked
+ID_REJECTION_REASONS = ('missing', 'date_like', 'file_like', 'not_numeric', 'non_positive')
+
+DATE_LIKE_PATTERN = r'^(?:\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2})'
+FILE_LIKE_PATTERN = r'\.(?:jpg|png|gif|pdf)$'
+
+
+def sanitize_ids(values: pd.Series) -> Tuple[pd.Series, Dict[str, int]]:
+    """
+    Validate a whole column of raw movie ids at once.
+
+    Returns a nullable Int64 Series aligned with values, holding <NA> wherever the id
+    was rejected, and the number of ids rejected for each reason in ID_REJECTION_REASONS.
+    Accepted ids are positive whole numbers; '862', 862.0 and '862.0' all become 862.
+    """
+    counts = {reason: 0 for reason in ID_REJECTION_REASONS}
+    missing = values.isna().to_numpy()
+    counts['missing'] = int(missing.sum())
+
+    if is_integer_dtype(values):
+        # Already integers (typed loads, previously sanitized frames): only the range check is left
+        ids = values.astype('Int64')
+        non_positive = ~missing & (ids <= 0).fillna(False).to_numpy(dtype=bool)
+        counts['non_positive'] = int(non_positive.sum())
+        return ids.mask(non_positive), counts
+
+    text = values.astype(str).str.strip()
+
+    # Long values with date separators, e.g. '20/08/1997' or '2012-09-29'
+    has_separator = text.str.contains('/', regex=False) | text.str.contains('-', regex=False)
+    date_like = ~missing & (
+        (has_separator & (text.str.len() > 7)) | text.str.match(DATE_LIKE_PATTERN)
+    ).to_numpy(dtype=bool)
+
+    file_like = ~missing & ~date_like & text.str.contains(FILE_LIKE_PATTERN, case=False, regex=True).to_numpy(dtype=bool)
+
+    candidates = ~(missing | date_like | file_like)
+    numbers = pd.to_numeric(text.where(candidates), errors='coerce').astype('float64').to_numpy()
+    # Infinite values and values beyond int64 cannot be ids either
+    with np.errstate(invalid='ignore'):
+        not_numeric = candidates & ~(np.isfinite(numbers) & (np.abs(numbers) < 2 ** 63))
+
+    numbers = np.trunc(np.where(candidates & ~not_numeric, numbers, np.nan))
+    with np.errstate(invalid='ignore'):
+        non_positive = candidates & ~not_numeric & (numbers <= 0)
+    numbers[non_positive] = np.nan
+
+    counts['date_like'] = int(date_like.sum())
+    counts['file_like'] = int(file_like.sum())
+    counts['not_numeric'] = int(not_numeric.sum())
+    counts['non_positive'] = int(non_positive.sum())
+
+    return pd.Series(numbers, index=values.index).astype('Int64'), counts
@@ -1,24 +1,125 @@
-import re
-from typing import List
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import logging
 import pandas as pd
 
+from config import ISO_LOOKUP_TABLE_PATH, ISO_FIELD_CACHE_SIZE
+from utils.json_tokenizer import tokenize_json_field
+
 logger = logging.getLogger(__name__)
 
-# Try to import pycountry and langcodes, fallback to basic mapping if not available
-try:
-    import pycountry
-    PYCOUNTRY_AVAILABLE = True
-except ImportError:
-    PYCOUNTRY_AVAILABLE = False
-    logger.warning("pycountry not available, using fallback country mapping")
-
-try:
-    import langcodes
-    LANGCODES_AVAILABLE = True
-except ImportError:
-    LANGCODES_AVAILABLE = False
-    logger.warning("langcodes not available, using fallback language mapping")
+# Fallback mapping for common codes, used when pycountry/langcodes are not installed
+FALLBACK_COUNTRIES = {
+    'US': 'United States', 'GB': 'United Kingdom', 'FR': 'France',
+    'DE': 'Germany', 'IT': 'Italy', 'JP': 'Japan', 'CA': 'Canada',
+    'AU': 'Australia', 'ES': 'Spain', 'IN': 'India', 'CN': 'China',
+    'RU': 'Russia', 'BR': 'Brazil', 'MX': 'Mexico', 'KR': 'South Korea',
+    'NL': 'Netherlands', 'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark'
+}
+
+FALLBACK_LANGUAGES = {
+    'en': 'English', 'fr': 'French', 'de': 'German', 'es': 'Spanish',
+    'it': 'Italian', 'ja': 'Japanese', 'ko': 'Korean', 'zh': 'Chinese',
+    'ru': 'Russian', 'pt': 'Portuguese', 'nl': 'Dutch', 'sv': 'Swedish',
+    'da': 'Danish', 'no': 'Norwegian', 'fi': 'Finnish', 'pl': 'Polish',
+    'ar': 'Arabic', 'hi': 'Hindi', 'th': 'Thai', 'vi': 'Vietnamese'
+}
+
+# pycountry and langcodes load large databases, so they are only imported when a
+# lookup table has to be built from them (None = not tried yet, False = unavailable)
+_pycountry = None
+_langcodes = None
+
+# Code -> name tables, built (or loaded from ISO_LOOKUP_TABLE_PATH) on first use
+_country_table: Optional[Dict[str, str]] = None
+_language_table: Optional[Dict[str, str]] = None
+
+
+def _load_pycountry():
+    """Import pycountry on first use. Returns the module or None."""
+    global _pycountry
+    if _pycountry is None:
+        try:
+            import pycountry
+            _pycountry = pycountry
+        except ImportError:
+            _pycountry = False
+            logger.warning("pycountry not available, using fallback country mapping")
+    return _pycountry or None
+
+
+def _load_langcodes():
+    """Import langcodes on first use. Returns the module or None."""
+    global _langcodes
+    if _langcodes is None:
+        try:
+            import langcodes
+            _langcodes = langcodes
+        except ImportError:
+            _langcodes = False
+            logger.warning("langcodes not available, using fallback language mapping")
+    return _langcodes or None
+
+
+def _build_country_table() -> Dict[str, str]:
+    """Map every alpha-2 and alpha-3 country code to its name (alpha-2 wins, then alpha-3, then fallback)."""
+    table = dict(FALLBACK_COUNTRIES)
+    pycountry = _load_pycountry()
+    if pycountry:
+        for country in pycountry.countries:
+            table[country.alpha_3.upper()] = country.name
+        for country in pycountry.countries:
+            table[country.alpha_2.upper()] = country.name
+    return table
+
+
+def _build_language_table() -> Dict[str, str]:
+    """Map ISO 639-1 language codes to display names, as langcodes renders them."""
+    table = dict(FALLBACK_LANGUAGES)
+    langcodes = _load_langcodes()
+    if langcodes:
+        pycountry = _load_pycountry()
+        codes = set(table)
+        if pycountry:
+            codes.update(language.alpha_2.lower() for language in pycountry.languages
+                         if hasattr(language, 'alpha_2'))
+        for code in codes:
+            try:
+                table[code] = langcodes.Language.make(language=code).display_name()
+            except Exception as e:
+                logger.debug(f"langcodes lookup failed for {code}: {e}")
+    return table
+
+
+def _lookup_tables() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Return the country and language tables, loading or building them once."""
+    global _country_table, _language_table
+    if _country_table is None or _language_table is None:
+        if ISO_LOOKUP_TABLE_PATH and os.path.exists(ISO_LOOKUP_TABLE_PATH):
+            with open(ISO_LOOKUP_TABLE_PATH, 'r', encoding='utf-8') as file:
+                tables = json.load(file)
+            _country_table = tables['countries']
+            _language_table = tables['languages']
+            logger.info(f"Loaded ISO lookup tables from {ISO_LOOKUP_TABLE_PATH}")
+        else:
+            _country_table = _build_country_table()
+            _language_table = _build_language_table()
+    return _country_table, _language_table
+
+
+@lru_cache(maxsize=4096)
+def _resolve_language_code(iso_code: str) -> str:
+    """Name for a lowercase language code missing from the prebuilt table."""
+    langcodes = _load_langcodes()
+    if langcodes:
+        try:
+            return langcodes.Language.make(language=iso_code).display_name()
+        except Exception as e:
+            logger.debug(f"langcodes lookup failed for {iso_code}: {e}")
+    return FALLBACK_LANGUAGES.get(iso_code, iso_code)
+
 
 class ISOMapper:
     """Utility class for mapping ISO codes to readable names."""
@@ -30,30 +131,8 @@ class ISOMapper:
             return ""
         
         iso_code = str(iso_code).strip().upper()
-        
-        if PYCOUNTRY_AVAILABLE:
-            try:
-                country = pycountry.countries.get(alpha_2=iso_code)
-                if country:
-                    return country.name
-                
-                # Try alpha_3 if alpha_2 fails
-                country = pycountry.countries.get(alpha_3=iso_code)
-                if country:
-                    return country.name
-            except Exception as e:
-                logger.debug(f"pycountry lookup failed for {iso_code}: {e}")
-        
-        # Fallback mapping for common codes
-        fallback_countries = {
-            'US': 'United States', 'GB': 'United Kingdom', 'FR': 'France',
-            'DE': 'Germany', 'IT': 'Italy', 'JP': 'Japan', 'CA': 'Canada',
-            'AU': 'Australia', 'ES': 'Spain', 'IN': 'India', 'CN': 'China',
-            'RU': 'Russia', 'BR': 'Brazil', 'MX': 'Mexico', 'KR': 'South Korea',
-            'NL': 'Netherlands', 'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark'
-        }
-        
-        return fallback_countries.get(iso_code, iso_code)
+        country_table, _ = _lookup_tables()
+        return country_table.get(iso_code, iso_code)
     
     @staticmethod
     def get_language_name(iso_code: str) -> str:
@@ -62,34 +141,73 @@ class ISOMapper:
             return ""
         
         iso_code = str(iso_code).strip().lower()
-        
-        if LANGCODES_AVAILABLE:
-            try:
-                language = langcodes.Language.make(language=iso_code)
-                return language.display_name()
-            except Exception as e:
-                logger.debug(f"langcodes lookup failed for {iso_code}: {e}")
-        
-        # Fallback mapping for common codes
-        fallback_languages = {
-            'en': 'English', 'fr': 'French', 'de': 'German', 'es': 'Spanish',
-            'it': 'Italian', 'ja': 'Japanese', 'ko': 'Korean', 'zh': 'Chinese',
-            'ru': 'Russian', 'pt': 'Portuguese', 'nl': 'Dutch', 'sv': 'Swedish',
-            'da': 'Danish', 'no': 'Norwegian', 'fi': 'Finnish', 'pl': 'Polish',
-            'ar': 'Arabic', 'hi': 'Hindi', 'th': 'Thai', 'vi': 'Vietnamese'
-        }
-        
-        return fallback_languages.get(iso_code, iso_code)
+        _, language_table = _lookup_tables()
+        name = language_table.get(iso_code)
+        if name is None:
+            name = _resolve_language_code(iso_code)
+        return name
+    
+    @staticmethod
+    def save_lookup_tables(path: str = ISO_LOOKUP_TABLE_PATH) -> str:
+        """
+        Build the code -> name tables from pycountry/langcodes and write them to disk.
+        Later runs load this file instead of importing either library.
+        """
+        tables = {'countries': _build_country_table(), 'languages': _build_language_table()}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(tables, file, ensure_ascii=False, indent=0, sort_keys=True)
+        logger.info(f"Saved ISO lookup tables ({len(tables['countries'])} countries, "
+                    f"{len(tables['languages'])} languages) to {path}")
+        return path
+    
+    @staticmethod
+    def cache_stats() -> Dict[str, Dict]:
+        """Return hit/miss counts for the memoized field parsers and code lookups."""
+        stats = {}
+        for name, cached in (('countries', _parse_countries_cached),
+                             ('languages', _parse_languages_cached),
+                             ('language_codes', _resolve_language_code)):
+            info = cached.cache_info()
+            lookups = info.hits + info.misses
+            stats[name] = {
+                'hits': info.hits,
+                'misses': info.misses,
+                'size': info.currsize,
+                'maxsize': info.maxsize,
+                'hit_rate': round(info.hits / lookups, 4) if lookups else 0.0
+            }
+        return stats
+    
+    @staticmethod
+    def clear_caches():
+        """Drop memoized results and force the lookup tables to be rebuilt on next use."""
+        global _country_table, _language_table
+        _parse_countries_cached.cache_clear()
+        _parse_languages_cached.cache_clear()
+        _resolve_language_code.cache_clear()
+        _country_table = None
+        _language_table = None
     
     @staticmethod
     def clean_and_map_countries(data_str: str) -> List[str]:
         """Parse country data - handles both JSON format with ISO codes and plain text."""
+        if isinstance(data_str, list):
+            # Already a list of country names (e.g. filled from TMDB)
+            return ISOMapper._clean_name_list(data_str)
+        
         if pd.isna(data_str) or data_str is None or str(data_str).strip() == "":
             return []
         
+        # Repeated field strings are parsed once; copy so callers never share the cached list
+        return list(_parse_countries_cached(str(data_str).strip()))
+    
+    @staticmethod
+    def _parse_countries(data_str: str) -> List[str]:
+        """Parse a stripped, non-empty country field."""
         try:
-            data_str = str(data_str).strip()
-            
             # Check if it's JSON-like format (contains quotes and colons)
             if ("'" in data_str or '"' in data_str) and ":" in data_str:
                 # Handle JSON-like format with potential ISO codes
@@ -105,17 +223,10 @@ class ISOMapper:
     @staticmethod
     def _parse_json_countries(json_str: str) -> List[str]:
         """Parse JSON-like country data with ISO code mapping."""
-        # Extract both 'name' and 'iso_3166_1' patterns
-        name_pattern = r"'name':\s*'([^']+)'|\"name\":\s*\"([^\"]+)\""
-        iso_pattern = r"'iso_3166_1':\s*'([^']+)'|\"iso_3166_1\":\s*\"([^\"]+)\""
-        
-        # Get names first
-        name_matches = re.findall(name_pattern, json_str)
-        names = [match[0] if match[0] else match[1] for match in name_matches if any(match)]
-        
-        # Get ISO codes and convert them
-        iso_matches = re.findall(iso_pattern, json_str)
-        iso_codes = [match[0] if match[0] else match[1] for match in iso_matches if any(match)]
+        # One scan collects both the 'name' and 'iso_3166_1' entries
+        tokens = tokenize_json_field(json_str)
+        names = tokens.names
+        iso_codes = tokens.iso_3166_1
         
         # Convert ISO codes to names
         mapped_countries = []
@@ -129,6 +240,12 @@ class ISOMapper:
         all_countries = mapped_countries + names
         return list(dict.fromkeys(all_countries))  # Remove duplicates while preserving order
     
+    @staticmethod
+    def _clean_name_list(names: list) -> List[str]:
+        """Strip an already-parsed list of names, dropping empty and single-character entries."""
+        cleaned = [str(name).strip() for name in names if not pd.isna(name)]
+        return [name for name in cleaned if len(name) > 1]
+    
     @staticmethod
     def _parse_plain_text_countries(text_str: str) -> List[str]:
         """Parse plain text country data that's already in readable format."""
@@ -149,12 +266,20 @@ class ISOMapper:
     @staticmethod
     def clean_and_map_languages(data_str: str) -> List[str]:
         """Parse language data - handles both JSON format with ISO codes and plain text."""
+        if isinstance(data_str, list):
+            # Already a list of language names (e.g. filled from TMDB)
+            return ISOMapper._clean_name_list(data_str)
+        
         if pd.isna(data_str) or data_str is None or str(data_str).strip() == "":
             return []
         
+        # Repeated field strings are parsed once; copy so callers never share the cached list
+        return list(_parse_languages_cached(str(data_str).strip()))
+    
+    @staticmethod
+    def _parse_languages(data_str: str) -> List[str]:
+        """Parse a stripped, non-empty language field."""
         try:
-            data_str = str(data_str).strip()
-            
             # Check if it's JSON-like format (contains quotes and colons)
             if ("'" in data_str or '"' in data_str) and ":" in data_str:
                 # Handle JSON-like format with potential ISO codes
@@ -170,24 +295,21 @@ class ISOMapper:
     @staticmethod
     def _parse_json_languages(json_str: str) -> List[str]:
         """Parse JSON-like language data with ISO code mapping. Prioritizes english_name field."""
-        # PRIORITY 1: Extract 'english_name' field first (cleaner, no special characters)
-        english_name_pattern = r"'english_name':\s*'([^']+)'|\"english_name\":\s*\"([^\"]+)\""
-        english_matches = re.findall(english_name_pattern, json_str)
-        english_names = [match[0] if match[0] else match[1] for match in english_matches if any(match)]
+        # One scan collects the 'english_name', 'name' and 'iso_639_1' entries
+        tokens = tokenize_json_field(json_str)
+        
+        # PRIORITY 1: 'english_name' field (cleaner, no special characters)
+        english_names = tokens.english_names
         
         # If we have english names, use those and skip the rest
         if english_names:
             return [name for name in english_names if name and len(name) > 1]
         
-        # PRIORITY 2: Extract regular 'name' field as fallback
-        name_pattern = r"'name':\s*'([^']+)'|\"name\":\s*\"([^\"]+)\""
-        name_matches = re.findall(name_pattern, json_str)
-        names = [match[0] if match[0] else match[1] for match in name_matches if any(match)]
+        # PRIORITY 2: regular 'name' field as fallback
+        names = tokens.names
         
-        # PRIORITY 3: Extract and map ISO codes as last resort
-        iso_pattern = r"'iso_639_1':\s*'([^']+)'|\"iso_639_1\":\s*\"([^\"]+)\""
-        iso_matches = re.findall(iso_pattern, json_str)
-        iso_codes = [match[0] if match[0] else match[1] for match in iso_matches if any(match)]
+        # PRIORITY 3: map ISO codes as last resort
+        iso_codes = tokens.iso_639_1
         
         # Convert ISO codes to names
         mapped_languages = []
@@ -216,4 +338,20 @@ class ISOMapper:
         
         # If no delimiter found, treat as single language
         cleaned_language = text_str.strip()
-        return [cleaned_language] if cleaned_language and len(cleaned_language) > 1 else []
\ No newline at end of file
+        return [cleaned_language] if cleaned_language and len(cleaned_language) > 1 else []
+
+
+@lru_cache(maxsize=ISO_FIELD_CACHE_SIZE)
+def _parse_countries_cached(data_str: str) -> Tuple[str, ...]:
+    return tuple(ISOMapper._parse_countries(data_str))
+
+
+@lru_cache(maxsize=ISO_FIELD_CACHE_SIZE)
+def _parse_languages_cached(data_str: str) -> Tuple[str, ...]:
+    return tuple(ISOMapper._parse_languages(data_str))
+
+
+if __name__ == '__main__':
+    # Prebuild the lookup tables so later runs never import pycountry/langcodes
+    logging.basicConfig(level=logging.INFO)
+    ISOMapper.save_lookup_tables()
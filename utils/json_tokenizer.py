@@ -0,0 +1,43 @@
+import re
+from typing import List, NamedTuple
+
+# Keys pulled out of JSON-like list fields such as
+# "[{'iso_639_1': 'fr', 'name': 'Français', 'english_name': 'French'}]"
+TOKEN_KEYS = ('name', 'english_name', 'iso_3166_1', 'iso_639_1')
+
+_KEY_GROUP = '(' + '|'.join(TOKEN_KEYS) + ')'
+
+# Single-quoted key with single-quoted value, or double-quoted key with double-quoted value
+FIELD_PATTERN = re.compile(
+    "'" + _KEY_GROUP + r"':\s*'([^']+)'|\"" + _KEY_GROUP + r'":\s*"([^"]+)"'
+)
+
+# 'name' entries only, for column-wise extraction with pandas .str.extractall
+NAME_PATTERN = r"'name':\s*'([^']+)'|\"name\":\s*\"([^\"]+)\""
+
+
+class FieldTokens(NamedTuple):
+    """Values found in a JSON-like field, grouped by key and kept in order of appearance."""
+    names: List[str]
+    english_names: List[str]
+    iso_3166_1: List[str]
+    iso_639_1: List[str]
+
+
+def tokenize_json_field(text: str) -> FieldTokens:
+    """Extract every name, english_name, iso_3166_1 and iso_639_1 value in a single scan."""
+    fields = {key: [] for key in TOKEN_KEYS}
+
+    if "'" in text or '"' in text:
+        for single_key, single_value, double_key, double_value in FIELD_PATTERN.findall(text):
+            if single_key:
+                fields[single_key].append(single_value)
+            else:
+                fields[double_key].append(double_value)
+
+    return FieldTokens(
+        names=fields['name'],
+        english_names=fields['english_name'],
+        iso_3166_1=fields['iso_3166_1'],
+        iso_639_1=fields['iso_639_1']
+    )
@@ -1,10 +1,27 @@
 import logging
 
-logging.basicConfig(filename='cleaning.log', level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+LOG_FILE = 'cleaning.log'
+
+_configured = False
+
+
+def configure_logging():
+    """
+    Send INFO and above to cleaning.log, unless the application configured logging first.
+
+    Runs on first use instead of at import, so importing a module never creates the log
+    file or takes over the caller's logging setup.
+    """
+    global _configured
+    if not _configured:
+        logging.basicConfig(filename=LOG_FILE, level=logging.INFO,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+        _configured = True
 
 def log_info(message):
+    configure_logging()
     logging.info(message)
 
 def log_error(message):
+    configure_logging()
     logging.error(message)
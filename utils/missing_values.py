@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_object_dtype, is_string_dtype
+
+# String values (after stripping) that count as missing
+MISSING_TOKENS = ['', '0', 'null', 'NULL', 'nan', 'NaN', '[]', '[ ]', '{}']
+
+
+def is_missing_value(value) -> bool:
+    """
+    Check if a single value should be considered as missing.
+    Handles null, 0, nan, [], [ ], and other indicators.
+    """
+    if isinstance(value, list):
+        return len(value) == 0
+
+    if pd.isna(value) or value is None:
+        return True
+
+    if isinstance(value, (int, float, np.number)) and value == 0:
+        return True
+
+    if isinstance(value, str) and value.strip() in MISSING_TOKENS:
+        return True
+
+    return False
+
+
+def missing_mask(values: pd.Series) -> pd.Series:
+    """
+    Column-wise version of is_missing_value.
+
+    Returns a boolean Series aligned with values that is True for NaN/None,
+    numeric zeros, missing-value tokens such as '0', 'null', '[]' or '{}', and empty lists.
+    """
+    mask = values.isna()
+
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Check each category once, then broadcast through the codes (-1 is NaN)
+        category_missing = missing_mask(pd.Series(values.cat.categories, dtype=object)).to_numpy(dtype=bool)
+        codes = values.cat.codes.to_numpy()
+        return pd.Series(np.where(codes < 0, True, category_missing[codes]), index=values.index)
+
+    if is_numeric_dtype(values):
+        # Nullable integer columns compare to <NA> at missing positions
+        return mask | (values == 0).fillna(False).astype(bool)
+
+    if not (is_object_dtype(values) or is_string_dtype(values)):
+        return mask
+
+    present = values[~mask]
+    if present.empty:
+        return mask
+
+    try:
+        stripped = present.str.strip()
+    except AttributeError:
+        # No string-like values at all (e.g. an object column of plain ints)
+        stripped = pd.Series(np.nan, index=present.index, dtype=object)
+
+    missing = stripped.isin(MISSING_TOKENS).to_numpy(dtype=bool)
+
+    # .str.strip() yields NaN for non-strings; only those can be numeric zeros or empty lists
+    others = stripped.isna().to_numpy()
+    if others.any():
+        other_values = present[others]
+        missing[others] = (
+            (other_values == 0).to_numpy(dtype=bool)
+            | other_values.map(lambda value: isinstance(value, list) and len(value) == 0).to_numpy(dtype=bool)
+        )
+
+    result = mask.copy()
+    result[~mask] = missing
+    return result
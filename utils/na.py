@@ -0,0 +1,16 @@
+def is_na(value) -> bool:
+    """
+    pd.isna for a single value, without importing pandas for plain Python values.
+
+    None and NaN floats are missing, strings and ints never are; anything else (numpy
+    scalars, NaT, pd.NA, datetimes) is passed to pd.isna, whose result it returns unchanged.
+    """
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return value != value
+    if isinstance(value, (str, bytes, int)):
+        return False
+
+    import pandas as pd
+    return pd.isna(value)
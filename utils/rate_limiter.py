@@ -0,0 +1,226 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from config import (TMDB_RATE_LIMIT, TMDB_RATE_BURST, TMDB_RATE_MIN, TMDB_RATE_MAX, TMDB_RATE_INCREASE,
+                    TMDB_RATE_DECREASE, TMDB_THROTTLE_PAUSE)
+
+# Remaining-quota and reset headers, legacy X- names first, then the IETF RateLimit draft names
+REMAINING_HEADERS = ('X-RateLimit-Remaining', 'RateLimit-Remaining')
+RESET_HEADERS = ('X-RateLimit-Reset', 'RateLimit-Reset')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta seconds or HTTP date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Seconds until a rate-limit reset given as delta seconds or a Unix timestamp."""
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Anything that looks like an epoch timestamp is absolute
+    return max(0.0, reset - time.time()) if reset > 1e9 else max(0.0, reset)
+
+
+def _header(headers: Mapping[str, str], names) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to keep API calls within a request quota.
+
+    Callers report every response through record_response: a 429, or a rate-limit header
+    saying the quota is used up, pauses the whole bucket (every thread and asyncio task
+    drawing from it) until the server's Retry-After or reset time.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, throttle_pause: float = TMDB_THROTTLE_PAUSE):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.throttle_pause = throttle_pause
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.acquired = 0
+        self.throttled_time = 0.0
+        self.throttle_events = 0
+        self.dropped = 0
+
+    def _refill(self):
+        """Add the tokens earned since the last refill (caller must hold the lock)."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens if available and return 0, otherwise return how long to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                self.acquired += 1
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def _add_wait(self, waited: float):
+        if waited:
+            with self._lock:
+                self.throttled_time += waited
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens if they are available right now, without waiting."""
+        return self._reserve(tokens) == 0
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until tokens are available. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            wait_time = self._reserve(tokens)
+            if wait_time == 0:
+                self._add_wait(waited)
+                return waited
+
+            time.sleep(wait_time)
+            waited += wait_time
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Like acquire, but yields to the event loop instead of blocking the thread."""
+        waited = 0.0
+        while True:
+            wait_time = self._reserve(tokens)
+            if wait_time == 0:
+                self._add_wait(waited)
+                return waited
+
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the next seconds; no tokens build up during the pause."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._last_refill = until
+
+    def record_response(self, status_code: int, headers: Optional[Mapping[str, str]] = None):
+        """
+        Feed a response back into the limiter.
+
+        A 429 pauses for Retry-After (or throttle_pause when the header is missing) and
+        counts as a throttle event; any other response counts as a success. An exhausted
+        remaining quota pauses until the advertised reset.
+        """
+        headers = headers or {}
+
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            with self._lock:
+                self.throttle_events += 1
+                # Requests already in flight when the first 429 arrived answer 429 too; back off once per pause
+                if time.monotonic() >= self._paused_until:
+                    self._on_throttle()
+            self.pause(retry_after if retry_after is not None else self.throttle_pause)
+            return
+
+        with self._lock:
+            self._on_success()
+
+        remaining = _header(headers, REMAINING_HEADERS)
+        reset = _header(headers, RESET_HEADERS)
+        if remaining is not None and reset is not None:
+            try:
+                exhausted = float(remaining) <= 0
+            except ValueError:
+                exhausted = False
+            reset_in = _parse_reset(reset) if exhausted else None
+            if reset_in:
+                self.pause(reset_in)
+
+    def record_drop(self):
+        """Count a request given up on because it stayed throttled."""
+        with self._lock:
+            self.dropped += 1
+
+    def _on_throttle(self):
+        """Rate adjustment after a 429 (caller holds the lock). A fixed bucket keeps its rate."""
+
+    def _on_success(self):
+        """Rate adjustment after a successful response (caller holds the lock)."""
+
+    def metrics(self) -> Dict:
+        """Current rate and the throttling seen so far (throttled_time is summed over all callers)."""
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'acquired': self.acquired,
+                'throttled_time': self.throttled_time,
+                'throttle_events': self.throttle_events,
+                'dropped': self.dropped,
+                'paused_for': max(0.0, self._paused_until - time.monotonic()),
+            }
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate follows the server's feedback (AIMD).
+
+    Every success raises the rate so that it grows by about `increase` requests/second
+    each second, up to max_rate; every 429 multiplies it by `decrease`, down to min_rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: float = TMDB_RATE_MIN,
+                 max_rate: float = TMDB_RATE_MAX, increase: float = TMDB_RATE_INCREASE,
+                 decrease: float = TMDB_RATE_DECREASE, throttle_pause: float = TMDB_THROTTLE_PAUSE):
+        if not 0 < decrease < 1:
+            raise ValueError(f"Decrease factor must be between 0 and 1: {decrease}")
+
+        super().__init__(rate, capacity, throttle_pause)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max(max_rate, rate))
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+
+    def _on_throttle(self):
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def _on_success(self):
+        # Additive increase spread over the requests made in one second at the current rate
+        self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+
+# Global limiter shared by every fetcher so concurrent workers respect TMDB's quota together
+tmdb_rate_limiter = AdaptiveRateLimiter(TMDB_RATE_LIMIT, TMDB_RATE_BURST)
@@ -0,0 +1,134 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache for API responses.
+
+    Entries expire after a per-entry TTL and the least recently used entries are
+    evicted once the cache grows beyond max_entries. Safe to share between threads.
+    """
+
+    def __init__(self, path: str, default_ttl: float, max_entries: int):
+        self.path = path
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._conn = None
+        self._entry_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, **params) -> str:
+        """Build a stable cache key from an endpoint and its request parameters."""
+        parts = [f"{name}={params[name]}" for name in sorted(params) if params[name] not in (None, '')]
+        return endpoint + '?' + '&'.join(parts)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller must hold the lock)."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                'expires_at REAL NOT NULL, last_access REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)')
+            self._conn.commit()
+            self._entry_count = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response, or None if it is missing or expired."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT value, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+            now = time.time()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            if row[1] <= now:
+                self.misses += 1
+                self.stale += 1
+                return None
+
+            conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict, ttl: Optional[float] = None):
+        """Store a response, evicting least recently used entries if the cache is full."""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        payload = json.dumps(value)
+
+        with self._lock:
+            conn = self._connect()
+            exists = conn.execute('SELECT 1 FROM responses WHERE key = ?', (key,)).fetchone() is not None
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)',
+                (key, payload, now + ttl, now)
+            )
+            self.writes += 1
+            if not exists:
+                self._entry_count += 1
+
+            overflow = self._entry_count - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    'DELETE FROM responses WHERE key IN '
+                    '(SELECT key FROM responses ORDER BY last_access LIMIT ?)',
+                    (overflow,)
+                )
+                self._entry_count -= overflow
+                self.evictions += overflow
+
+            conn.commit()
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM responses')
+            conn.commit()
+            self._entry_count = 0
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'entries': self._entry_count,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,218 @@
+import cProfile
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Mapping, Sized
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+CODE_PROFILERS = ('cprofile', 'pyinstrument')
+REPORT_VERSION = 1
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size in MB, read from /proc where available."""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def count_rows(value) -> Optional[int]:
+    """
+    Rows in a tuple of DataFrames (summed) or any other sized collection of rows (a
+    DataFrame, list of records, MovieRecordBatch); None for strings, mappings, other
+    tuples and scalars.
+    """
+    if isinstance(value, tuple) and value and all(isinstance(item, pd.DataFrame) for item in value):
+        return sum(len(item) for item in value)
+    if isinstance(value, Sized) and not isinstance(value, (str, bytes, Mapping, tuple)):
+        return len(value)
+    return None
+
+
+class RunProfiler:
+    """
+    Per-stage timing for one pipeline run: wall and CPU time, RSS, and rows in and out.
+
+    Stages nest (a merge inside load_and_merge_data is recorded with depth 1). With
+    code_profiler set, each stage is also profiled with cProfile (a .prof file per stage,
+    readable with pstats or snakeviz) or pyinstrument (an .html file per stage).
+    """
+
+    def __init__(self, code_profiler: Optional[str] = None, profile_dir: Optional[str] = None):
+        if code_profiler is not None and code_profiler not in CODE_PROFILERS:
+            raise ValueError(f"Unknown code profiler '{code_profiler}'. Expected one of {CODE_PROFILERS}")
+
+        self.code_profiler = code_profiler
+        self.profile_dir = profile_dir
+        self.stages: List[Dict] = []
+        self.started_at = datetime.now(timezone.utc)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._depth = 0
+        self._active_profile = False
+
+    def _start_code_profile(self):
+        """Start the code profiler for a stage, unless one is already running in an outer stage."""
+        if self.code_profiler is None or self._active_profile:
+            return None
+
+        if self.code_profiler == 'cprofile':
+            profile = cProfile.Profile()
+            profile.enable()
+        else:
+            try:
+                import pyinstrument
+            except ImportError as e:
+                raise ImportError("code_profiler='pyinstrument' needs pyinstrument: pip install pyinstrument") from e
+            profile = pyinstrument.Profiler()
+            profile.start()
+        self._active_profile = True
+        return profile
+
+    def _stop_code_profile(self, profile, name: str) -> Optional[str]:
+        """Stop a stage's code profiler and write its dump; returns the dump path."""
+        if profile is None:
+            return None
+        self._active_profile = False
+
+        directory = self.profile_dir or '.'
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"{len(self.stages):02d}_{name}")
+        if self.code_profiler == 'cprofile':
+            profile.disable()
+            path = base + '.prof'
+            profile.dump_stats(path)
+        else:
+            profile.stop()
+            path = base + '.html'
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(profile.output_html())
+        return path
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None):
+        """
+        Time the enclosed block as a stage. Yields the stage record; set record['rows_out']
+        (and any extra fields) inside the block.
+        """
+        record = {'stage': name, 'depth': self._depth, 'rows_in': rows_in, 'rows_out': None}
+        profile = self._start_code_profile()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        rss_start = current_rss_mb()
+        self._depth += 1
+        try:
+            yield record
+        finally:
+            self._depth -= 1
+            record['wall_s'] = round(time.perf_counter() - wall_start, 6)
+            record['cpu_s'] = round(time.process_time() - cpu_start, 6)
+            record['rss_start_mb'] = rss_start
+            record['rss_end_mb'] = current_rss_mb()
+            record['peak_rss_mb'] = peak_rss_mb()
+            record['profile_dump'] = self._stop_code_profile(profile, name)
+            self.stages.append(record)
+            logger.debug(f"Stage {name}: {record['wall_s']:.3f}s wall, {record['cpu_s']:.3f}s CPU")
+
+    def summary(self) -> Dict[str, Dict]:
+        """Totals per stage name (stages run once per batch in streaming mode)."""
+        totals = {}
+        for record in self.stages:
+            entry = totals.setdefault(record['stage'], {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                                                        'rows_in': 0, 'rows_out': 0})
+            entry['calls'] += 1
+            entry['wall_s'] += record['wall_s']
+            entry['cpu_s'] += record['cpu_s']
+            entry['rows_in'] += record['rows_in'] or 0
+            entry['rows_out'] += record['rows_out'] or 0
+        return totals
+
+    def report(self, **sections) -> Dict:
+        """The run report: stages, per-stage totals, process totals and any extra sections."""
+        return {
+            'version': REPORT_VERSION,
+            'started_at': self.started_at.isoformat(),
+            'wall_s': round(time.perf_counter() - self._wall_start, 6),
+            'cpu_s': round(time.process_time() - self._cpu_start, 6),
+            'peak_rss_mb': peak_rss_mb(),
+            'code_profiler': self.code_profiler,
+            'stages': self.stages,
+            'summary': self.summary(),
+            **sections,
+        }
+
+    def write_report(self, path: str, **sections) -> Dict:
+        """Write the run report as JSON (atomically) and return it."""
+        report = self.report(**sections)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, default=str)
+        os.replace(tmp_path, path)
+        logger.info(f"Run report written to {path}")
+        return report
+
+
+def profiled_stage(name: str, rows_in_attr: Optional[str] = 'merged_df'):
+    """
+    Record a processor method as a stage of self.profiler.
+
+    rows_in is the row count of the DataFrame arguments, or of the rows_in_attr attribute
+    when there are none (None for stages that read their input from disk); rows_out is
+    the row count of the return value (see count_rows).
+    """
+    def decorate(method):
+        def rows_in(self, args, kwargs):
+            frames = [value for value in list(args) + list(kwargs.values()) if isinstance(value, pd.DataFrame)]
+            if frames:
+                return sum(len(frame) for frame in frames)
+            source = getattr(self, rows_in_attr, None) if rows_in_attr else None
+            return len(source) if source is not None else None
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.profiler.stage(name, rows_in(self, args, kwargs)) as record:
+                    result = await method(self, *args, **kwargs)
+                    record['rows_out'] = count_rows(result)
+                return result
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.stage(name, rows_in(self, args, kwargs)) as record:
+                result = method(self, *args, **kwargs)
+                record['rows_out'] = count_rows(result)
+            return result
+        return wrapper
+
+    return decorate